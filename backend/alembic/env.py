@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from app.core.config import settings
 from app.core.database import Base
-from app.models import user, contact, leads, task  # import all models
+from app.models import user, contact, leads, task, pipeline, job  # import all models
 
 # Alembic Config
 config = context.config
@@ -0,0 +1,59 @@
+"""search vectors
+
+Revision ID: 0f8535b908ff
+Revises: 208bedef63d9
+Create Date: 2026-10-18 15:22:09.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0f8535b908ff'
+down_revision: Union[str, Sequence[str], None] = '208bedef63d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _document(*weighted: tuple) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('english', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted
+    )
+
+
+# Must match the Computed() expressions on the models
+DOCUMENTS = {
+    'contacts': _document(('name', 'A'), ('company', 'B'), ('notes', 'C')),
+    'leads': _document(('name', 'A'), ('notes', 'C')),
+    'tasks': _document(('head', 'A'), ('description', 'C')),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding a STORED generated column rewrites the table under an ACCESS
+    # EXCLUSIVE lock: schedule this for a maintenance window on large tables.
+    for table, document in DOCUMENTS.items():
+        op.add_column(table, sa.Column(
+            'search_vector', TSVECTOR(), sa.Computed(document, persisted=True), nullable=True))
+
+    with op.get_context().autocommit_block():
+        for table in DOCUMENTS:
+            op.create_index(f'idx_{table}_search_vector', table, ['search_vector'],
+                            postgresql_using='gin', postgresql_concurrently=True,
+                            if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in DOCUMENTS:
+            op.drop_index(f'idx_{table}_search_vector', table_name=table,
+                          postgresql_concurrently=True, if_exists=True)
+    for table in DOCUMENTS:
+        op.drop_column(table, 'search_vector')
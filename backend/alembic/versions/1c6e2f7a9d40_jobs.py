@@ -0,0 +1,54 @@
+"""jobs
+
+Revision ID: 1c6e2f7a9d40
+Revises: 0f8535b908ff
+Create Date: 2026-10-18 17:48:12.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c6e2f7a9d40'
+down_revision: Union[str, Sequence[str], None] = '0f8535b908ff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('jobs',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('type', sa.String(), nullable=False),
+        sa.Column('payload', postgresql.JSONB(), server_default=sa.text("'{}'::jsonb"),
+                  nullable=False),
+        sa.Column('priority', sa.SmallInteger(), server_default='0', nullable=False),
+        sa.Column('status', sa.String(), server_default='queued', nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('max_attempts', sa.Integer(), nullable=False),
+        sa.Column('run_at', sa.DateTime(timezone=True), server_default=sa.text('now()'),
+                  nullable=False),
+        sa.Column('locked_by', sa.String(), nullable=True),
+        sa.Column('locked_until', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'),
+                  nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_jobs_claim', 'jobs',
+                    ['type', sa.text('priority DESC'), 'run_at', 'id'],
+                    postgresql_where=sa.text("status IN ('queued', 'running')"))
+    op.create_index('idx_jobs_done_finished', 'jobs', ['finished_at'],
+                    postgresql_where=sa.text("status = 'done'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_jobs_done_finished', table_name='jobs')
+    op.drop_index('idx_jobs_claim', table_name='jobs')
+    op.drop_table('jobs')
@@ -0,0 +1,54 @@
+"""owner list indexes
+
+Revision ID: 208bedef63d9
+Revises: 27cd4733ff44
+Create Date: 2026-10-18 13:05:47.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '208bedef63d9'
+down_revision: Union[str, Sequence[str], None] = '27cd4733ff44'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Every list, count, export and bulk query filters on owner_id first; the
+# trailing id serves the default sort and keyset cursors after the filter.
+# Status filters on tasks use idx_tasks_owner_status_created.
+INDEXES = [
+    ('idx_contacts_owner_id', 'contacts', ['owner_id', 'id']),
+    ('idx_contacts_owner_created', 'contacts', ['owner_id', 'created_at', 'id']),
+    ('idx_contacts_owner_status', 'contacts', ['owner_id', 'status', 'id']),
+    ('idx_contacts_owner_source', 'contacts', ['owner_id', 'source', 'id']),
+    ('idx_leads_owner_id', 'leads', ['owner_id', 'id']),
+    ('idx_leads_owner_created', 'leads', ['owner_id', 'created_at', 'id']),
+    ('idx_leads_owner_status', 'leads', ['owner_id', 'status', 'id']),
+    ('idx_leads_owner_source', 'leads', ['owner_id', 'source', 'id']),
+    ('idx_tasks_owner_id', 'tasks', ['owner_id', 'id']),
+    ('idx_tasks_owner_assigned', 'tasks', ['owner_id', 'assigned_to', 'id']),
+    ('idx_tasks_owner_team', 'tasks', ['owner_id', 'team_id', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps writes flowing on large tables; each index commits on
+    # its own, and if_not_exists lets a rerun continue after an interruption.
+    # An interrupted build leaves an INVALID index that must be dropped by hand.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns,
+                            postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table,
+                          postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,133 @@
+"""pipeline counters
+
+Revision ID: 218843d8b3d9
+Revises: 2a950150f61e
+Create Date: 2026-10-18 10:12:31.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '218843d8b3d9'
+down_revision: Union[str, Sequence[str], None] = '2a950150f61e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (kind, bucket expression, extra row condition) per source table. The same
+# expressions are used by pipeline_service.reconcile; keep them in step.
+COUNTERS = {
+    "leads": [
+        ("lead_status", "coalesce(status, 'none')", None),
+        ("lead_source", "coalesce(source, 'none')", None),
+        ("lead_day", "to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD')",
+         "created_at IS NOT NULL"),
+    ],
+    "contacts": [
+        ("contact_status", "coalesce(status, 'none')", None),
+    ],
+}
+
+
+def _deltas(table: str, rows: str, sign: int) -> str:
+    selects = []
+    for kind, bucket, condition in COUNTERS[table]:
+        where = "owner_id IS NOT NULL" + (f" AND {condition}" if condition else "")
+        selects.append(
+            f"SELECT owner_id, '{kind}' AS kind, {bucket} AS bucket, {sign} AS delta "
+            f"FROM {rows} WHERE {where}"
+        )
+    return "\n            UNION ALL ".join(selects)
+
+
+def _apply(deltas: str) -> str:
+    # One upsert per statement, whatever the number of rows it touched.
+    # Buckets whose deltas cancel out (unchanged columns) are not written, and
+    # ORDER BY takes the counter row locks in a fixed order across writers.
+    return f"""
+        INSERT INTO pipeline_counters AS c (owner_id, kind, bucket, n)
+        SELECT owner_id, kind, bucket, sum(delta) FROM (
+            {deltas}
+        ) d
+        GROUP BY owner_id, kind, bucket
+        HAVING sum(delta) <> 0
+        ORDER BY owner_id, kind, bucket
+        ON CONFLICT (owner_id, kind, bucket) DO UPDATE SET n = c.n + excluded.n;"""
+
+
+def _trigger_function(table: str) -> str:
+    insert = _apply(_deltas(table, "new_rows", 1))
+    update = _apply(_deltas(table, "new_rows", 1) + "\n            UNION ALL "
+                    + _deltas(table, "old_rows", -1))
+    delete = _apply(_deltas(table, "old_rows", -1))
+    return f"""
+    CREATE FUNCTION pipeline_counters_{table}() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN{insert}
+        ELSIF TG_OP = 'UPDATE' THEN{update}
+        ELSE{delete}
+        END IF;
+        RETURN NULL;
+    END
+    $$"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('pipeline_counters',
+        sa.Column('owner_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(), nullable=False),
+        sa.Column('bucket', sa.String(), nullable=False),
+        sa.Column('n', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('owner_id', 'kind', 'bucket')
+    )
+
+    op.execute("""
+    CREATE FUNCTION pipeline_counters_truncate() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        DELETE FROM pipeline_counters WHERE kind = ANY(TG_ARGV);
+        RETURN NULL;
+    END
+    $$""")
+
+    # Statement-level triggers with transition tables, so bulk writes, COPY
+    # imports and the seeder cost one upsert per statement, not per row.
+    # A trigger with transition tables may only have one event, hence three.
+    for table, counters in COUNTERS.items():
+        op.execute(_trigger_function(table))
+        for event, referencing in (
+            ("INSERT", "NEW TABLE AS new_rows"),
+            ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("DELETE", "OLD TABLE AS old_rows"),
+        ):
+            op.execute(
+                f"CREATE TRIGGER {table}_pipeline_counters_{event.lower()} "
+                f"AFTER {event} ON {table} REFERENCING {referencing} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION pipeline_counters_{table}()"
+            )
+        kinds = ", ".join(f"'{kind}'" for kind, _, _ in counters)
+        op.execute(
+            f"CREATE TRIGGER {table}_pipeline_counters_truncate AFTER TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION pipeline_counters_truncate({kinds})"
+        )
+
+    # Backfill. CREATE TRIGGER locks out writers until this migration commits,
+    # so no row is counted twice or missed.
+    for table in COUNTERS:
+        op.execute(_apply(_deltas(table, table, 1)))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in COUNTERS:
+        for event in ("insert", "update", "delete", "truncate"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_pipeline_counters_{event} ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS pipeline_counters_{table}()")
+    op.execute("DROP FUNCTION IF EXISTS pipeline_counters_truncate()")
+    op.drop_table('pipeline_counters')
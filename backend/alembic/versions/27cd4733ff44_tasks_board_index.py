@@ -0,0 +1,34 @@
+"""tasks board index
+
+Revision ID: 27cd4733ff44
+Revises: 218843d8b3d9
+Create Date: 2026-10-18 11:40:05.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '27cd4733ff44'
+down_revision: Union[str, Sequence[str], None] = '218843d8b3d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside the migration transaction, but keeps
+    # task writes going while a large table is indexed
+    with op.get_context().autocommit_block():
+        op.create_index('idx_tasks_owner_status_created', 'tasks',
+                        ['owner_id', 'status', 'created_at'],
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_tasks_owner_status_created', table_name='tasks',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,92 @@
+"""cache generations
+
+Revision ID: 4b7d1e9c2a53
+Revises: 1c6e2f7a9d40
+Create Date: 2026-10-18 18:20:05.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7d1e9c2a53'
+down_revision: Union[str, Sequence[str], None] = '1c6e2f7a9d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ("contacts", "leads", "tasks")
+
+
+def _bump(owners: str) -> str:
+    # One upsert per statement; ORDER BY takes the row locks in a fixed order
+    return f"""
+        INSERT INTO cache_generations AS g (owner_id, generation)
+        SELECT DISTINCT owner_id, 1 FROM ({owners}) o
+        WHERE owner_id IS NOT NULL
+        ORDER BY owner_id
+        ON CONFLICT (owner_id) DO UPDATE SET generation = g.generation + 1;"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cache_generations',
+        sa.Column('owner_id', sa.Integer(), nullable=False),
+        sa.Column('generation', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('owner_id')
+    )
+
+    # An update bumps the old owner too, for rows reassigned away from them
+    insert = _bump("SELECT owner_id FROM new_rows")
+    update = _bump("SELECT owner_id FROM new_rows UNION SELECT owner_id FROM old_rows")
+    delete = _bump("SELECT owner_id FROM old_rows")
+    op.execute(f"""
+    CREATE FUNCTION cache_generations_bump() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN{insert}
+        ELSIF TG_OP = 'UPDATE' THEN{update}
+        ELSE{delete}
+        END IF;
+        RETURN NULL;
+    END
+    $$""")
+    op.execute("""
+    CREATE FUNCTION cache_generations_bump_all() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE cache_generations SET generation = generation + 1;
+        RETURN NULL;
+    END
+    $$""")
+
+    # Statement-level, as for pipeline_counters: a bulk write or an import
+    # costs one upsert, not one per row
+    for table in TABLES:
+        for event, referencing in (
+            ("INSERT", "NEW TABLE AS new_rows"),
+            ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("DELETE", "OLD TABLE AS old_rows"),
+        ):
+            op.execute(
+                f"CREATE TRIGGER {table}_cache_generations_{event.lower()} "
+                f"AFTER {event} ON {table} REFERENCING {referencing} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION cache_generations_bump()"
+            )
+        op.execute(
+            f"CREATE TRIGGER {table}_cache_generations_truncate AFTER TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION cache_generations_bump_all()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        for event in ("insert", "update", "delete", "truncate"):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_cache_generations_{event} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS cache_generations_bump()")
+    op.execute("DROP FUNCTION IF EXISTS cache_generations_bump_all()")
+    op.drop_table('cache_generations')
@@ -0,0 +1,88 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import models, schemas, services
+from app.core.database import engine, pool_status
+from app.core.deps import get_db
+from app.core.query_stats import query_inspector
+from app.core.rate_limit import auth_admission
+from app.core.replicas import replica_router
+from app.core.response_cache import response_cache
+from app.utils.email import dispatcher as email_dispatcher
+from app.core.security import require_roles
+
+
+router = APIRouter()
+
+
+@router.get("/pool")
+async def get_pool_status(
+    _: models.User = Depends(require_roles(["admin"]))
+):
+    """Connection pool usage and acquire-wait histogram for this worker."""
+    return pool_status(engine)
+
+
+@router.get("/replicas")
+async def get_replica_status(
+    _: models.User = Depends(require_roles(["admin"]))
+):
+    """Replica health, lag and read routing counters for this worker."""
+    return replica_router.status()
+
+
+@router.get("/auth-limits")
+async def get_auth_limit_status(
+    _: models.User = Depends(require_roles(["admin"]))
+):
+    """Login/register/password reset admission: in flight, admitted and rejected counters."""
+    return auth_admission.stats()
+
+
+@router.get("/email")
+async def get_email_status(
+    _: models.User = Depends(require_roles(["admin"]))
+):
+    """Pooled SMTP connections and sent/failed/reconnected counters."""
+    return email_dispatcher.stats()
+
+
+@router.get("/jobs")
+async def get_job_status(
+    db: AsyncSession = Depends(get_db),
+    _: models.User = Depends(require_roles(["admin"]))
+):
+    """Background jobs per type and status, and the age of the oldest due job."""
+    return await services.job_service.stats(db)
+
+
+@router.get("/response-cache")
+async def get_response_cache_status(
+    _: models.User = Depends(require_roles(["admin"]))
+):
+    """List response cache size, hit/miss counters and 304s for this worker."""
+    return {
+        "enabled": response_cache.enabled,
+        "not_modified": response_cache.not_modified,
+        **response_cache.backend.stats(),
+    }
+
+
+@router.get("/slow-queries")
+async def get_slow_queries(
+    _: models.User = Depends(require_roles(["admin"]))
+):
+    """Slow-query counters and the most recent sampled EXPLAIN ANALYZE plans."""
+    return query_inspector.status()
+
+
+@router.post("/pipeline-counters/reconcile", response_model=schemas.ReconcileReport)
+async def reconcile_pipeline_counters(
+    owner_id: Optional[int] = Query(None, description="only this owner's counters"),
+    dry_run: bool = Query(False, description="report drift without rebuilding"),
+    db: AsyncSession = Depends(get_db),
+    _: models.User = Depends(require_roles(["admin"]))
+):
+    """Recount dashboard counters from leads/contacts, report drift and fix it."""
+    return await services.pipeline_service.reconcile(db, owner_id, apply=not dry_run)
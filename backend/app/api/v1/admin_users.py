@@ -6,8 +6,10 @@ from sqlalchemy.dialects.postgresql import TSVECTOR
 from typing import List, Optional
 from sqlalchemy.future import select
 from app import models, schemas, services
-from app.core.deps import get_db
+from app.core.deps import get_db, get_read_db
 from app.core.security import require_roles
+from app.services.count_service import CountMode
+from app.utils.pagination import next_cursor
 import asyncio
 import logging
 logger = logging.getLogger(__name__)
@@ -19,38 +21,44 @@ router = APIRouter()
 async def get_all_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from a previous page; replaces skip"),
     role: Optional[str] = Query(None),
     sort_by: Optional[str] = Query("id"),
     sort_order: Optional[str] = Query("asc"),
     q: Optional[str] = Query(None, description="search by name or email"),
-    db: AsyncSession = Depends(get_db),
+    count: CountMode = Query(CountMode.exact, description="how total is computed"),
+    db: AsyncSession = Depends(get_read_db),
     _: models.User = Depends(require_roles(["admin"]))
 ):
     # Validate sort parameters
     allowed_sort_fields = {"id", "name", "email", "created_at", "role"}
     if sort_by not in allowed_sort_fields:
         raise HTTPException(status_code=400, detail="Invalid sort field")
-    
+    if cursor and q:
+        raise HTTPException(status_code=400, detail="cursor is not supported with q")
+    sort_order = "desc" if sort_order == "desc" else "asc"
+
     try:
-        # Run both queries concurrently using asyncio.gather
-        users_task, total_task = await asyncio.gather(
-            services.user_service.get_users_paginated(
-                db, skip, limit, role, sort_by, sort_order, q
-            ),
-            services.user_service.get_total_count_filtered(
-                db, role, q
-            ),
-            return_exceptions=True
+        # One AsyncSession cannot run statements concurrently, so the page and
+        # the total are fetched one after the other.
+        users = await services.user_service.get_users_paginated(
+            db, skip, limit, role, sort_by, sort_order, q, cursor
+        )
+        counted = await services.user_service.get_total_count_filtered(
+            db, role, q, count
         )
-        
-        # Handle any exceptions
-        if isinstance(users_task, Exception):
-            raise users_task
-        if isinstance(total_task, Exception):
-            raise total_task
-            
-        return {"total": total_task, "items": users_task}
-        
+
+        if q:
+            return {**counted, "items": users}
+        return {
+            **counted,
+            "items": users[:limit],
+            "next_cursor": next_cursor(users, limit, sort_by, sort_order),
+        }
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching users: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -60,7 +68,7 @@ async def get_all_users(
 @router.get("/{user_id}", response_model=schemas.UserSchema)
 async def get_user(
     user_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     _: models.User = Depends(require_roles(["admin"]))
 ):
     result = await db.execute(
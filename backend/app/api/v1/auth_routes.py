@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import EmailStr
 from app.core.deps import get_db
 from ...models import User
-from ...utils.email import send_reset_email
+from ...utils.email import RESET_EMAIL_JOB
+from ... import services
 import uuid
-from ...core.security import get_password_hashed
+from ...core.security import invalidate_user
+from ...core.hashing import password_hasher
+from ...core.rate_limit import auth_admission
 import asyncio
 
 
@@ -28,39 +31,48 @@ async def verify_email(token: str, db: AsyncSession = Depends(get_db)):
     user.verification_token = None
 
     await db.commit()
+    invalidate_user(user.email)
 
     return {"message": "Email verified successfully"}
 
 
 @router.post("/forgot_password")
-async def forgot_password(email: EmailStr, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalars().first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    token = str(uuid.uuid4())
-    user.password_reset_token = token
-    await db.commit()
-
-    # Fire and forget email ✅
-    asyncio.create_task(send_reset_email(user.email, token))
+async def forgot_password(email: EmailStr, request: Request, db: AsyncSession = Depends(get_db)):
+    async with auth_admission.admit(request, email, hashes=False):
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalars().first()
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+        token = str(uuid.uuid4())
+        user.password_reset_token = token
+        # Committed with the token, so the email goes out exactly when the token exists
+        await services.job_service.enqueue(db, RESET_EMAIL_JOB, {"to": user.email, "token": token})
+        await db.commit()
 
     return {"Message": "Reset email sent"}
 
 
 @router.post("/reset-password")
-async def reset_password(token: str, new_password: str, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(User).where(User.password_reset_token == token))
-    user = result.scalars().first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid token"
-        )
-    user.hashed_password = get_password_hashed(new_password)
-    user.password_reset_token = None
-    await db.commit()
+async def reset_password(
+    token: str,
+    new_password: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    # Keyed by IP only: the token is the guess a brute force varies
+    async with auth_admission.admit(request):
+        result = await db.execute(select(User).where(User.password_reset_token == token))
+        user = result.scalars().first()
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid token"
+            )
+        user.hashed_password = await password_hasher.hash(new_password)
+        user.password_reset_token = None
+        await db.commit()
+    invalidate_user(user.email)
     return {"message": "Password reset successful"}
@@ -1,18 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from app.core.deps import get_db
+from app.core.deps import get_db, get_read_db, get_read_sessionmaker
+from app.core.response_cache import response_cache
 from app import schemas, models, services
 from app.core.security import get_current_user
 from fastapi import Query
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
 from app.models.contact import Contact
 from sqlalchemy import desc, asc, func
 from datetime import datetime
+from app.services.count_service import CountMode, count_cache_key, count_rows
+from app.services.search_service import SearchMode, contact_filters
+from app.utils.pagination import apply_keyset, apply_sort, decode_cursor, next_cursor
+from app.utils.serialization import CONTACT_ROWS
 
 
 router = APIRouter()
 
+CONTACT_SORT_FIELDS = {"id", "name", "email", "phone", "company",
+                       "source", "status", "created_at"}
+
 
 @router.post("", response_model=schemas.contact.ContactOut)
 async def create_contact(
@@ -27,55 +36,158 @@ async def create_contact(
     return db_contact
 
 
+@router.post("/import", response_model=schemas.bulk.ImportReport)
+async def import_contacts(
+    file: UploadFile = File(..., description="CSV with a header row, or NDJSON"),
+    format: Optional[schemas.ImportFormat] = Query(
+        None, description="defaults from the file extension"),
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    fmt = format or services.import_service.guess_format(file.filename)
+    return await services.import_service.import_contacts(
+        db, file.file, fmt, current_user.id)
+
+
+@router.post("/bulk-update", response_model=schemas.BulkReport)
+async def bulk_update_contacts(
+    selection: schemas.bulk.ContactBulkUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return await services.bulk_service.bulk_update(
+        db, "contacts", current_user.id, selection)
+
+
+@router.post("/bulk-delete", response_model=schemas.BulkReport)
+async def bulk_delete_contacts(
+    selection: schemas.bulk.ContactBulkDelete,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return await services.bulk_service.bulk_delete(
+        db, "contacts", current_user.id, selection)
+
+
 @router.get("", response_model=schemas.contact.PaginatedContactOut)
 async def list_contacts(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from a previous page; replaces skip"),
     sort_by: Optional[str] = Query("id"),
     sort_order: Optional[str] = Query("asc"),
     status: Optional[str] = Query(None),
     source: Optional[str] = Query(None),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    q: Optional[str] = Query(None, description="full-text search query"),
-    db: AsyncSession = Depends(get_db),
+    q: Optional[str] = Query(None, description="search by name and email, or full text"),
+    search: SearchMode = Query(
+        SearchMode.trigram, description="trigram (fuzzy name/email) or fulltext "
+        "(ranked words over name, company and notes)"),
+    min_similarity: Optional[float] = Query(
+        None, ge=0, le=1, description="word similarity threshold for q (default 0.6)"),
+    count: CountMode = Query(CountMode.exact, description="how total is computed"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    # query = db.query(models.Contact).filter(models.Contact.owner_id == current_user.id)
-    query = select(models.Contact).where(
-        models.Contact.owner_id == current_user.id)
+    # Answer repeat polls (and If-None-Match) with one primary-key lookup
+    cached = await response_cache.lookup(request, db, current_user.id)
+    if cached is not None:
+        return cached
 
-    # Filter
-    if status:
-        query = query.where(models.Contact.status == status)
-    if source:
-        query = query.where(models.Contact.source == source)
-    if start_date and end_date:
-        query = query.where(
-            models.Contact.created_at.between(start_date, end_date))
+    filters = dict(status=status, source=source,
+                   start_date=start_date, end_date=end_date)
 
     # Global Search
     if q:
-        contacts = await services.user_service.search_contacts_fuzzy(db, q, skip, limit)
-        total = len(contacts)
-        return {"total": total, "items": contacts}
+        if cursor:
+            raise HTTPException(
+                status_code=400, detail="cursor is not supported with q")
+        if search == SearchMode.fulltext:
+            contacts, counted, highlights = await services.search_service.search_fulltext(
+                db, "contacts", current_user.id, q, skip, limit, count, **filters)
+            return await _cached_page(
+                request, {**counted, "items": contacts, "highlights": highlights})
+        contacts, counted = await services.search_service.search_contacts(
+            db, current_user.id, q, skip, limit, min_similarity, count, **filters)
+        return await _cached_page(request, {**counted, "items": contacts})
+
+    # Filter
+    # Plain columns: rows go straight to JSON without ORM hydration
+    query = select(*CONTACT_ROWS.columns).where(
+        *contact_filters(current_user.id, **filters))
 
     # Sorting
-    sort_column = getattr(models.Contact, sort_by, models.Contact.id)
-    query = query.order_by(
-        desc(sort_column)) if sort_order == "desc" else query.order_by(asc(sort_column))
+    if sort_by not in CONTACT_SORT_FIELDS:
+        sort_by = "id"
+    sort_order = "desc" if sort_order == "desc" else "asc"
+    sort_column = getattr(models.Contact, sort_by)
 
     # Get total count
-    count_query = select(func.count()).select_from(query)
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
+    counted = await count_rows(
+        db, query, count, count_cache_key("contacts", current_user.id, **filters))
+
+    # Keyset pagination when a cursor is given, offset otherwise
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_by, sort_order)
+        query = apply_keyset(query, sort_column, models.Contact.id,
+                             sort_order, value, last_id)
+    else:
+        query = query.offset(skip)
+    query = apply_sort(query, sort_column, models.Contact.id, sort_order)
+
+    # Fetch one extra row to know whether a next page exists
+    result = await db.execute(query.limit(limit + 1))
+    contacts = result.all()
 
-    # Get users
-    paginated_query = query.offset(skip).limit(limit)
-    result = await db.execute(paginated_query)
-    contacts = result.scalars().all()
+    return await _cached_page(request, {
+        **counted,
+        "items": contacts[:limit],
+        "next_cursor": next_cursor(contacts, limit, sort_by, sort_order),
+    })
 
-    return {"total": total, "items": contacts}
+
+async def _cached_page(request: Request, page: dict):
+    # Rows are encoded directly; response_model above only documents the shape
+    return await response_cache.store(request, CONTACT_ROWS.dumps_page(page))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_contacts(
+    format: schemas.ExportFormat = Query(schemas.ExportFormat.ndjson),
+    status: Optional[str] = Query(None),
+    source: Optional[str] = Query(None),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    sessionmaker=Depends(get_read_sessionmaker),
+    current_user: models.User = Depends(get_current_user)
+):
+    clauses = contact_filters(current_user.id, status=status, source=source,
+                              start_date=start_date, end_date=end_date)
+    return services.export_service.export_response(
+        "contacts", clauses, format, sessionmaker)
+
+
+@router.get("/duplicates", response_model=schemas.DuplicateReport)
+async def find_duplicate_contacts(
+    limit: int = Query(100, ge=1, le=1000, description="clusters returned, largest first"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return await services.dedup_service.find_duplicates(db, current_user.id, limit)
+
+
+@router.post("/merge", response_model=schemas.ContactMergeOut)
+async def merge_contacts(
+    merge: schemas.ContactMerge,
+    db: AsyncSession = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    contact, merged_ids = await services.dedup_service.merge_contacts(
+        db, current_user.id, merge.survivor_id, merge.duplicate_ids)
+    return {"contact": contact, "merged_ids": merged_ids}
 
 
 @router.put("/{contact_id}", response_model=schemas.ContactOut)
@@ -86,7 +198,8 @@ async def update_contact(
     current_user: models.User = Depends(get_current_user)
 ):
     result = await db.execute(select(models.Contact).where(
-        id=contact_id, owner_id=current_user.id))
+        models.Contact.id == contact_id,
+        models.Contact.owner_id == current_user.id))
 
     contact = result.scalar()
 
@@ -103,18 +216,20 @@ async def update_contact(
 
 
 @router.delete("/{contact_id}")
-def delete_contact(
+async def delete_contact(
     contact_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    contact = db.query(Contact).filter_by(
-        id=contact_id, owner_id=current_user.id).first()
+    result = await db.execute(select(models.Contact).where(
+        models.Contact.id == contact_id,
+        models.Contact.owner_id == current_user.id))
+    contact = result.scalar()
     if not contact:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Contact not found"
         )
-    db.delete(contact)
-    db.commit()
+    await db.delete(contact)
+    await db.commit()
     return {"detail": "Contact deleted"}
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession as Session
+from app.core.deps import get_read_db
+from app import models, schemas, services
+from app.core.security import get_current_user
+
+router = APIRouter()
+
+
+@router.get("/pipeline", response_model=schemas.PipelineDashboard)
+async def get_pipeline(
+    days: int = Query(90, ge=1, le=366, description="days of new_leads_per_day, ending today (UTC)"),
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return await services.pipeline_service.get_dashboard(db, current_user.id, days)
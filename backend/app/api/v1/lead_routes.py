@@ -1,28 +1,73 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession as Session
-from app.core.deps import get_db
+from app.core.deps import get_db, get_read_db, get_read_sessionmaker
+from app.core.response_cache import response_cache
 from app import models, schemas, services
 from app.core.security import get_current_user
 from typing import List, Optional
 from datetime import datetime
 from sqlalchemy import func, or_, desc, asc
+from sqlalchemy.future import select
+from fastapi.responses import StreamingResponse
+from app.services.count_service import CountMode, count_cache_key, count_rows
+from app.services.search_service import SearchMode, lead_filters
+from app.utils.pagination import apply_keyset, apply_sort, decode_cursor, next_cursor
+from app.utils.serialization import LEAD_ROWS
 
 router = APIRouter()
 
+LEAD_SORT_FIELDS = {"id", "name", "status", "source", "created_at"}
+
 
 @router.post("", response_model=schemas.lead.LeadOut)
-def create_lead(lead: schemas.lead.LeadCreate, db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)):
-    db_lead = models.Lead(**lead.dict(), owner_id=current_user.id)
-    db.add(db_lead)
-    db.commit()
-    db.refresh(db_lead)
-    return db_lead
+async def create_lead(
+    lead: schemas.lead.LeadCreate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return await services.lead_service.create_lead(db, current_user.id, lead)
+
+
+@router.post("/import", response_model=schemas.bulk.ImportReport)
+async def import_leads(
+    file: UploadFile = File(..., description="CSV with a header row, or NDJSON"),
+    format: Optional[schemas.ImportFormat] = Query(
+        None, description="defaults from the file extension"),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    fmt = format or services.import_service.guess_format(file.filename)
+    return await services.import_service.import_leads(
+        db, file.file, fmt, current_user.id)
+
+
+@router.post("/bulk-update", response_model=schemas.BulkReport)
+async def bulk_update_leads(
+    selection: schemas.bulk.LeadBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return await services.bulk_service.bulk_update(
+        db, "leads", current_user.id, selection)
+
+
+@router.post("/bulk-delete", response_model=schemas.BulkReport)
+async def bulk_delete_leads(
+    selection: schemas.bulk.LeadBulkDelete,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return await services.bulk_service.bulk_delete(
+        db, "leads", current_user.id, selection)
 
 
 @router.get("", response_model=schemas.lead.PaginatedLeadOut)
-def list_lead(
+async def list_lead(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from a previous page; replaces skip"),
     sort_by: Optional[str] = Query("id"),
     sort_order: Optional[str] = Query("asc"),
     status: Optional[str] = Query(None),
@@ -30,93 +75,139 @@ def list_lead(
     created_after: Optional[datetime] = Query(None),
     created_before: Optional[datetime] = Query(None),
     q: Optional[str] = Query(None, description="search by names and notes"),
-    db: Session = Depends(get_db),
+    search: SearchMode = Query(
+        SearchMode.trigram, description="trigram (fuzzy name/notes) or fulltext "
+        "(ranked words over name and notes)"),
+    min_similarity: Optional[float] = Query(
+        None, ge=0, le=1, description="word similarity threshold for q (default 0.6)"),
+    count: CountMode = Query(CountMode.exact, description="how total is computed"),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    query = db.query(models.Lead).filter(
-        models.Lead.owner_id == current_user.id)
+    # Answer repeat polls (and If-None-Match) with one primary-key lookup
+    cached = await response_cache.lookup(request, db, current_user.id)
+    if cached is not None:
+        return cached
 
-    # Filter
-    if status:
-        query = query.filter(models.Lead.status == status)
-    if source:
-        query = query.filter(models.Lead.source == source)
-    if created_after:
-        query = query.filter(models.Lead.created_at >= created_after)
-    if created_before:
-        created_before = created_before.replace(microsecond=0)
-        query = query.filter(
-            func.date(models.Lead.created_at) <= created_before.date())
+    filters = dict(status=status, source=source,
+                   created_after=created_after, created_before=created_before)
 
     # Global Search
     if q:
-        leads = services.user_service.search_leads_fuzzy(db, q, skip, limit)
-        total = len(leads)
-        return {"total": total, "items": leads}
+        if cursor:
+            raise HTTPException(
+                status_code=400, detail="cursor is not supported with q")
+        if search == SearchMode.fulltext:
+            leads, counted, highlights = await services.search_service.search_fulltext(
+                db, "leads", current_user.id, q, skip, limit, count, **filters)
+            return await _cached_page(
+                request, {**counted, "items": leads, "highlights": highlights})
+        leads, counted = await services.search_service.search_leads(
+            db, current_user.id, q, skip, limit, min_similarity, count, **filters)
+        return await _cached_page(request, {**counted, "items": leads})
+
+    # Filter
+    # Plain columns: rows go straight to JSON without ORM hydration
+    query = select(*LEAD_ROWS.columns).where(
+        *lead_filters(current_user.id, **filters))
 
     # Sorting
-    sort_column = getattr(models.Lead, sort_by, models.Lead.id)
-    query = query.order_by(
-        desc(sort_column)) if sort_order == "desc" else query.order_by(asc(sort_column))
+    if sort_by not in LEAD_SORT_FIELDS:
+        sort_by = "id"
+    sort_order = "desc" if sort_order == "desc" else "asc"
+    sort_column = getattr(models.Lead, sort_by)
 
     # Pagination
-    total = query.count()
-    leads = query.offset(skip).limit(limit).all()
+    counted = await count_rows(
+        db, query, count, count_cache_key("leads", current_user.id, **filters))
 
-    return {"total": total, "items": leads}
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_by, sort_order)
+        query = apply_keyset(query, sort_column, models.Lead.id,
+                             sort_order, value, last_id)
+    else:
+        query = query.offset(skip)
+    query = apply_sort(query, sort_column, models.Lead.id, sort_order)
+
+    result = await db.execute(query.limit(limit + 1))
+    leads = result.all()
+
+    return await _cached_page(request, {
+        **counted,
+        "items": leads[:limit],
+        "next_cursor": next_cursor(leads, limit, sort_by, sort_order),
+    })
+
+
+async def _cached_page(request: Request, page: dict):
+    # Rows are encoded directly; response_model above only documents the shape
+    return await response_cache.store(request, LEAD_ROWS.dumps_page(page))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_leads(
+    format: schemas.ExportFormat = Query(schemas.ExportFormat.ndjson),
+    status: Optional[str] = Query(None),
+    source: Optional[str] = Query(None),
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None),
+    sessionmaker=Depends(get_read_sessionmaker),
+    current_user: models.User = Depends(get_current_user)
+):
+    clauses = lead_filters(current_user.id, status=status, source=source,
+                           created_after=created_after, created_before=created_before)
+    return services.export_service.export_response(
+        "leads", clauses, format, sessionmaker)
 
 
 @router.get("/search", response_model=List[schemas.lead.LeadOut])
-def search_leads(
+async def search_leads(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1),
     name: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     source: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    query = db.query(models.Lead).filter(
-        models.Lead.owner_id == current_user.id)
-    if name:
-        query = query.filter(models.Lead.name.ilike(f"%{name}"))
-    if status:
-        query = query.filter(models.Lead.status == status)
-    if source:
-        query = query.filter(models.Lead.source.ilike(f"%{source}"))
-    return query.offset(skip).limit(limit).all()
+    return await services.lead_service.search_leads_by_name(
+        db, current_user.id, name, status, source, skip, limit)
+
+
+@router.get("/{lead_id}", response_model=schemas.lead.LeadOut)
+async def get_lead(
+    lead_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    lead = await services.lead_service.get_lead(db, current_user.id, lead_id)
+    if not lead:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Lead not found")
+    return lead
 
 
 @router.put("/{lead_id}", response_model=schemas.lead.LeadOut)
-def update_lead(
+async def update_lead(
     lead_id: int,
     updated_lead: schemas.lead.LeadUpdate,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    lead = db.query(models.Lead).filter_by(
-        id=lead_id, owner_id=current_user.id).first()
+    lead = await services.lead_service.update_lead(db, current_user.id, lead_id, updated_lead)
     if not lead:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Lead not found")
-    for key, value in updated_lead.dict(exclude_unset=True).items():
-        setattr(lead, key, value)
-        db.commit()
-        db.refresh(lead)
-        return lead
+    return lead
 
 
 @router.delete("/{lead_id}")
-def delete_lead(
+async def delete_lead(
     lead_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    lead = db.query(models.Lead).filter_by(
-        id=lead_id, owner_id=current_user.id).first()
-    if not lead:
+    if not await services.lead_service.delete_lead(db, current_user.id, lead_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Lead not found")
-    db.delete(lead)
-    db.commit()
     return {"detail": "Lead deleted"}
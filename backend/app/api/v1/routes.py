@@ -1,13 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from app.core.deps import get_db
+from app.core.rate_limit import auth_admission
 from app.models.user import User
 from app.schemas.user import UserSchema
 from typing import List
 from app import schemas, services, models
 from app.core.security import create_access_token, get_current_user
-from app.utils.email import send_verification_email
+from app.utils.email import VERIFICATION_EMAIL_JOB
 import asyncio
 
 
@@ -24,33 +25,43 @@ async def list_users(db: AsyncSession = Depends(get_db)):
 @router.post("/register", response_model=schemas.UserSchema)
 async def register_user(
     user_in: schemas.UserCreate,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
-    # Database operations (~100-200ms)
-    result = await db.execute(
-        select(models.user.User).where(models.user.User.email == user_in.email)
-    )
-    existing_user = result.scalar_one_or_none()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
+    async with auth_admission.admit(request, user_in.email):
+        # Database operations (~100-200ms)
+        result = await db.execute(
+            select(models.user.User).where(models.user.User.email == user_in.email)
         )
-
-    user = await services.user_service.create_user(db, user_in)
-    token = str(user.verification_token)
-
-    # Fire and forget email ✅
-    asyncio.create_task(send_verification_email(user.email, token))
+        existing_user = result.scalar_one_or_none()
+        if existing_user:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
+
+        user = await services.user_service.create_user(db, user_in)
+        token = str(user.verification_token)
+
+        # Sent by the job worker; the job survives restarts and retries on SMTP errors.
+        # One commit for the user and the job, so neither exists without the other
+        await services.job_service.enqueue(
+            db, VERIFICATION_EMAIL_JOB, {"to": user.email, "token": token})
+        await db.commit()
 
     # Return immediately
     return user
 
 
 @router.post("/login", response_model=schemas.Token)
-async def login(user_in: schemas.UserLogin, db: AsyncSession = Depends(get_db)):
-    user = await services.user_service.authenticate_user(
-        db, user_in.email, user_in.password)
+async def login(
+    user_in: schemas.UserLogin,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    async with auth_admission.admit(request, user_in.email):
+        user = await services.user_service.authenticate_user(
+            db, user_in.email, user_in.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
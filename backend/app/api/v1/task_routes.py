@@ -1,19 +1,165 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession as Session
-from app.core.deps import get_db
+from app.core.deps import get_db, get_read_db, get_read_sessionmaker
+from app.core.response_cache import response_cache
 from app import models, schemas, services
 from app.core.security import get_current_user
-from typing import List, Optional
-from datetime import datetime
-from sqlalchemy import func, or_, desc, asc
+from typing import Optional
+from fastapi.responses import StreamingResponse
+from app.services.count_service import CountMode
+from app.services.search_service import SearchMode, task_filters
+from app.utils.serialization import TASK_ROWS
 
 router = APIRouter()
 
 
 @router.post("", response_model=schemas.task.TaskOut)
-def create_task(task: schemas.task.TaskCreate, db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)):
-    db_task = models.Task(**task.dict(), owner_id=current_user.id)
-    db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
-    return db_task
+async def create_task(
+    task: schemas.task.TaskCreate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return await services.task_service.create_task(db, current_user.id, task)
+
+
+@router.post("/bulk-update", response_model=schemas.BulkReport)
+async def bulk_update_tasks(
+    selection: schemas.bulk.TaskBulkUpdate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return await services.bulk_service.bulk_update(
+        db, "tasks", current_user.id, selection)
+
+
+@router.post("/bulk-delete", response_model=schemas.BulkReport)
+async def bulk_delete_tasks(
+    selection: schemas.bulk.TaskBulkDelete,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    return await services.bulk_service.bulk_delete(
+        db, "tasks", current_user.id, selection)
+
+
+@router.get("", response_model=schemas.task.PaginatedTaskOut)
+async def list_tasks(
+    request: Request,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from a previous page; replaces skip"),
+    sort_by: Optional[str] = Query("id"),
+    sort_order: Optional[str] = Query("asc"),
+    status: Optional[schemas.TaskStatus] = Query(None),
+    assigned_to: Optional[int] = Query(None),
+    team_id: Optional[int] = Query(None),
+    q: Optional[str] = Query(None, description="search by head, or full text"),
+    search: SearchMode = Query(
+        SearchMode.trigram, description="trigram (fuzzy head) or fulltext "
+        "(ranked words over head and description)"),
+    min_similarity: Optional[float] = Query(
+        None, ge=0, le=1, description="word similarity threshold for q (default 0.6)"),
+    count: CountMode = Query(CountMode.exact, description="how total is computed"),
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    # Answer repeat polls (and If-None-Match) with one primary-key lookup
+    cached = await response_cache.lookup(request, db, current_user.id)
+    if cached is not None:
+        return cached
+
+    filters = dict(status=status.value if status else None,
+                   assigned_to=assigned_to, team_id=team_id)
+
+    if q:
+        if cursor:
+            raise HTTPException(
+                status_code=400, detail="cursor is not supported with q")
+        if search == SearchMode.fulltext:
+            tasks, counted, highlights = await services.search_service.search_fulltext(
+                db, "tasks", current_user.id, q, skip, limit, count, **filters)
+            page = {**counted, "items": tasks, "highlights": highlights}
+        else:
+            tasks, counted = await services.search_service.search_tasks(
+                db, current_user.id, q, skip, limit, min_similarity, count, **filters)
+            page = {**counted, "items": tasks}
+        return await response_cache.store(request, TASK_ROWS.dumps_page(page))
+
+    page = await services.task_service.list_tasks(
+        db, current_user.id, skip, limit, cursor, sort_by, sort_order, count, **filters)
+    return await response_cache.store(request, TASK_ROWS.dumps_page(page))
+
+
+@router.get("/board", response_model=schemas.task.TaskBoard)
+async def get_task_board(
+    request: Request,
+    per_column: int = Query(20, ge=1, le=100, description="newest tasks per status"),
+    assigned_to: Optional[int] = Query(None),
+    team_id: Optional[int] = Query(None),
+    count: CountMode = Query(
+        CountMode.exact, description="exact or capped; other modes count exactly"),
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    cached = await response_cache.lookup(request, db, current_user.id)
+    if cached is not None:
+        return cached
+
+    board = await services.task_service.get_board(
+        db, current_user.id, per_column, count, assigned_to=assigned_to, team_id=team_id)
+    return await response_cache.store(request, TASK_ROWS.dumps_grouped(board, "columns"))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+    format: schemas.ExportFormat = Query(schemas.ExportFormat.ndjson),
+    status: Optional[schemas.TaskStatus] = Query(None),
+    assigned_to: Optional[int] = Query(None),
+    team_id: Optional[int] = Query(None),
+    sessionmaker=Depends(get_read_sessionmaker),
+    current_user: models.User = Depends(get_current_user)
+):
+    clauses = task_filters(current_user.id, status=status.value if status else None,
+                           assigned_to=assigned_to, team_id=team_id)
+    return services.export_service.export_response(
+        "tasks", clauses, format, sessionmaker)
+
+
+@router.get("/{task_id}", response_model=schemas.task.TaskOut)
+async def get_task(
+    task_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    task = await services.task_service.get_task(db, current_user.id, task_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return task
+
+
+@router.put("/{task_id}", response_model=schemas.task.TaskOut)
+async def update_task(
+    task_id: int,
+    updated_task: schemas.task.TaskUpdate,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    task = await services.task_service.update_task(db, current_user.id, task_id, updated_task)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return task
+
+
+@router.delete("/{task_id}")
+async def delete_task(
+    task_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    if not await services.task_service.delete_task(db, current_user.id, task_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return {"detail": "Task deleted"}
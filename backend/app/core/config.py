@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 from dotenv import load_dotenv
 from pydantic import ConfigDict
 import os
@@ -21,6 +21,23 @@ class Settings(BaseSettings):
 
     ENVIRONMENT: str = ENVIRONMENT
 
+    # Connection pool (per uvicorn worker: workers * (size + overflow) must
+    # stay below the server's max_connections)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARM: int = 2
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+
+    # Read replicas (JSON list in .env); GET handlers read from them
+    DATABASE_REPLICA_URLS: List[str] = []
+    REPLICA_MAX_LAG_SECONDS: float = 5
+    REPLICA_CHECK_INTERVAL_SECONDS: float = 2
+    READ_YOUR_WRITES_SECONDS: float = 10
+
     # Security settings
     ALLOWED_HOSTS: List[str] = ["localhost", "127.0.0.1","*"]
     ALLOWED_ORIGINS: List[str] = [
@@ -44,6 +61,82 @@ class Settings(BaseSettings):
     ALGORITHM: str = ALGORITHM
     ACCESS_TOKEN_EXPIRE_MINUTES: int = ACCESS_TOKEN_EXPIRE_MINUTES
 
+    # Authenticated user cache (per worker process)
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 60
+
+    # Password hashing pool: "thread", "process" ("inline" only for benchmarks)
+    PASSWORD_HASH_POOL: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    # Login/register/password reset admission (per worker process, see app/core/rate_limit.py)
+    AUTH_RATE_LIMIT_ENABLED: bool = True
+    AUTH_IP_RATE_PER_MINUTE: float = 30
+    AUTH_IP_BURST: int = 10
+    AUTH_EMAIL_RATE_PER_MINUTE: float = 5
+    AUTH_EMAIL_BURST: int = 5
+    AUTH_RATE_LIMIT_MAX_KEYS: int = 100000
+    # Over these they get a 503 before any bcrypt work: routes in flight at once,
+    # and bcrypt CPU time as a share of one core (burst in CPU seconds)
+    AUTH_MAX_CONCURRENT: int = 4
+    AUTH_HASH_CPU_SHARE: float = 0.25
+    AUTH_HASH_CPU_BURST_SECONDS: float = 2.0
+
+    # Paginated totals (see app/services/count_service.py)
+    COUNT_CAP: int = 10000
+    COUNT_CACHE_SIZE: int = 10000
+    COUNT_CACHE_TTL_SECONDS: float = 15
+
+    # SQL instrumentation: slow-query log, sampled EXPLAIN (ANALYZE, BUFFERS) capture
+    SQL_SERVER_TIMING: bool = True
+    SQL_SLOW_QUERY_MS: float = 200
+    SQL_EXPLAIN_SAMPLE_RATE: float = 0.0
+    SQL_EXPLAIN_RING_SIZE: int = 50
+
+    # Prometheus /metrics; when a token is set, scrapers must send it as a Bearer token
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: Optional[str] = None
+
+    # ETag response cache for list endpoints
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_MAX_ENTRIES: int = 5000
+    RESPONSE_CACHE_TTL_SECONDS: float = 300
+
+    # Bulk import
+    IMPORT_BATCH_SIZE: int = 5000
+    IMPORT_MAX_REPORTED_ERRORS: int = 1000
+
+    # Bulk update/delete: ids per UPDATE/DELETE statement (each chunk commits)
+    BULK_CHUNK_SIZE: int = 1000
+    BULK_MAX_IDS: int = 50000
+    BULK_MAX_REPORTED_IDS: int = 1000
+
+    # Streaming export: rows fetched from the server-side cursor per chunk
+    EXPORT_CHUNK_ROWS: int = 2000
+
+    # Contact deduplication (see app/services/dedup_service.py)
+    DEDUP_NAME_SIMILARITY: float = 0.6
+    DEDUP_MAX_BLOCK_SIZE: int = 500
+    DEDUP_DEFAULT_COUNTRY_CODE: str = "1"
+    DEDUP_MAX_MERGE_IDS: int = 100
+
+    # Background jobs (app/services/job_service.py, run by python -m app.worker)
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BACKOFF_SECONDS: float = 5
+    JOB_RETRY_BACKOFF_MAX_SECONDS: float = 3600
+    JOB_TIMEOUT_SECONDS: float = 300
+    JOB_VISIBILITY_TIMEOUT_SECONDS: float = 60
+    JOB_WORKER_CONCURRENCY: int = 16
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_RETENTION_HOURS: float = 72
+    JOB_DRAIN_TIMEOUT_SECONDS: float = 30
+
+    # Outbound email dispatcher (SMTP_* connection settings are read in app/utils/email.py)
+    EMAIL_POOL_SIZE: int = 2
+    EMAIL_SEND_TIMEOUT: float = 30
+    EMAIL_DRAIN_TIMEOUT: float = 10
+
     # Use model_config instead of class Config
     model_config = ConfigDict(
         env_file=".env",
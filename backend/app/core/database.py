@@ -1,14 +1,73 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import asyncio
+import time
+
+from sqlalchemy import text, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.metrics import Histogram
+from app.core.query_stats import instrument_engine
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_async_engine(
-    SQLALCHEMY_DATABASE_URL,
-    echo=False,   
-    future=True
-)
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = Histogram()
+        self.timeouts = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.wait_histogram.observe(time.perf_counter() - start)
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep the collected metrics
+        pool = super().recreate()
+        pool.wait_histogram = self.wait_histogram
+        pool.timeouts = self.timeouts
+        return pool
+
+
+def build_engine(url: str) -> AsyncEngine:
+    """Create an async engine with the pool settings from Settings."""
+    url = make_url(url)
+    options = dict(echo=False, future=True)
+
+    # SQLite (tests, local runs) keeps SQLAlchemy's own pool choice
+    if url.get_backend_name() != "sqlite":
+        options.update(
+            poolclass=InstrumentedPool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+    if url.get_driver_name() == "asyncpg":
+        # SQLAlchemy's prepared statement cache and asyncpg's own cache;
+        # set both to 0 behind pgbouncer in transaction mode.
+        url = url.update_query_dict({
+            "prepared_statement_cache_size": str(settings.DB_PREPARED_STATEMENT_CACHE_SIZE)
+        })
+        options["connect_args"] = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+
+    db_engine = create_async_engine(url, **options)
+    instrument_engine(db_engine)
+    return db_engine
+
+
+engine = build_engine(SQLALCHEMY_DATABASE_URL)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -18,5 +77,30 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
 )
 
+
+async def warm_pool(db_engine: AsyncEngine, connections: int) -> None:
+    """Open `connections` pooled connections up front so first requests don't pay for it."""
+    async def touch():
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(touch() for _ in range(connections)))
+
+
+def pool_status(db_engine: AsyncEngine) -> dict:
+    pool = db_engine.pool
+    if not isinstance(pool, InstrumentedPool):
+        return {"pool": pool.status()}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "timeouts": pool.timeouts,
+        "acquire_wait_seconds": pool.wait_histogram.snapshot(),
+    }
+
+
 class Base(DeclarativeBase):
     pass
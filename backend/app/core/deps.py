@@ -1,5 +1,48 @@
+import time
+from typing import Optional
+
+from fastapi import Request
+from jose import JWTError, jwt
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from app.core.database import AsyncSessionLocal
+from app.core.replicas import LAST_WRITE_COOKIE, replica_router
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_commit(session):
+    session.info["committed"] = True
+
+
+def _token_subject(request: Request) -> Optional[str]:
+    # Only used to pick a database; get_current_user still verifies the token
+    authorization = request.headers.get("Authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return jwt.get_unverified_claims(token).get("sub")
+    except JWTError:
+        return None
+
 
-async def get_db():
+async def get_db(request: Request):
     async with AsyncSessionLocal() as session:
         yield session
+        if session.info.get("committed"):
+            replica_router.mark_write(_token_subject(request))
+            # Runs before the response is sent; ReadYourWritesMiddleware
+            # turns it into the LAST_WRITE_COOKIE cookie
+            request.state.last_write_at = time.time()
+
+
+def get_read_sessionmaker(request: Request):
+    """Session factory for read-only work: a replica when one is usable."""
+    return replica_router.choose(
+        _token_subject(request), request.cookies.get(LAST_WRITE_COOKIE)) or AsyncSessionLocal
+
+
+async def get_read_db(request: Request):
+    """Session for read-only handlers; never commit through it."""
+    async with get_read_sessionmaker(request)() as session:
+        yield session
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+# Module level so they can be pickled into a process pool
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _timed(fn, *args):
+    """fn(*args) and the CPU seconds it took on the thread that ran it."""
+    start = time.thread_time()
+    result = fn(*args)
+    return result, time.thread_time() - start
+
+
+class PasswordHasher:
+    """Runs bcrypt in a bounded worker pool so it never blocks the event loop.
+
+    At most `workers + max_queue` calls may be pending at once; anything beyond
+    that is rejected straight away with a 503 instead of piling up latency for
+    every request on the worker. kind="inline" hashes on the event loop and
+    only exists for benchmarking against the old behaviour.
+
+    `cost` is a moving average of the CPU seconds one call takes, for
+    admission control (app/core/rate_limit.py) to budget bcrypt time.
+    """
+
+    def __init__(self, kind: str = "thread", workers: int = 4, max_queue: int = 64):
+        if kind not in ("thread", "process", "inline"):
+            raise ValueError(f"Unknown password hash pool kind: {kind}")
+        self.kind = kind
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Executor | None = None
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.cost: float | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, fn, *args):
+        if self.kind == "inline":
+            return self._record(*_timed(fn, *args))
+
+        if self._pending >= self.workers + self.max_queue:
+            self.rejected += 1
+            logger.warning("Password hashing queue saturated (%s pending)", self._pending)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please retry shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, cpu = await loop.run_in_executor(self._get_executor(), _timed, fn, *args)
+            return self._record(result, cpu)
+        finally:
+            self._pending -= 1
+
+    def _record(self, result, cpu: float):
+        self.completed += 1
+        self.cost = cpu if self.cost is None else 0.9 * self.cost + 0.1 * cpu
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(_verify, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "cost_seconds": self.cost,
+        }
+
+
+password_hasher = PasswordHasher(
+    kind=settings.PASSWORD_HASH_POOL,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
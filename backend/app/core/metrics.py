@@ -0,0 +1,148 @@
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Seconds; suits both pool waits and request latencies
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                   0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Bytes; response bodies from tiny JSON to large exports
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class Histogram:
+    """Fixed-bucket histogram in the Prometheus style (cumulative on export)."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        cumulative, running = {}, 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            cumulative[str(bound)] = running
+        cumulative["+Inf"] = self.count
+        return {"buckets": cumulative, "sum": self.sum, "count": self.count}
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: Tuple[str, ...], values: Tuple) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def render_histogram(name: str, labels: str, histogram: Histogram) -> List[str]:
+    """Prometheus sample lines for one histogram; `labels` is "" or "{...}"."""
+    inner = labels[1:-1] + "," if labels else ""
+    lines, running = [], 0
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        running += count
+        lines.append(f'{name}_bucket{{{inner}le="{bound}"}} {running}')
+    lines.append(f'{name}_bucket{{{inner}le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_sum{labels} {histogram.sum}")
+    lines.append(f"{name}_count{labels} {histogram.count}")
+    return lines
+
+
+class _Family:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class LabeledHistogram(_Family):
+    """Histogram family; children are created on first use of a label tuple."""
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self.children: Dict[Tuple, Histogram] = {}
+
+    def labels(self, *values) -> Histogram:
+        child = self.children.get(values)
+        if child is None:
+            child = self.children[values] = Histogram(self.buckets)
+        return child
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for values, child in sorted(self.children.items()):
+            lines.extend(render_histogram(
+                self.name, format_labels(self.labelnames, values), child))
+        return lines
+
+
+class LabeledCounter(_Family):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Tuple, float] = {}
+
+    def inc(self, values: Tuple = (), amount: float = 1) -> None:
+        self.values[values] = self.values.get(values, 0) + amount
+
+    def render(self) -> List[str]:
+        return self.header() + [
+            f"{self.name}{format_labels(self.labelnames, values)} {value}"
+            for values, value in sorted(self.values.items())
+        ]
+
+
+class LabeledGauge(LabeledCounter):
+    kind = "gauge"
+
+    def set(self, values: Tuple, value: float) -> None:
+        self.values[values] = value
+
+    def dec(self, values: Tuple = (), amount: float = 1) -> None:
+        self.values[values] = self.values.get(values, 0) - amount
+
+
+class Registry:
+    """Metric families plus callbacks that render point-in-time state."""
+
+    def __init__(self):
+        self.families: List[_Family] = []
+        self.collectors: List[Callable[[], List[str]]] = []
+
+    def register(self, family: _Family) -> _Family:
+        self.families.append(family)
+        return family
+
+    def add_collector(self, collector: Callable[[], List[str]]) -> None:
+        self.collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for family in self.families:
+            lines.extend(family.render())
+        for collector in self.collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+def gauge_lines(name: str, documentation: str, value: float, kind: str = "gauge") -> List[str]:
+    """HELP/TYPE header and sample for an unlabeled value read by a collector."""
+    return [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}", f"{name} {value}"]
+
+
+registry = Registry()
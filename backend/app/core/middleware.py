@@ -0,0 +1,138 @@
+import time
+
+from app.core.metrics import LabeledGauge, LabeledHistogram, SIZE_BUCKETS, registry
+from app.core.query_stats import RequestQueryStats, current_stats
+
+REQUEST_LATENCY = registry.register(LabeledHistogram(
+    "http_request_duration_seconds", "Request latency by route template and status.",
+    ("method", "route", "status")))
+RESPONSE_SIZE = registry.register(LabeledHistogram(
+    "http_response_size_bytes", "Response body size by route template and status.",
+    ("method", "route", "status"), buckets=SIZE_BUCKETS))
+IN_FLIGHT = registry.register(LabeledGauge(
+    "http_requests_in_flight", "Requests currently being handled.", ("method",)))
+DB_QUERIES = registry.register(LabeledHistogram(
+    "http_request_db_queries", "SQL statements issued per request.",
+    ("method", "route"), buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)))
+DB_TIME = registry.register(LabeledHistogram(
+    "http_request_db_seconds", "Time spent in SQL statements per request.",
+    ("method", "route")))
+
+# Paths no route matched (404s, scanners) share one label value
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording latency, size and in-flight requests.
+
+    Labels use the matched route template (FastAPI puts the route in the
+    scope while routing), never the raw path, so cardinality stays bounded
+    by the number of endpoints. Being plain ASGI it adds no extra task or
+    response wrapping; see bench/bench_metrics_overhead.py for its cost.
+    """
+
+    def __init__(self, app, exclude_paths=("/metrics",)):
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+        # (method, route, status) -> (latency, size): one lookup per request
+        self._children = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_flight = IN_FLIGHT.values
+        in_flight[(method,)] = in_flight.get((method,), 0) + 1
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            else:
+                status = message.get("status", status)
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_flight[(method,)] -= 1
+            route = scope.get("route")
+            key = (method, route.path if route is not None else UNMATCHED_ROUTE, status)
+            children = self._children.get(key)
+            if children is None:
+                children = self._children[key] = (
+                    REQUEST_LATENCY.labels(*key), RESPONSE_SIZE.labels(*key))
+            children[0].observe(elapsed)
+            children[1].observe(size)
+
+
+class QueryStatsMiddleware:
+    """Count SQL statements and DB time per request (see app/core/query_stats.py).
+
+    The totals go into the per-route query histograms and, when
+    `server_timing` is on, into a `Server-Timing: db;dur=..;desc="N queries"`
+    header. Statements issued after the response has started (streamed
+    exports) are only counted in the histograms.
+    """
+
+    def __init__(self, app, server_timing: bool = True):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = current_stats.set(stats)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and self.server_timing:
+                timing = f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries"'
+                message = {**message, "headers": [
+                    *message.get("headers", []), (b"server-timing", timing.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_stats.reset(token)
+            route = scope.get("route")
+            labels = (scope["method"], route.path if route is not None else UNMATCHED_ROUTE)
+            DB_QUERIES.labels(*labels).observe(stats.count)
+            DB_TIME.labels(*labels).observe(stats.seconds)
+
+
+class ReadYourWritesMiddleware:
+    """Send the LAST_WRITE_COOKIE cookie on responses to requests that committed.
+
+    get_db records the commit time in the request state; get_read_db reads
+    the cookie back to keep that client on the primary (app/core/replicas.py).
+    """
+
+    def __init__(self, app, router):
+        self.app = app
+        self.router = router
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                written_at = scope.get("state", {}).get("last_write_at")
+                cookie = self.router.last_write_cookie(written_at) if written_at else ""
+                if cookie:
+                    message = {**message, "headers": [
+                        *message.get("headers", []), (b"set-cookie", cookie.encode())]}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Marks the connection used for EXPLAIN capture so its statements are not counted
+EXPLAIN_OPTION = "query_stats_explain"
+
+
+class RequestQueryStats:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+# Set per request by QueryStatsMiddleware; None outside requests
+current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "current_query_stats", default=None)
+
+
+class QueryInspector:
+    """Slow-query log and a bounded ring of sampled EXPLAIN (ANALYZE, BUFFERS) plans.
+
+    Statements slower than `slow_ms` are logged. A `sample_rate` share of
+    the slow SELECTs is re-run under EXPLAIN ANALYZE on a separate pooled
+    connection inside a rolled-back transaction, in the background and at
+    most one at a time, so capturing never blocks or changes the request.
+    """
+
+    def __init__(self, slow_ms: float, sample_rate: float, ring_size: int):
+        self.slow_seconds = slow_ms / 1000
+        self.sample_rate = sample_rate
+        self.plans = deque(maxlen=ring_size)
+        self.slow_queries = 0
+        self.skipped = 0
+        self._capturing = False
+        self._tasks = set()
+
+    def observe(self, engine: AsyncEngine, statement: str, parameters, elapsed: float) -> None:
+        if elapsed < self.slow_seconds:
+            return
+        self.slow_queries += 1
+        compact = " ".join(statement.split())[:1000]
+        logger.warning(f"Slow query ({elapsed * 1000:.1f} ms): {compact}")
+
+        if not self.sample_rate or random.random() >= self.sample_rate:
+            return
+        if engine.dialect.name != "postgresql":
+            return
+        # EXPLAIN ANALYZE executes the statement, so only plain reads are re-run
+        upper = statement.lstrip().upper()
+        if not upper.startswith("SELECT") or "FOR UPDATE" in upper:
+            return
+        if self._capturing:
+            self.skipped += 1
+            return
+        self._capturing = True
+        task = asyncio.get_running_loop().create_task(
+            self._capture(engine, statement, parameters, elapsed))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _capture(self, engine: AsyncEngine, statement: str, parameters, elapsed: float):
+        try:
+            async with engine.connect() as conn:
+                conn = await conn.execution_options(**{EXPLAIN_OPTION: True})
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}",
+                    tuple(parameters) if parameters else ())
+                plan = result.scalar()
+                await conn.rollback()
+            self.plans.append({
+                "captured_at": datetime.now(timezone.utc).isoformat(),
+                "duration_ms": round(elapsed * 1000, 2),
+                "statement": statement,
+                "plan": plan[0] if isinstance(plan, list) else plan,
+            })
+        except Exception as e:
+            logger.warning(f"Could not capture EXPLAIN for slow query: {e}")
+        finally:
+            self._capturing = False
+
+    def status(self) -> dict:
+        return {
+            "slow_query_ms": self.slow_seconds * 1000,
+            "explain_sample_rate": self.sample_rate,
+            "slow_queries": self.slow_queries,
+            "captures_skipped": self.skipped,
+            "plans": list(reversed(self.plans)),
+        }
+
+
+query_inspector = QueryInspector(
+    slow_ms=settings.SQL_SLOW_QUERY_MS,
+    sample_rate=settings.SQL_EXPLAIN_SAMPLE_RATE,
+    ring_size=settings.SQL_EXPLAIN_RING_SIZE,
+)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Count statements and DB time per request and feed the slow-query log."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        if context.execution_options.get(EXPLAIN_OPTION):
+            return
+        elapsed = time.perf_counter() - context._query_started
+        stats = current_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+        query_inspector.observe(engine, statement, parameters, elapsed)
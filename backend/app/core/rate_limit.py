@@ -0,0 +1,156 @@
+import math
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+from app.core.hashing import password_hasher
+
+# CPU seconds assumed per bcrypt call until the hasher has measured one
+# (bcrypt at cost 12 on a current server core)
+DEFAULT_HASH_COST = 0.3
+
+
+class TokenBucketLimiter:
+    """Token buckets per key: `burst` requests at once, refilled at `rate_per_minute`.
+
+    Buckets are refilled lazily when their key is seen. At most `max_keys`
+    are kept, least recently used evicted first; an evicted key starts
+    again with a full bucket, which is where it would be after idling.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int, max_keys: int):
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self.max_keys = max_keys
+        # key -> (tokens, refilled at)
+        self._buckets: OrderedDict = OrderedDict()
+
+    def acquire(self, key: str, cost: float = 1) -> float:
+        """Take `cost` tokens for `key`: 0.0 when allowed, else seconds until there are enough."""
+        cost = min(cost, self.burst)
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = self.burst
+        else:
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            self._buckets.move_to_end(key)
+        if tokens < cost:
+            self._buckets[key] = (tokens, now)
+            return (cost - tokens) / self.rate if self.rate else math.inf
+        self._buckets[key] = (tokens - cost, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return 0.0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class AuthAdmission:
+    """Admission control for the routes that hash passwords or send email.
+
+    Each request takes a token from its client IP's bucket and, when it
+    names one, its email's bucket; an empty bucket answers 429. Requests
+    that run bcrypt also draw their expected CPU time (the hasher's
+    measured cost) from one bucket refilled at `hash_cpu_share` cores, and
+    count against `max_concurrent` of these routes in flight; running out
+    of either answers 503. All of it is decided before any database or
+    bcrypt work, so a credential-stuffing wave or a signup bot costs little
+    more than the rejection and leaves the rest of the CPU to other routes.
+    Limits are per worker process.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        ip_rate_per_minute: float,
+        ip_burst: int,
+        email_rate_per_minute: float,
+        email_burst: int,
+        max_keys: int,
+        max_concurrent: int,
+        hash_cpu_share: float,
+        hash_cpu_burst: float
+    ):
+        self.enabled = enabled
+        self.by_ip = TokenBucketLimiter(ip_rate_per_minute, ip_burst, max_keys)
+        self.by_email = TokenBucketLimiter(email_rate_per_minute, email_burst, max_keys)
+        # One key: CPU seconds of bcrypt, refilled at hash_cpu_share seconds per second
+        self.hash_cpu = TokenBucketLimiter(hash_cpu_share * 60, hash_cpu_burst, 1)
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = {"ip": 0, "email": 0, "busy": 0, "cpu": 0}
+
+    def _reject(self, reason: str, retry_after: float, code: int, detail: str):
+        self.rejected[reason] += 1
+        raise HTTPException(
+            status_code=code,
+            detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+    @asynccontextmanager
+    async def admit(self, request: Request, email: Optional[str] = None, hashes: bool = True):
+        """Hold an admission slot for the body of the `async with` block, or raise.
+
+        Pass hashes=False for routes that do no bcrypt work (they are only
+        rate limited).
+        """
+        if not self.enabled:
+            yield
+            return
+        client = request.client.host if request.client else "unknown"
+        wait = self.by_ip.acquire(client)
+        if wait:
+            self._reject("ip", wait, status.HTTP_429_TOO_MANY_REQUESTS,
+                         "Too many attempts, please retry later")
+        if email:
+            wait = self.by_email.acquire(email.strip().lower())
+            if wait:
+                self._reject("email", wait, status.HTTP_429_TOO_MANY_REQUESTS,
+                             "Too many attempts, please retry later")
+        if hashes:
+            if self.in_flight >= self.max_concurrent:
+                self._reject("busy", 1, status.HTTP_503_SERVICE_UNAVAILABLE,
+                             "Server is busy, please retry shortly")
+            wait = self.hash_cpu.acquire("", password_hasher.cost or DEFAULT_HASH_COST)
+            if wait:
+                self._reject("cpu", wait, status.HTTP_503_SERVICE_UNAVAILABLE,
+                             "Server is busy, please retry shortly")
+
+        self.in_flight += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "in_flight": self.in_flight,
+            "max_concurrent": self.max_concurrent,
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "tracked_ips": len(self.by_ip),
+            "tracked_emails": len(self.by_email),
+        }
+
+
+auth_admission = AuthAdmission(
+    enabled=settings.AUTH_RATE_LIMIT_ENABLED,
+    ip_rate_per_minute=settings.AUTH_IP_RATE_PER_MINUTE,
+    ip_burst=settings.AUTH_IP_BURST,
+    email_rate_per_minute=settings.AUTH_EMAIL_RATE_PER_MINUTE,
+    email_burst=settings.AUTH_EMAIL_BURST,
+    max_keys=settings.AUTH_RATE_LIMIT_MAX_KEYS,
+    max_concurrent=settings.AUTH_MAX_CONCURRENT,
+    hash_cpu_share=settings.AUTH_HASH_CPU_SHARE,
+    hash_cpu_burst=settings.AUTH_HASH_CPU_BURST_SECONDS,
+)
@@ -0,0 +1,52 @@
+# app/core/reconcile.py
+"""Rebuild the dashboard's pipeline_counters from leads/contacts and report drift.
+
+    python -m app.core.reconcile               # check and fix every owner
+    python -m app.core.reconcile --dry-run     # check only, exit 1 on drift
+    python -m app.core.reconcile --owner-id 42
+
+The triggers keep the counters exact, so drift means something bypassed
+them (triggers disabled for a restore, rows edited with
+session_replication_role = replica, a bug). Run it from cron after such
+maintenance, or nightly with --dry-run to alert on drift.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from app.core.database import AsyncSessionLocal, engine
+from app.services import pipeline_service
+
+logger = logging.getLogger(__name__)
+
+
+async def run(owner_id, dry_run: bool, max_reported: int) -> int:
+    async with AsyncSessionLocal() as db:
+        report = await pipeline_service.reconcile(
+            db, owner_id, apply=not dry_run, max_reported=max_reported)
+    await engine.dispose()
+
+    for row in report["drift"]:
+        logger.info(f"owner {row['owner_id']} {row['kind']}={row['bucket']}: "
+                    f"stored {row['stored']}, actual {row['actual']}")
+    more = " (list truncated)" if report["drift_truncated"] else ""
+    action = "rebuilt" if report["applied"] else "not changed"
+    logger.info(f"{report['drift_rows']} drifted counters{more}; counters {action}")
+    return 1 if dry_run and report["drift_rows"] else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--owner-id", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true",
+                        help="report drift only; exit status 1 when there is any")
+    parser.add_argument("--max-reported", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sys.exit(asyncio.run(run(args.owner_id, args.dry_run, args.max_reported)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import asyncio
+import logging
+import math
+import time
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+
+from app.core.config import settings
+from app.core.database import build_engine, pool_status
+from app.utils.cache import LRUTTLCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds the standby is behind; 0 on a primary or on engines without replication.
+# With everything received replayed it is caught up, however long ago the last
+# transaction was: on an idle primary the replay timestamp stops moving.
+LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+        END
+""")
+
+# Set on responses to requests that committed a write: the wall-clock time
+# of the commit, which routes that client's reads to the primary for a while
+LAST_WRITE_COOKIE = "last_write_at"
+
+
+class Replica:
+    def __init__(self, url: str):
+        self.engine = build_engine(url)
+        self.sessionmaker = async_sessionmaker(
+            bind=self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+        self.name = self.engine.url.render_as_string(hide_password=True)
+        self.healthy = True
+        self.lag: Optional[float] = None
+
+    async def check(self, max_lag: float) -> None:
+        try:
+            async with self.engine.connect() as conn:
+                if self.engine.dialect.name == "postgresql":
+                    self.lag = float((await conn.execute(LAG_QUERY)).scalar())
+                else:
+                    await conn.execute(text("SELECT 1"))
+                    self.lag = 0.0
+        except Exception as e:
+            if self.healthy:
+                logger.warning(f"Replica {self.name} unreachable: {e}")
+            self.healthy = False
+            self.lag = None
+            return
+
+        healthy = self.lag <= max_lag
+        if healthy != self.healthy:
+            logger.warning(f"Replica {self.name} {'back in' if healthy else 'out of'} rotation "
+                           f"(lag {self.lag:.1f}s)")
+        self.healthy = healthy
+
+
+class ReplicaRouter:
+    """Picks the session factory for read-only requests.
+
+    Reads go round-robin to healthy replicas. A client that committed a write
+    within READ_YOUR_WRITES_SECONDS reads from the primary so it sees its own
+    changes, as does everyone while no replica is healthy (lagging beyond
+    REPLICA_MAX_LAG_SECONDS or unreachable). The write time travels with the
+    client in the LAST_WRITE_COOKIE cookie, so it holds whichever worker or
+    host serves the next read; writers are also remembered per process by
+    token subject, for API clients that do not keep cookies.
+    """
+
+    def __init__(self, urls: List[str], max_lag: float, sticky_seconds: float,
+                 check_interval: float):
+        self.replicas = [Replica(url) for url in urls]
+        self.max_lag = max_lag
+        self.sticky_seconds = sticky_seconds
+        self.check_interval = check_interval
+        self._recent_writers = LRUTTLCache(maxsize=100000, ttl=sticky_seconds)
+        self._next = 0
+        self._monitor: Optional[asyncio.Task] = None
+        self.replica_reads = 0
+        self.sticky_reads = 0
+        self.fallback_reads = 0
+
+    def mark_write(self, subject: Optional[str]) -> None:
+        if subject and self.replicas:
+            self._recent_writers.set(subject, True)
+
+    def last_write_cookie(self, written_at: float) -> str:
+        """Set-Cookie value carrying a commit time, or "" when there are no replicas."""
+        if not self.replicas:
+            return ""
+        return (f"{LAST_WRITE_COOKIE}={written_at:.3f}; Max-Age={math.ceil(self.sticky_seconds)}; "
+                f"Path=/; HttpOnly; SameSite=Lax")
+
+    def _wrote_recently(self, last_write_at: Optional[str]) -> bool:
+        try:
+            written_at = float(last_write_at)
+        except (TypeError, ValueError):
+            return False
+        # Either way round, so clock skew between API hosts cannot defeat it;
+        # a forged value only costs its sender reads from the primary
+        return abs(time.time() - written_at) < self.sticky_seconds
+
+    def choose(self, subject: Optional[str] = None,
+               last_write_at: Optional[str] = None) -> Optional[async_sessionmaker]:
+        """Replica session factory to read from, or None for the primary.
+
+        `last_write_at` is the client's LAST_WRITE_COOKIE value, if any.
+        """
+        if not self.replicas:
+            return None
+        if self._wrote_recently(last_write_at) or (subject and self._recent_writers.get(subject)):
+            self.sticky_reads += 1
+            return None
+
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            self.fallback_reads += 1
+            return None
+        self._next = (self._next + 1) % len(healthy)
+        self.replica_reads += 1
+        return healthy[self._next].sessionmaker
+
+    async def check(self) -> None:
+        await asyncio.gather(*(replica.check(self.max_lag) for replica in self.replicas))
+
+    async def _run_monitor(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check()
+
+    async def start(self) -> None:
+        if not self.replicas:
+            return
+        await self.check()
+        self._monitor = asyncio.create_task(self._run_monitor())
+
+    async def stop(self) -> None:
+        if self._monitor:
+            self._monitor.cancel()
+            self._monitor = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def status(self) -> dict:
+        return {
+            "replica_reads": self.replica_reads,
+            "sticky_reads": self.sticky_reads,
+            "fallback_reads": self.fallback_reads,
+            "replicas": [
+                {"name": replica.name, "healthy": replica.healthy, "lag_seconds": replica.lag,
+                 "pool": pool_status(replica.engine)}
+                for replica in self.replicas
+            ],
+        }
+
+
+replica_router = ReplicaRouter(
+    settings.DATABASE_REPLICA_URLS,
+    max_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    sticky_seconds=settings.READ_YOUR_WRITES_SECONDS,
+    check_interval=settings.REPLICA_CHECK_INTERVAL_SECONDS,
+)
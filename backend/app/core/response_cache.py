@@ -0,0 +1,126 @@
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models
+from app.core.config import settings
+from app.utils.cache import LRUTTLCache
+
+# (ETag, body)
+CachedPage = Tuple[str, bytes]
+
+
+class ResponseCacheBackend(ABC):
+    """Storage for cached response bodies and their ETags.
+
+    Keys carry the owner's generation from the database, so a per-process
+    store never serves a page older than the last committed write.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CachedPage]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, page: CachedPage) -> None:
+        ...
+
+    def stats(self) -> dict:
+        return {}
+
+
+class InMemoryResponseCache(ResponseCacheBackend):
+    def __init__(self, max_entries: int, ttl: float):
+        self._pages = LRUTTLCache(maxsize=max_entries, ttl=ttl)
+
+    async def get(self, key: str) -> Optional[CachedPage]:
+        return self._pages.get(key)
+
+    async def set(self, key: str, page: CachedPage) -> None:
+        self._pages.set(key, page)
+
+    def stats(self) -> dict:
+        return self._pages.stats()
+
+
+class ResponseCache:
+    """Owner-scoped response cache for list endpoints with ETag support.
+
+    Keys combine owner, route, normalized query string and the owner's
+    generation (models.CacheGeneration), which triggers bump in the same
+    transaction as any contact/lead/task write; every cached page of that
+    owner is then unreachable, in all workers at once. The generation is
+    read through the request's own session, so a lagging replica is asked
+    for its generation and its rows alike.
+
+    The ETag is a hash of the body. If-None-Match gets a 304 when it names
+    the page cached under the current key, or when the page built on a miss
+    comes out identical.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.not_modified = 0
+
+    def _key(self, request: Request, owner_id: int, generation: int) -> str:
+        route = request.scope.get("route")
+        path = route.path if route is not None else request.url.path
+        # Re-encoded, so a decoded "&" or "=" inside a value cannot pass for a separator
+        query = urlencode(sorted(request.query_params.multi_items()))
+        return f"{owner_id}:{generation}:{path}?{query}"
+
+    @staticmethod
+    def _etag(body: bytes) -> str:
+        return f'W/"{hashlib.sha1(body).hexdigest()[:20]}"'
+
+    async def lookup(self, request: Request, db: AsyncSession, owner_id: int) -> Optional[Response]:
+        """Return a 304 or cached 200 response, or None when the page must be built."""
+        if not self.enabled:
+            return None
+
+        result = await db.execute(
+            select(models.CacheGeneration.generation)
+            .where(models.CacheGeneration.owner_id == owner_id)
+        )
+        generation = result.scalar_one_or_none() or 0
+        key = self._key(request, owner_id, generation)
+        request.state.response_cache_key = key
+
+        page = await self.backend.get(key)
+        if page is None:
+            return None
+        etag, body = page
+        return self._response(request, body, etag, "HIT")
+
+    async def store(self, request: Request, body: bytes) -> Response:
+        """Cache a freshly built JSON body under the key computed by lookup()."""
+        key = getattr(request.state, "response_cache_key", None)
+        if not self.enabled or key is None:
+            return Response(body, media_type="application/json")
+        etag = self._etag(body)
+        await self.backend.set(key, (etag, body))
+        return self._response(request, body, etag, "MISS")
+
+    def _response(self, request: Request, body: bytes, etag: str, status: str) -> Response:
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache", "X-Cache": status}
+        if_none_match = request.headers.get("If-None-Match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+
+response_cache = ResponseCache(
+    InMemoryResponseCache(
+        max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+        ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    ),
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+)
+
@@ -1,20 +1,23 @@
-from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+from app.core.config import settings
 from app.core.deps import get_db
+from app.core.hashing import pwd_context
 from app.models.user import User
 from app.models.user import UserRole
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 from dotenv import load_dotenv
 from typing import List
+from app.utils.cache import LRUTTLCache
 import os
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
+# Synchronous helpers; request handlers should await
+# app.core.hashing.password_hasher instead so bcrypt runs off the event loop.
 def get_password_hashed(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -41,6 +44,35 @@ def create_access_token(data: dict, expire_delta: timedelta | None = None):
 
 oauth2scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/login")
 
+# Column snapshots of authenticated users keyed by token subject (email).
+# Each worker has its own copy, so writes must call invalidate_user and the
+# TTL bounds how long another worker can serve a stale record.
+user_cache = LRUTTLCache(
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS
+)
+_user_columns = [attr.key for attr in inspect(User).column_attrs]
+
+
+def invalidate_user(*emails: str | None) -> None:
+    """Drop cached records for the given token subjects."""
+    for email in emails:
+        if email:
+            user_cache.pop(email)
+
+
+def _snapshot_user(user: User) -> dict:
+    return {key: getattr(user, key) for key in _user_columns}
+
+
+def _hydrate_user(db: AsyncSession, snapshot: dict) -> User:
+    # A fresh instance per request, attached as persistent without a SELECT,
+    # so handlers can still modify and commit it through their own session.
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    db.add(user)
+    return user
+
 
 async def get_current_user(
         token: str = Depends(oauth2scheme),
@@ -59,10 +91,16 @@ async def get_current_user(
             raise credentials_exception
     except JWTError:
         raise credentials_exception
+
+    snapshot = user_cache.get(email)
+    if snapshot is not None:
+        return _hydrate_user(db, snapshot)
+
     result = await db.execute(select(User).where(User.email == email))
     user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    user_cache.set(email, _snapshot_user(user))
     return user
 
 
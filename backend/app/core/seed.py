@@ -0,0 +1,419 @@
+# app/core/seed.py
+"""Deterministic synthetic CRM data for performance work.
+
+    python -m app.core.seed --profile 1m --seed 42
+    python -m app.core.seed --profile 10m --truncate --drop-indexes
+
+Rows are generated as CSV in worker processes, in fixed-size chunks whose
+content depends only on (seed, table, chunk number), and loaded with COPY
+over several connections. Owners follow a Zipf-like distribution: a handful
+of whale tenants own a large share of the rows while most owners have few.
+Names, e-mails, companies and notes come from word lists so trigram search
+has realistic matches, and created_at is spread over the last --years
+years with more recent rows being more common.
+"""
+import argparse
+import asyncio
+import io
+import logging
+import math
+import os
+import random
+import time
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import accumulate
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+CHUNK_ROWS = 50_000
+
+
+@dataclass(frozen=True)
+class Profile:
+    users: int
+    contacts: int
+    leads: int
+    tasks: int
+
+    @property
+    def total(self) -> int:
+        return self.users + self.contacts + self.leads + self.tasks
+
+
+PROFILES = {
+    "small": Profile(users=200, contacts=60_000, leads=25_000, tasks=15_000),
+    "1m": Profile(users=2_000, contacts=500_000, leads=300_000, tasks=198_000),
+    "10m": Profile(users=20_000, contacts=5_000_000, leads=3_000_000, tasks=1_980_000),
+    "50m": Profile(users=50_000, contacts=25_000_000, leads=15_000_000, tasks=9_950_000),
+}
+
+FIRST_NAMES = (
+    "James Mary Robert Patricia John Jennifer Michael Linda David Elizabeth William "
+    "Barbara Richard Susan Joseph Jessica Thomas Sarah Charles Karen Christopher Lisa "
+    "Daniel Nancy Matthew Betty Anthony Margaret Mark Sandra Donald Ashley Steven Kimberly "
+    "Paul Emily Andrew Donna Joshua Michelle Kenneth Carol Kevin Amanda Brian Melissa "
+    "George Deborah Timothy Stephanie Ronald Rebecca Edward Sharon Jason Laura Jeffrey "
+    "Cynthia Ryan Kathleen Jacob Amy Gary Angela Nicholas Shirley Eric Anna Jonathan "
+    "Brenda Stephen Pamela Larry Emma Justin Nicole Scott Helen Brandon Samantha Benjamin "
+    "Katherine Samuel Christine Gregory Debra Alexander Rachel Frank Carolyn Patrick "
+    "Janet Raymond Catherine Jack Maria Dennis Heather Jerry Diane Tyler Ruth Aaron Julie "
+    "Priya Arjun Ananya Rohan Aisha Omar Yuki Hiroshi Mei Wei Lucas Sofia Mateo Valentina"
+).split()
+LAST_NAMES = (
+    "Smith Johnson Williams Brown Jones Garcia Miller Davis Rodriguez Martinez Hernandez "
+    "Lopez Gonzalez Wilson Anderson Thomas Taylor Moore Jackson Martin Lee Perez Thompson "
+    "White Harris Sanchez Clark Ramirez Lewis Robinson Walker Young Allen King Wright Scott "
+    "Torres Nguyen Hill Flores Green Adams Nelson Baker Hall Rivera Campbell Mitchell "
+    "Carter Roberts Gomez Phillips Evans Turner Diaz Parker Cruz Edwards Collins Reyes "
+    "Stewart Morris Morales Murphy Cook Rogers Gutierrez Ortiz Morgan Cooper Peterson "
+    "Bailey Reed Kelly Howard Ramos Kim Cox Ward Richardson Watson Brooks Chavez Wood "
+    "James Bennett Gray Mendoza Ruiz Hughes Price Alvarez Castillo Sanders Patel Myers "
+    "Long Ross Foster Jimenez Nair Iyer Menon Sharma Gupta Khan Tanaka Suzuki Chen Wang "
+    "Muller Schmidt Rossi Ferrari Silva Santos Kowalski Novak Jansen Dubois Moreau Larsen"
+).split()
+COMPANY_WORDS = (
+    "Acme Global Apex Summit Pioneer Vertex Nimbus Horizon Quantum Crescent Evergreen "
+    "Silverline Bluewave Northstar Redwood Ironclad Brightpath Keystone Lighthouse "
+    "Meridian Orbit Pinnacle Sterling Titan Unity Velocity Zenith Harbor Cascade Falcon"
+).split()
+COMPANY_SUFFIXES = (
+    "Labs Systems Holdings Partners Group Industries Solutions Logistics Analytics "
+    "Dynamics Ventures Consulting Foods Health Media Energy Capital Software Retail"
+).split()
+DOMAINS = ("gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "icloud.com",
+           "proton.me", "example.com", "company.io")
+NOTE_WORDS = (
+    "called left voicemail follow up next week interested pricing demo requested "
+    "budget approved decision maker referral from conference webinar signed contract "
+    "renewal quarter enterprise plan trial extended needs integration with their ERP "
+    "asked about discount competitor evaluation sent proposal meeting scheduled "
+    "onboarding support ticket upgrade churn risk champion procurement legal review "
+    "security questionnaire pilot rollout expansion seats annual monthly invoice "
+    "shipping warehouse logistics marketing campaign newsletter inbound outbound "
+    "cold email replied positive negative timeline urgent not now revisit later"
+).split()
+TASK_VERBS = ("Call", "Email", "Prepare", "Review", "Schedule", "Send", "Update",
+              "Follow up with", "Draft", "Negotiate", "Qualify", "Demo for")
+TASK_OBJECTS = ("proposal", "contract", "pricing sheet", "onboarding plan", "renewal",
+                "invoice", "quarterly report", "security review", "product demo",
+                "kickoff meeting", "case study", "pilot results")
+
+CONTACT_STATUSES = ("new", "contacted", "won", "lost")
+CONTACT_STATUS_WEIGHTS = (45, 30, 15, 10)
+CONTACT_SOURCES = ("referral", "ad", "webform")
+LEAD_STATUSES = ("new", "contacted", "qualified", "unqualified", "converted", "lost")
+LEAD_STATUS_WEIGHTS = (35, 25, 15, 10, 8, 7)
+LEAD_SOURCES = ("referral", "ad", "webform", "cold_call", "email", "social_media", "other")
+TASK_STATUSES = ("todo", "inprogress", "review", "completed")
+TASK_STATUS_WEIGHTS = (30, 20, 10, 40)
+
+COLUMNS = {
+    "users": ["id", "name", "email", "hashed_password", "role", "is_verified", "created_at"],
+    "contacts": ["name", "email", "phone", "company", "source", "status", "notes",
+                 "owner_id", "created_at"],
+    "leads": ["name", "status", "source", "notes", "owner_id", "created_at"],
+    "tasks": ["head", "description", "status", "team_id", "assigned_to", "owner_id",
+              "reporter", "created_at"],
+}
+
+
+@dataclass(frozen=True)
+class SeedContext:
+    """Everything a worker process needs to generate any chunk on its own."""
+    seed: int
+    user_base: int
+    users: int
+    skew: float
+    end: float
+    years: float
+    hashed_password: str
+
+
+def _rng(ctx: SeedContext, table: str, chunk: int) -> random.Random:
+    return random.Random(f"{ctx.seed}:{table}:{chunk}")
+
+
+@lru_cache(maxsize=4)
+def _owner_weights(users: int, skew: float) -> List[float]:
+    # Zipf-like: owner k gets weight 1 / k^skew
+    return list(accumulate(1 / (rank ** skew) for rank in range(1, users + 1)))
+
+
+def _owners(ctx: SeedContext, rng: random.Random, k: int) -> List[int]:
+    cum = _owner_weights(ctx.users, ctx.skew)
+    total = cum[-1]
+    base = ctx.user_base + 1
+    return [base + bisect_right(cum, rng.random() * total) for _ in range(k)]
+
+
+@lru_cache(maxsize=4)
+def _days(end: float, years: float) -> List[str]:
+    last = datetime.fromtimestamp(end, timezone.utc).date()
+    count = max(1, int(years * 365))
+    return [(last - timedelta(days=n)).isoformat() for n in range(count)]
+
+
+def _timestamps(ctx: SeedContext, rng: random.Random, k: int) -> List[str]:
+    days = _days(ctx.end, ctx.years)
+    span = len(days)
+    out = []
+    for _ in range(k):
+        # 1 - sqrt(u) puts more rows in recent days
+        day = days[min(span - 1, int((1 - math.sqrt(rng.random())) * span))]
+        second = rng.randrange(86_400)
+        out.append(f"{day} {second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}+00")
+    return out
+
+
+def _person(rng: random.Random):
+    first = rng.choice(FIRST_NAMES)
+    last = rng.choice(LAST_NAMES)
+    return first, last
+
+
+def _company(rng: random.Random) -> str:
+    return f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}"
+
+
+def _notes(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choices(NOTE_WORDS, k=rng.randint(low, high)))
+
+
+def user_rows(ctx: SeedContext, chunk: int, start: int, count: int) -> bytes:
+    rng = _rng(ctx, "users", chunk)
+    created = _timestamps(ctx, rng, count)
+    out = io.StringIO()
+    for n in range(count):
+        index = start + n
+        user_id = ctx.user_base + index + 1
+        first, last = _person(rng)
+        # The biggest tenant is the admin; a few managers, everyone else users
+        role = "admin" if index == 0 else ("manager" if rng.random() < 0.05 else "user")
+        out.write(f"{user_id},{first} {last},{first.lower()}.{last.lower()}.{user_id}"
+                  f"@seed{ctx.seed}.example.com,{ctx.hashed_password},{role},true,"
+                  f"{created[n]}\n")
+    return out.getvalue().encode()
+
+
+def contact_rows(ctx: SeedContext, chunk: int, start: int, count: int) -> bytes:
+    rng = _rng(ctx, "contacts", chunk)
+    owners = _owners(ctx, rng, count)
+    created = _timestamps(ctx, rng, count)
+    statuses = rng.choices(CONTACT_STATUSES, CONTACT_STATUS_WEIGHTS, k=count)
+    out = io.StringIO()
+    for n in range(count):
+        first, last = _person(rng)
+        # Optional columns are sometimes empty, which COPY CSV reads as NULL
+        email = (f"{first.lower()}.{last.lower()}{rng.randrange(1000)}@{rng.choice(DOMAINS)}"
+                 if rng.random() < 0.9 else "")
+        phone = f"+1{rng.randrange(2_000_000_000, 9_999_999_999)}" if rng.random() < 0.7 else ""
+        company = _company(rng) if rng.random() < 0.8 else ""
+        notes = _notes(rng, 3, 20) if rng.random() < 0.6 else ""
+        out.write(f"{first} {last},{email},{phone},{company},{rng.choice(CONTACT_SOURCES)},"
+                  f"{statuses[n]},{notes},{owners[n]},{created[n]}\n")
+    return out.getvalue().encode()
+
+
+def lead_rows(ctx: SeedContext, chunk: int, start: int, count: int) -> bytes:
+    rng = _rng(ctx, "leads", chunk)
+    owners = _owners(ctx, rng, count)
+    created = _timestamps(ctx, rng, count)
+    statuses = rng.choices(LEAD_STATUSES, LEAD_STATUS_WEIGHTS, k=count)
+    out = io.StringIO()
+    for n in range(count):
+        if rng.random() < 0.5:
+            name = _company(rng)
+        else:
+            first, last = _person(rng)
+            name = f"{first} {last}"
+        notes = _notes(rng, 5, 30) if rng.random() < 0.8 else ""
+        source = rng.choice(LEAD_SOURCES) if rng.random() < 0.9 else ""
+        out.write(f"{name},{statuses[n]},{source},{notes},{owners[n]},{created[n]}\n")
+    return out.getvalue().encode()
+
+
+def task_rows(ctx: SeedContext, chunk: int, start: int, count: int) -> bytes:
+    rng = _rng(ctx, "tasks", chunk)
+    owners = _owners(ctx, rng, count)
+    assignees = _owners(ctx, rng, count)
+    created = _timestamps(ctx, rng, count)
+    statuses = rng.choices(TASK_STATUSES, TASK_STATUS_WEIGHTS, k=count)
+    out = io.StringIO()
+    for n in range(count):
+        first, last = _person(rng)
+        head = f"{rng.choice(TASK_VERBS)} {first} {last} about {rng.choice(TASK_OBJECTS)}"
+        description = _notes(rng, 5, 25) if rng.random() < 0.7 else ""
+        out.write(f"{head},{description},{statuses[n]},{rng.randint(1, 50)},"
+                  f"{assignees[n]},{owners[n]},{owners[n]},{created[n]}\n")
+    return out.getvalue().encode()
+
+
+GENERATORS = {
+    "users": user_rows,
+    "contacts": contact_rows,
+    "leads": lead_rows,
+    "tasks": task_rows,
+}
+
+
+def generate_chunk(ctx: SeedContext, table: str, chunk: int, rows: int) -> bytes:
+    return GENERATORS[table](ctx, chunk, chunk * CHUNK_ROWS, rows)
+
+
+def _dsn() -> str:
+    from sqlalchemy.engine import make_url
+    from app.core.config import settings
+
+    # asyncpg takes a plain libpq-style URL
+    url = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+    return url.render_as_string(hide_password=False)
+
+
+async def _copy_table(conns, executor, ctx: SeedContext, table: str, total: int, workers: int):
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=len(conns))
+    loaded = 0
+    started = time.perf_counter()
+
+    async def produce():
+        # At most `workers` chunks are generated ahead of the COPYs
+        pending = deque()
+        for chunk in range(math.ceil(total / CHUNK_ROWS)):
+            rows = min(CHUNK_ROWS, total - chunk * CHUNK_ROWS)
+            pending.append((rows, loop.run_in_executor(
+                executor, generate_chunk, ctx, table, chunk, rows)))
+            if len(pending) >= workers:
+                rows, future = pending.popleft()
+                await queue.put((rows, await future))
+        while pending:
+            rows, future = pending.popleft()
+            await queue.put((rows, await future))
+        for _ in conns:
+            await queue.put(None)
+
+    async def consume(conn):
+        nonlocal loaded
+        while (item := await queue.get()) is not None:
+            rows, data = item
+            await conn.copy_to_table(table, source=io.BytesIO(data),
+                                     columns=COLUMNS[table], format="csv")
+            loaded += rows
+            elapsed = time.perf_counter() - started
+            logger.info(f"{table}: {loaded:,}/{total:,} rows ({loaded / elapsed:,.0f} rows/s)")
+
+    await asyncio.gather(produce(), *(consume(conn) for conn in conns))
+    elapsed = time.perf_counter() - started
+    print(f"{table:<9}{total:>12,} rows in {elapsed:7.1f}s ({total / elapsed:,.0f} rows/s)")
+
+
+async def _secondary_indexes(conn, tables) -> List[tuple]:
+    rows = await conn.fetch(
+        """
+        SELECT i.indexname, i.indexdef
+        FROM pg_indexes i
+        JOIN pg_class c ON c.relname = i.indexname
+        JOIN pg_index x ON x.indexrelid = c.oid
+        WHERE i.schemaname = current_schema() AND i.tablename = ANY($1::text[])
+          AND NOT x.indisprimary AND NOT x.indisunique
+        """,
+        list(tables),
+    )
+    return [(row["indexname"], row["indexdef"]) for row in rows]
+
+
+async def seed(profile: Profile, seed_value: int, workers: int, connections: int,
+               years: float, skew: float, as_of: float, truncate: bool,
+               drop_indexes: bool) -> None:
+    import asyncpg
+    from app.core.hashing import pwd_context
+
+    dsn = _dsn()
+    admin = await asyncpg.connect(dsn)
+    conns = []
+    try:
+        if truncate:
+            await admin.execute(
+                "TRUNCATE tasks, leads, contacts, users RESTART IDENTITY CASCADE")
+        user_base = await admin.fetchval("SELECT COALESCE(MAX(id), 0) FROM users")
+
+        dropped = []
+        if drop_indexes:
+            # Building GIN trigram indexes once is far cheaper than per row
+            dropped = await _secondary_indexes(admin, COLUMNS)
+            for name, _ in dropped:
+                await admin.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+        ctx = SeedContext(
+            seed=seed_value,
+            user_base=user_base,
+            users=profile.users,
+            skew=skew,
+            end=as_of,
+            years=years,
+            # Every seeded user logs in with the password "password"
+            hashed_password=pwd_context.hash("password"),
+        )
+        conns = [await asyncpg.connect(dsn) for _ in range(connections)]
+        for conn in conns:
+            await conn.execute("SET synchronous_commit = off")
+
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for table in COLUMNS:
+                await _copy_table(conns, executor, ctx, table, getattr(profile, table), workers)
+
+        # Explicit ids above: move the sequence past them
+        await admin.execute(
+            "SELECT setval(pg_get_serial_sequence('users', 'id'), "
+            "(SELECT COALESCE(MAX(id), 1) FROM users))")
+
+        if dropped:
+            await admin.execute("SET maintenance_work_mem = '1GB'")
+        for name, definition in dropped:
+            index_started = time.perf_counter()
+            await admin.execute(definition)
+            print(f"rebuilt {name} in {time.perf_counter() - index_started:.1f}s")
+
+        await admin.execute("ANALYZE users, contacts, leads, tasks")
+        elapsed = time.perf_counter() - started
+        print(f"total    {profile.total:>12,} rows in {elapsed:7.1f}s "
+              f"({profile.total / elapsed:,.0f} rows/s)")
+    finally:
+        for conn in conns:
+            await conn.close()
+        await admin.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2,
+                        help="row generator processes")
+    parser.add_argument("--connections", type=int, default=4, help="parallel COPY streams")
+    parser.add_argument("--years", type=float, default=5.0, help="created_at spread")
+    parser.add_argument("--skew", type=float, default=1.1,
+                        help="owner Zipf exponent; higher means bigger whales")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date.today(),
+                        help="newest created_at day (YYYY-MM-DD); fix it for identical reruns")
+    parser.add_argument("--truncate", action="store_true",
+                        help="empty users/contacts/leads/tasks first")
+    parser.add_argument("--drop-indexes", action="store_true",
+                        help="drop secondary indexes during the load and rebuild them after")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(seed(PROFILES[args.profile], args.seed, args.workers, args.connections,
+                     args.years, args.skew,
+                     datetime.combine(args.as_of, datetime.min.time(), timezone.utc).timestamp(),
+                     args.truncate, args.drop_indexes))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,23 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, HTTPException, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 import logging
 from dotenv import load_dotenv
 import os
 
-from app.api.v1 import routes, admin_users, contact_routes, lead_routes, task_routes, auth_routes
+from app.api.v1 import routes, admin_users, admin_system, contact_routes, lead_routes, task_routes, auth_routes, dashboard_routes
 from app.core.config import settings
 # from app.core.deps import get_query_token
 from app.core.security import require_roles
+from app.core.hashing import password_hasher
+from app.core.database import InstrumentedPool, engine, warm_pool
+from app.core.metrics import format_labels, gauge_lines, registry, render_histogram
+from app.core.middleware import MetricsMiddleware, QueryStatsMiddleware, ReadYourWritesMiddleware
+from app.core.rate_limit import auth_admission
+from app.core.response_cache import response_cache
+from app.core.replicas import replica_router
+from app.utils.email import dispatcher as email_dispatcher
 
 ENVIRONMENT = os.getenv("ENVIRONMENT")
 
@@ -43,6 +52,15 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    app.add_middleware(QueryStatsMiddleware, server_timing=settings.SQL_SERVER_TIMING)
+
+    if settings.DATABASE_REPLICA_URLS:
+        app.add_middleware(ReadYourWritesMiddleware, router=replica_router)
+
+    # Outermost, so the recorded latency covers the whole middleware stack
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
     # Health check endpoint
     @app.get("/", tags=["health"])
     async def health_check():
@@ -53,11 +71,69 @@ def create_app() -> FastAPI:
             "version": "1.0.0"
         }
     
+    if settings.METRICS_ENABLED:
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics(request: Request):
+            """Prometheus text exposition of this worker's metrics."""
+            if settings.METRICS_TOKEN and \
+                    request.headers.get("Authorization") != f"Bearer {settings.METRICS_TOKEN}":
+                raise HTTPException(status_code=404)
+            return PlainTextResponse(
+                registry.render(), media_type="text/plain; version=0.0.4")
+
     # Include routers with organized structure
     include_routers(app)
 
     return app
 
+
+def collect_runtime_metrics() -> list:
+    """Point-in-time state of the pool, hashing, auth admission, email and cache for /metrics."""
+    lines = []
+    pool = engine.pool
+    if isinstance(pool, InstrumentedPool):
+        lines += gauge_lines("db_pool_checked_out", "Connections in use.", pool.checkedout())
+        lines += gauge_lines("db_pool_overflow", "Overflow connections open.",
+                             max(pool.overflow(), 0))
+        lines += gauge_lines("db_pool_timeouts_total", "Checkouts that timed out.",
+                             pool.timeouts, kind="counter")
+        lines += ["# HELP db_pool_acquire_wait_seconds Time spent waiting for a connection.",
+                  "# TYPE db_pool_acquire_wait_seconds histogram"]
+        lines += render_histogram("db_pool_acquire_wait_seconds", "", pool.wait_histogram)
+
+    hashing = password_hasher.stats()
+    lines += gauge_lines("password_hash_pending", "Hash/verify calls queued or running.",
+                         hashing["pending"])
+    lines += gauge_lines("password_hash_rejected_total", "Hash/verify calls shed with 503.",
+                         hashing["rejected"], kind="counter")
+
+    admission = auth_admission.stats()
+    lines += gauge_lines("auth_in_flight", "Login/register/password reset requests admitted.",
+                         admission["in_flight"])
+    lines += gauge_lines("auth_admitted_total", "Login/register/password reset requests let in.",
+                         admission["admitted"], kind="counter")
+    lines += ["# HELP auth_rejected_total Auth requests turned away before hashing, by reason.",
+              "# TYPE auth_rejected_total counter"]
+    lines += [f"auth_rejected_total{format_labels(('reason',), (reason,))} {count}"
+              for reason, count in admission["rejected"].items()]
+
+    email = email_dispatcher.stats()
+    lines += gauge_lines("email_failed_total", "Send attempts that failed (their jobs retry).",
+                         email["failed"], kind="counter")
+
+    cache = response_cache.backend.stats()
+    if "hits" in cache:
+        lines += gauge_lines("response_cache_hits_total", "List pages served from cache.",
+                             cache["hits"], kind="counter")
+        lines += gauge_lines("response_cache_misses_total", "List pages built.",
+                             cache["misses"], kind="counter")
+    lines += gauge_lines("response_cache_not_modified_total", "304 answers to If-None-Match.",
+                         response_cache.not_modified, kind="counter")
+    return lines
+
+
+registry.add_collector(collect_runtime_metrics)
+
 def include_routers(app: FastAPI) -> None:
     """Centralized router configuration with proper prefixes and tags."""
 
@@ -82,6 +158,11 @@ def include_routers(app: FastAPI) -> None:
             "prefix": f"{api_prefix}/admin/users",
             "tags": ["Admin - Users"],
         },
+        {
+            "router": admin_system.router,
+            "prefix": f"{api_prefix}/admin/system",
+            "tags": ["Admin - System"],
+        },
         {
             "router": contact_routes.router,
             "prefix": f"{api_prefix}/contacts",
@@ -96,6 +177,11 @@ def include_routers(app: FastAPI) -> None:
             "router": task_routes.router,
             "prefix": f"{api_prefix}/tasks",
             "tags": ["Tasks"]
+        },
+        {
+            "router": dashboard_routes.router,
+            "prefix": f"{api_prefix}/dashboard",
+            "tags": ["Dashboard"]
         }
     ]
 
@@ -112,9 +198,20 @@ async def startup_event():
     """Initialize resources on startup."""
     logger.info("CRM Backend starting UP...")
     # Initialize database connections, cache, etc.
+    warm = min(settings.DB_POOL_WARM, settings.DB_POOL_SIZE)
+    if warm > 0:
+        try:
+            await warm_pool(engine, warm)
+        except Exception as e:
+            logger.warning(f"Could not warm database pool: {e}")
+    await replica_router.start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
     logger.info("CRM Backend shutting down...")
-    # Close database connections, cleanUp, etc.
\ No newline at end of file
+    # Close database connections, cleanUp, etc.
+    await email_dispatcher.stop(settings.EMAIL_DRAIN_TIMEOUT)
+    password_hasher.shutdown()
+    await replica_router.stop()
+    await engine.dispose()
\ No newline at end of file
@@ -1,4 +1,7 @@
 from .user import User
 from .contact import Contact
 from .leads import Lead
-from .task import Task
\ No newline at end of file
+from .task import Task
+from .pipeline import PipelineCounter
+from .job import Job
+from .cache_generation import CacheGeneration
@@ -0,0 +1,16 @@
+from sqlalchemy import BigInteger, Column, Integer
+from app.core.database import Base
+
+
+class CacheGeneration(Base):
+    """Per-owner counter bumped by any write to their contacts, leads or tasks.
+
+    Cached list pages are keyed by it (app/core/response_cache.py). Triggers
+    created by the response_cache_generations migration bump it in the
+    writing transaction, so every worker, and each replica once it has
+    replayed the write, sees the new generation together with the new rows.
+    """
+    __tablename__ = "cache_generations"
+
+    owner_id = Column(Integer, primary_key=True)
+    generation = Column(BigInteger, nullable=False, default=0)
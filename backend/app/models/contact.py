@@ -1,5 +1,6 @@
-from sqlalchemy.orm import relationship
-from sqlalchemy import Column, String, Integer, ForeignKey, Index
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy import Column, Computed, String, Integer, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.core.database import Base
 from sqlalchemy.sql import func
 from sqlalchemy import DateTime
@@ -17,6 +18,12 @@ class Contact(Base):
     company = Column(String, nullable=True)
     owner_id = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Full-text document for search=fulltext; deferred so entity loads skip it
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(notes, '')), 'C')",
+        persisted=True)))
 
     # Use gin_trgm_ops for text columns so GIN trigram works
     __table_args__ = (
@@ -27,6 +34,12 @@ class Contact(Base):
             postgresql_using="gin",
             postgresql_ops={"name": "gin_trgm_ops", "email": "gin_trgm_ops"},
         ),
+        # Owner-scoped lists: each filter/sort column after owner_id, id as tiebreaker
+        Index("idx_contacts_owner_id", "owner_id", "id"),
+        Index("idx_contacts_owner_created", "owner_id", "created_at", "id"),
+        Index("idx_contacts_owner_status", "owner_id", "status", "id"),
+        Index("idx_contacts_owner_source", "owner_id", "source", "id"),
+        Index("idx_contacts_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     owner = relationship("User", back_populates="contacts")
@@ -0,0 +1,38 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, SmallInteger, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class Job(Base):
+    """A unit of background work, run by `python -m app.worker`.
+
+    status moves queued -> running -> done, or back to queued with a later
+    run_at after a failure, until max_attempts is used up (failed). A
+    running job whose locked_until has passed is claimable again: the
+    worker that held it stopped heartbeating.
+    """
+    __tablename__ = "jobs"
+
+    id = Column(BigInteger, primary_key=True)
+    type = Column(String, nullable=False)
+    payload = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    priority = Column(SmallInteger, nullable=False, server_default="0")
+    status = Column(String, nullable=False, server_default="queued")
+    attempts = Column(Integer, nullable=False, server_default="0")
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_by = Column(String, nullable=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Claim order; only unfinished jobs are indexed, so it stays small
+        Index("idx_jobs_claim", "type", text("priority DESC"), "run_at", "id",
+              postgresql_where=text("status IN ('queued', 'running')")),
+        # Retention sweep of finished jobs
+        Index("idx_jobs_done_finished", "finished_at",
+              postgresql_where=text("status = 'done'")),
+    )
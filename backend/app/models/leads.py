@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Index
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Integer, String, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from app.core.database import Base
 from sqlalchemy import DateTime
 from sqlalchemy.sql import func
@@ -14,11 +15,22 @@ class Lead(Base):
     notes = Column(String, nullable=True)
     owner_id = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Full-text document for search=fulltext; deferred so entity loads skip it
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(notes, '')), 'C')",
+        persisted=True)))
     
     __table_args__ = (
         Index("idx_leads_name_notes_trgm", "name", "notes", 
               postgresql_using="gin",
               postgresql_ops={'name': 'gin_trgm_ops', 'notes': 'gin_trgm_ops'}),
+        # Owner-scoped lists: each filter/sort column after owner_id, id as tiebreaker
+        Index("idx_leads_owner_id", "owner_id", "id"),
+        Index("idx_leads_owner_created", "owner_id", "created_at", "id"),
+        Index("idx_leads_owner_status", "owner_id", "status", "id"),
+        Index("idx_leads_owner_source", "owner_id", "source", "id"),
+        Index("idx_leads_search_vector", "search_vector", postgresql_using="gin"),
     )
     
     owner = relationship("User", back_populates="leads")
\ No newline at end of file
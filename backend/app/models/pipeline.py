@@ -0,0 +1,17 @@
+from sqlalchemy import BigInteger, Column, Integer, String
+from app.core.database import Base
+
+
+class PipelineCounter(Base):
+    """Per-owner dashboard counts, kept current by triggers on leads and contacts.
+
+    kind is one of lead_status, lead_source, contact_status or lead_day;
+    bucket is the column value ("none" for NULL) or a YYYY-MM-DD day (UTC).
+    The triggers are created by the pipeline_counters migration.
+    """
+    __tablename__ = "pipeline_counters"
+
+    owner_id = Column(Integer, primary_key=True)
+    kind = Column(String, primary_key=True)
+    bucket = Column(String, primary_key=True)
+    n = Column(BigInteger, nullable=False, default=0)
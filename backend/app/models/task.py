@@ -1,5 +1,6 @@
-from sqlalchemy.orm import relationship
-from sqlalchemy import Column, String, Integer, ForeignKey, Index, DateTime
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy import Column, Computed, String, Integer, ForeignKey, Index, DateTime
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -16,6 +17,11 @@ class Task(Base):
     owner_id = Column(Integer, ForeignKey("users.id"))
     reporter = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Full-text document for search=fulltext; deferred so entity loads skip it
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(head, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+        persisted=True)))
 
     __table_args__ = (
         Index(
@@ -24,6 +30,13 @@ class Task(Base):
             postgresql_using="gin",
             postgresql_ops={"head": "gin_trgm_ops"},
         ),
+        # Board columns: newest tasks per (owner, status)
+        Index("idx_tasks_owner_status_created", "owner_id", "status", "created_at"),
+        # Owner-scoped lists: each filter column after owner_id, id as tiebreaker
+        Index("idx_tasks_owner_id", "owner_id", "id"),
+        Index("idx_tasks_owner_assigned", "owner_id", "assigned_to", "id"),
+        Index("idx_tasks_owner_team", "owner_id", "team_id", "id"),
+        Index("idx_tasks_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     owner = relationship("User", back_populates="tasks")
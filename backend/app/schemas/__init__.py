@@ -1,4 +1,7 @@
 from .user import UserSchema, UserCreate, UserLogin, Token, UserUpdate, PaginatedUserOut
-from .contact import ContactBase, ContactCreate, ContactUpdate, ContactOut, PaginatedContactOut
+from .contact import (ContactBase, ContactCreate, ContactUpdate, ContactOut, PaginatedContactOut,
+                      DuplicateReport, ContactMerge, ContactMergeOut)
 from .lead import LeadBase, LeadCreate, LeadOut, LeadUpdate
-from .task import TaskBase, TaskCreate, TaskOut, TaskStatus, TaskUpdate, PaginatedTaskOut
+from .task import TaskBase, TaskCreate, TaskOut, TaskStatus, TaskUpdate, PaginatedTaskOut, TaskBoard
+from .bulk import ImportFormat, ExportFormat, ImportRowError, ImportReport, BulkReport
+from .dashboard import PipelineDashboard, ReconcileReport
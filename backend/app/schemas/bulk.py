@@ -0,0 +1,130 @@
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import List, Optional
+from datetime import datetime
+from enum import Enum
+
+from .contact import ContactSource, ContactStatus
+from .lead import LeadSource, LeadStatus
+from .task import TaskStatus
+
+
+class ImportFormat(str, Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+class ExportFormat(str, Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+class ImportRowError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class ImportReport(BaseModel):
+    inserted: int
+    failed: int
+    errors: List[ImportRowError]
+    errors_truncated: bool = False
+
+
+class BulkSelection(BaseModel):
+    """Rows to mutate: explicit ids, a filter equivalent to the list endpoint's, or all.
+
+    A filter must constrain something: an empty one would select every row
+    the caller owns, which takes an explicit `all: true`.
+    """
+    ids: Optional[List[int]] = None
+    filter: Optional[BaseModel] = None
+    all: bool = Field(False, description="every row the caller owns")
+
+    @model_validator(mode="after")
+    def exactly_one_selector(self):
+        if sum((self.ids is not None, self.filter is not None, self.all)) != 1:
+            raise ValueError("provide exactly one of ids, filter or all")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("filter must set at least one field; use all to select every row")
+        return self
+
+
+def _require_changes(changes: BaseModel) -> BaseModel:
+    if not changes.model_fields_set:
+        raise ValueError("changes must set at least one field")
+    return changes
+
+
+class ContactBulkFilter(BaseModel):
+    status: Optional[ContactStatus] = None
+    source: Optional[ContactSource] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+
+class ContactBulkChanges(BaseModel):
+    status: Optional[ContactStatus] = None
+    source: Optional[ContactSource] = None
+    company: Optional[str] = None
+
+
+class ContactBulkDelete(BulkSelection):
+    filter: Optional[ContactBulkFilter] = None
+
+
+class ContactBulkUpdate(ContactBulkDelete):
+    changes: ContactBulkChanges
+
+    _check_changes = field_validator("changes")(_require_changes)
+
+
+class LeadBulkFilter(BaseModel):
+    status: Optional[LeadStatus] = None
+    source: Optional[LeadSource] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+
+class LeadBulkChanges(BaseModel):
+    status: Optional[LeadStatus] = None
+    source: Optional[LeadSource] = None
+    owner_id: Optional[int] = Field(None, description="reassign to another user")
+
+
+class LeadBulkDelete(BulkSelection):
+    filter: Optional[LeadBulkFilter] = None
+
+
+class LeadBulkUpdate(LeadBulkDelete):
+    changes: LeadBulkChanges
+
+    _check_changes = field_validator("changes")(_require_changes)
+
+
+class TaskBulkFilter(BaseModel):
+    status: Optional[TaskStatus] = None
+    assigned_to: Optional[int] = None
+    team_id: Optional[int] = None
+
+
+class TaskBulkChanges(BaseModel):
+    status: Optional[TaskStatus] = None
+    assigned_to: Optional[int] = None
+    team_id: Optional[int] = None
+
+
+class TaskBulkDelete(BulkSelection):
+    filter: Optional[TaskBulkFilter] = None
+
+
+class TaskBulkUpdate(TaskBulkDelete):
+    changes: TaskBulkChanges
+
+    _check_changes = field_validator("changes")(_require_changes)
+
+
+class BulkReport(BaseModel):
+    affected: int
+    chunks: int
+    not_found: List[int] = []
+    not_found_truncated: bool = False
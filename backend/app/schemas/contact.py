@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional,List
+from typing import Dict, Optional, List
 from datetime import datetime
 from enum import Enum
 from sqlalchemy.orm import Query
@@ -40,4 +40,35 @@ class ContactOut(ContactBase):
 
 class PaginatedContactOut(BaseModel):
     total: int
-    items: List[ContactOut]
\ No newline at end of file
+    total_mode: str = "exact"
+    total_capped: bool = False
+    items: List[ContactOut]
+    next_cursor: Optional[str] = None
+    # search=fulltext only: ts_headline snippet per item id, matches in <b></b>
+    highlights: Optional[Dict[str, str]] = None
+
+
+class DuplicateCluster(BaseModel):
+    ids: List[int]
+    # Which blocking keys joined the cluster: email, phone, name
+    reasons: List[str]
+    items: List[ContactOut]
+
+
+class DuplicateReport(BaseModel):
+    contacts_scanned: int
+    candidate_pairs: int
+    skipped_blocks: int
+    total_clusters: int
+    truncated: bool
+    clusters: List[DuplicateCluster]
+
+
+class ContactMerge(BaseModel):
+    survivor_id: int
+    duplicate_ids: List[int]
+
+
+class ContactMergeOut(BaseModel):
+    contact: ContactOut
+    merged_ids: List[int]
@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from typing import Dict, List
+from datetime import date
+
+
+class DailyCount(BaseModel):
+    day: date
+    count: int
+
+
+class PipelineDashboard(BaseModel):
+    leads_by_status: Dict[str, int]
+    leads_by_source: Dict[str, int]
+    contacts_by_status: Dict[str, int]
+    new_leads_per_day: List[DailyCount]
+
+
+class CounterDrift(BaseModel):
+    owner_id: int
+    kind: str
+    bucket: str
+    stored: int
+    actual: int
+
+
+class ReconcileReport(BaseModel):
+    drift_rows: int
+    drift: List[CounterDrift]
+    drift_truncated: bool = False
+    applied: bool
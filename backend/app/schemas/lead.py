@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 from enum import Enum
 
@@ -49,4 +49,8 @@ class LeadOut(LeadBase):
 
 class PaginatedLeadOut(BaseModel):
     total: int
+    total_mode: str = "exact"
+    total_capped: bool = False
     items: List[LeadOut]
+    next_cursor: Optional[str] = None
+    highlights: Optional[Dict[str, str]] = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 from enum import Enum
 
@@ -36,4 +36,20 @@ class TaskOut(TaskBase):
 
 class PaginatedTaskOut(BaseModel):
     total: int
-    items: List[TaskOut]
\ No newline at end of file
+    total_mode: str = "exact"
+    total_capped: bool = False
+    items: List[TaskOut]
+    next_cursor: Optional[str] = None
+    highlights: Optional[Dict[str, str]] = None
+
+
+class TaskBoardColumn(BaseModel):
+    status: TaskStatus
+    total: int
+    total_capped: bool = False
+    items: List[TaskOut]
+
+
+class TaskBoard(BaseModel):
+    total_mode: str = "exact"
+    columns: List[TaskBoardColumn]
@@ -40,4 +40,7 @@ class UserUpdate(BaseModel):
 
 class PaginatedUserOut(BaseModel):
     total: int
-    items: List[UserSchema]
\ No newline at end of file
+    total_mode: str = "exact"
+    total_capped: bool = False
+    items: List[UserSchema]
+    next_cursor: Optional[str] = None
\ No newline at end of file
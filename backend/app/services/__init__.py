@@ -1 +1,10 @@
-from .user_service import create_user, authenticate_user
\ No newline at end of file
+from .user_service import create_user, authenticate_user
+from . import search_service
+from . import import_service
+from . import export_service
+from . import lead_service
+from . import task_service
+from . import bulk_service
+from . import pipeline_service
+from . import dedup_service
+from . import job_service
@@ -0,0 +1,164 @@
+from typing import Callable, List, NamedTuple, Optional
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import ARRAY, Integer, any_, bindparam, delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models, schemas
+from app.core.config import settings
+from app.services.search_service import contact_filters, lead_filters, task_filters
+from app.services.task_service import REQUIRED_COLUMNS as TASK_REQUIRED_COLUMNS
+from app.utils.sql import column_values
+
+
+class BulkTarget(NamedTuple):
+    model: type
+    filters: Callable[..., list]
+    # Columns a bulk update may not set to NULL
+    required: tuple
+
+
+TARGETS = {
+    "contacts": BulkTarget(models.Contact, contact_filters, ()),
+    "leads": BulkTarget(models.Lead, lead_filters, ("owner_id",)),
+    "tasks": BulkTarget(models.Task, task_filters, TASK_REQUIRED_COLUMNS),
+}
+
+
+# Every statement is `... WHERE owner_id = :me AND id = ANY(:ids) RETURNING id`
+# with at most BULK_CHUNK_SIZE ids, so ownership is enforced by PostgreSQL and
+# rows that are missing or belong to someone else simply do not come back.
+# Each chunk commits on its own: locks are held for one chunk, not the whole
+# request, and a failure part way leaves earlier chunks applied.
+
+def _ids_param(ids: List[int]):
+    return bindparam("ids", ids, type_=ARRAY(Integer))
+
+
+def _chunks(ids: List[int], size: int):
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def _requested_ids(ids: List[int]) -> List[int]:
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > settings.BULK_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"at most {settings.BULK_MAX_IDS} ids per request; use a filter instead"
+        )
+    return ids
+
+
+async def _filtered_id_chunks(db: AsyncSession, target: BulkTarget, owner_id: int,
+                              filter: Optional[BaseModel]):
+    """Keyset over the matching ids, one chunk at a time.
+
+    Each chunk is read after the previous one was applied, so an update that
+    moves rows out of the filter (status changes, reassignment) is safe.
+    """
+    model = target.model
+    # No filter: every row of the owner (BulkSelection.all)
+    clauses = target.filters(owner_id, **(column_values(filter) if filter else {}))
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(model.id)
+            .where(*clauses, model.id > last_id)
+            .order_by(model.id)
+            .limit(settings.BULK_CHUNK_SIZE)
+        )
+        ids = result.scalars().all()
+        if not ids:
+            return
+        yield ids
+        if len(ids) < settings.BULK_CHUNK_SIZE:
+            return
+        last_id = ids[-1]
+
+
+async def _run(db: AsyncSession, target: BulkTarget, owner_id: int,
+               selection: schemas.bulk.BulkSelection, build) -> dict:
+    """Apply `build(ids)` chunk by chunk and report what it returned."""
+    affected = chunks = 0
+    missing: List[int] = []
+
+    async def apply(ids: List[int]) -> set:
+        nonlocal affected, chunks
+        result = await db.execute(build(ids), execution_options={"synchronize_session": False})
+        done = set(result.scalars().all())
+        await db.commit()
+        affected += len(done)
+        chunks += 1
+        return done
+
+    if selection.ids is not None:
+        for ids in _chunks(_requested_ids(selection.ids), settings.BULK_CHUNK_SIZE):
+            done = await apply(ids)
+            missing.extend(id_ for id_ in ids if id_ not in done)
+    else:
+        async for ids in _filtered_id_chunks(db, target, owner_id, selection.filter):
+            await apply(ids)
+
+    limit = settings.BULK_MAX_REPORTED_IDS
+    return {
+        "affected": affected,
+        "chunks": chunks,
+        "not_found": missing[:limit],
+        "not_found_truncated": len(missing) > limit,
+    }
+
+
+async def _check_new_owner(db: AsyncSession, user_id: int) -> None:
+    result = await db.execute(select(models.User.id).where(models.User.id == user_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"user {user_id} does not exist"
+        )
+
+
+async def bulk_update(db: AsyncSession, resource: str, owner_id: int,
+                      selection: schemas.bulk.BulkSelection) -> dict:
+    """Set `selection.changes` on the owner's selected rows of one resource."""
+    target = TARGETS[resource]
+    model = target.model
+    values = column_values(selection.changes, exclude_unset=True)
+    nulled = [column for column in target.required
+              if column in values and values[column] is None]
+    if nulled:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{', '.join(nulled)} cannot be null"
+        )
+
+    # Reassigned rows leave this owner's pages and join the new owner's
+    new_owner = values.get("owner_id")
+    if new_owner is not None and new_owner != owner_id:
+        await _check_new_owner(db, new_owner)
+
+    def build(ids):
+        return (
+            update(model)
+            .where(model.owner_id == owner_id, model.id == any_(_ids_param(ids)))
+            .values(**values)
+            .returning(model.id)
+        )
+    return await _run(db, target, owner_id, selection, build)
+
+
+async def bulk_delete(db: AsyncSession, resource: str, owner_id: int,
+                      selection: schemas.bulk.BulkSelection) -> dict:
+    """Delete the owner's selected rows of one resource."""
+    target = TARGETS[resource]
+    model = target.model
+
+    def build(ids):
+        return (
+            delete(model)
+            .where(model.owner_id == owner_id, model.id == any_(_ids_param(ids)))
+            .returning(model.id)
+        )
+    return await _run(db, target, owner_id, selection, build)
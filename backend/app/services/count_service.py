@@ -0,0 +1,77 @@
+import logging
+from enum import Enum
+from typing import Hashable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.config import settings
+from app.utils.cache import LRUTTLCache
+from app.utils.sql import explain
+
+logger = logging.getLogger(__name__)
+
+
+class CountMode(str, Enum):
+    exact = "exact"
+    capped = "capped"
+    estimate = "estimate"
+    cached = "cached"
+
+
+count_cache = LRUTTLCache(
+    maxsize=settings.COUNT_CACHE_SIZE,
+    ttl=settings.COUNT_CACHE_TTL_SECONDS
+)
+
+
+def count_cache_key(resource: str, owner_id: Optional[int], **filters) -> tuple:
+    """Cache key for a (resource, owner, filter set) combination."""
+    active = tuple(sorted(
+        (name, str(value)) for name, value in filters.items() if value is not None
+    ))
+    return resource, owner_id, active
+
+
+async def _exact(db: AsyncSession, query) -> int:
+    result = await db.execute(select(func.count()).select_from(query.subquery()))
+    return result.scalar()
+
+
+async def count_rows(
+    db: AsyncSession,
+    query,
+    mode: CountMode = CountMode.exact,
+    cache_key: Optional[Hashable] = None
+) -> dict:
+    """Count the rows `query` would return using the requested strategy.
+
+    `query` is the filtered select without ordering or pagination. Returns the
+    fields paginated responses carry: total, total_mode and total_capped (set
+    when a capped count stopped at COUNT_CAP, i.e. "COUNT_CAP+").
+    """
+    mode = CountMode(mode)
+
+    if mode == CountMode.capped:
+        cap = settings.COUNT_CAP
+        total = await _exact(db, query.limit(cap + 1))
+        return {"total": min(total, cap), "total_mode": mode.value, "total_capped": total > cap}
+
+    if mode == CountMode.estimate:
+        if db.bind.dialect.name == "postgresql":
+            plan = await explain(db, query)
+            total = int(plan["Plan"]["Plan Rows"])
+            return {"total": total, "total_mode": mode.value, "total_capped": False}
+        # Only PostgreSQL exposes planner row estimates
+        mode = CountMode.exact
+
+    if mode == CountMode.cached and cache_key is not None:
+        total = count_cache.get(cache_key)
+        if total is None:
+            total = await _exact(db, query)
+            count_cache.set(cache_key, total)
+        return {"total": total, "total_mode": mode.value, "total_capped": False}
+
+    total = await _exact(db, query)
+    return {"total": total, "total_mode": CountMode.exact.value, "total_capped": False}
@@ -0,0 +1,320 @@
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from math import ceil
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from starlette.concurrency import run_in_threadpool
+
+from app import models
+from app.core.config import settings
+from app.utils.serialization import CONTACT_ROWS
+
+Contact = models.Contact
+
+_NON_DIGITS = re.compile(r"\D")
+_WORDS = re.compile(r"[^\W_]+")
+_COMPANY_SUFFIXES = {"inc", "llc", "ltd", "co", "corp", "corporation", "gmbh", "plc", "sa"}
+
+# Columns a merge copies from a duplicate when the survivor has none
+MERGE_FILL_COLUMNS = ("email", "phone", "company", "source", "status")
+
+
+class DedupRow(NamedTuple):
+    id: int
+    name: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+    company: Optional[str]
+
+
+DEDUP_COLUMNS = tuple(getattr(Contact, field) for field in DedupRow._fields)
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    if not email:
+        return None
+    email = email.strip().lower()
+    return email if "@" in email else None
+
+
+def normalize_phone(phone: Optional[str], country_code: Optional[str] = None) -> Optional[str]:
+    """E.164 digits without the '+', or None when it cannot be a full number.
+
+    Numbers without a '+' or '00' prefix are national: a leading trunk 0 is
+    dropped and `country_code` (DEDUP_DEFAULT_COUNTRY_CODE) is prepended to
+    anything of ten digits or fewer.
+    """
+    if not phone:
+        return None
+    phone = phone.strip()
+    digits = _NON_DIGITS.sub("", phone)
+    if phone.startswith("+"):
+        pass
+    elif digits.startswith("00"):
+        digits = digits[2:]
+    elif digits.startswith("0") or len(digits) <= 10:
+        code = settings.DEDUP_DEFAULT_COUNTRY_CODE if country_code is None else country_code
+        digits = code + digits.lstrip("0")
+    return digits if 8 <= len(digits) <= 15 else None
+
+
+@lru_cache(maxsize=65536)
+def normalize_company(company: Optional[str]) -> Optional[str]:
+    if not company:
+        return None
+    words = [word for word in _WORDS.findall(company.lower()) if word not in _COMPANY_SUFFIXES]
+    return " ".join(words) or None
+
+
+@lru_cache(maxsize=65536)
+def name_trigrams(name: Optional[str]) -> frozenset:
+    """Trigrams as pg_trgm builds them: per word, padded with two spaces before, one after."""
+    grams = set()
+    for word in _WORDS.findall((name or "").lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> None:
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+
+def cluster_rows(
+    rows: Sequence[DedupRow],
+    name_similarity: float,
+    max_block_size: int,
+) -> Tuple[List[dict], dict]:
+    """Group one owner's contacts into duplicate clusters.
+
+    Every row gets its blocking keys in one pass: normalized email, E.164
+    phone, and (company, trigram) keys for its name. Rows sharing an email
+    or phone key are joined directly, without comparing pairs. Names are
+    only compared within a company block, and with prefix filtering: each
+    row indexes just its rarest trigrams, as many as two names need in
+    common to reach `name_similarity` (trigram Jaccard, pg_trgm's
+    similarity()). Blocks larger than `max_block_size` are skipped and
+    counted in the stats. Work grows with the rows and the pairs in each
+    block, not with all pairs.
+
+    Returns clusters of two or more ({"ids", "reasons"}), largest first,
+    and stats about the candidate pairs.
+    """
+    union_find = _UnionFind(len(rows))
+    reasons = []
+    # Plain dicts keyed by strings and ints: allocating a container per row
+    # costs more in garbage collection than in building it
+    exact_keys = (("email", normalize_email, {}), ("phone", normalize_phone, {}))
+    by_company = defaultdict(list)
+
+    for index, row in enumerate(rows):
+        for reason, normalize, seen_keys in exact_keys:
+            key = normalize(getattr(row, reason))
+            if key is None:
+                continue
+            first = seen_keys.setdefault(key, index)
+            if first != index:
+                union_find.union(first, index)
+                reasons.append((first, reason))
+        company = normalize_company(row.company)
+        grams = name_trigrams(row.name)
+        if company and grams:
+            by_company[company].append((index, grams))
+
+    # Names repeat a lot, so trigram counts and prefixes are worked out once
+    # per distinct name. One global order, rarest first, for every prefix.
+    name_counts = Counter(grams for members in by_company.values() for _, grams in members)
+    gram_counts: Counter = Counter()
+    for grams, count in name_counts.items():
+        for gram in grams:
+            gram_counts[gram] += count
+    rank = {gram: position for position, gram in enumerate(
+        sorted(gram_counts, key=lambda gram: (gram_counts[gram], gram)))}
+    prefixes = {}
+    for grams in name_counts:
+        ordered = sorted(grams, key=rank.__getitem__)
+        prefixes[grams] = ordered[:len(ordered) - ceil(name_similarity * len(ordered)) + 1]
+
+    size = len(rows)
+    candidate_pairs = skipped_blocks = 0
+    for members in by_company.values():
+        if len(members) < 2:
+            continue
+        blocks = defaultdict(list)
+        for member in members:
+            for gram in prefixes[member[1]]:
+                blocks[gram].append(member)
+        seen = set()
+        for block in blocks.values():
+            if len(block) < 2:
+                continue
+            if len(block) > max_block_size:
+                skipped_blocks += 1
+                continue
+            for position, (a, grams_a) in enumerate(block):
+                for b, grams_b in block[position + 1:]:
+                    pair = a * size + b
+                    if pair in seen:
+                        continue
+                    seen.add(pair)
+                    shared = len(grams_a & grams_b)
+                    if shared / (len(grams_a) + len(grams_b) - shared) >= name_similarity:
+                        union_find.union(a, b)
+                        reasons.append((a, "name"))
+        candidate_pairs += len(seen)
+
+    roots = [union_find.find(index) for index in range(size)]
+    sizes = Counter(roots)
+    members_of = defaultdict(list)
+    for index, root in enumerate(roots):
+        if sizes[root] > 1:
+            members_of[root].append(rows[index].id)
+    reasons_of = defaultdict(set)
+    for index, reason in reasons:
+        reasons_of[roots[index]].add(reason)
+
+    clusters = [
+        {"ids": sorted(ids), "reasons": sorted(reasons_of[root])}
+        for root, ids in members_of.items()
+    ]
+    clusters.sort(key=lambda cluster: (-len(cluster["ids"]), cluster["ids"][0]))
+    return clusters, {
+        "contacts_scanned": size,
+        "candidate_pairs": candidate_pairs,
+        "skipped_blocks": skipped_blocks,
+    }
+
+
+async def find_duplicates(db: AsyncSession, owner_id: int, limit: int = 100) -> dict:
+    """Duplicate clusters among the owner's contacts, with the contacts of the first `limit`.
+
+    One scan of the owner's contacts; the clustering runs in a worker thread.
+    """
+    result = await db.execute(
+        select(*DEDUP_COLUMNS).where(Contact.owner_id == owner_id).order_by(Contact.id))
+    rows = [DedupRow(*row) for row in result.all()]
+    clusters, stats = await run_in_threadpool(
+        cluster_rows, rows, settings.DEDUP_NAME_SIMILARITY, settings.DEDUP_MAX_BLOCK_SIZE)
+
+    page = clusters[:limit]
+    ids = [contact_id for cluster in page for contact_id in cluster["ids"]]
+    contacts = {}
+    if ids:
+        result = await db.execute(
+            select(*CONTACT_ROWS.columns)
+            .where(Contact.owner_id == owner_id, Contact.id.in_(ids)))
+        contacts = {row.id: CONTACT_ROWS.to_dict(row) for row in result.all()}
+
+    return {
+        **stats,
+        "total_clusters": len(clusters),
+        "truncated": len(clusters) > limit,
+        "clusters": [
+            {**cluster, "items": [contacts[contact_id] for contact_id in cluster["ids"]
+                                  if contact_id in contacts]}
+            for cluster in page
+        ],
+    }
+
+
+def _merged_values(survivor, duplicates: list) -> dict:
+    """Survivor's columns with gaps filled from the duplicates, oldest first."""
+    values = {}
+    for column in MERGE_FILL_COLUMNS:
+        if getattr(survivor, column) in (None, ""):
+            filled = next((getattr(row, column) for row in duplicates
+                           if getattr(row, column) not in (None, "")), None)
+            if filled is not None:
+                values[column] = filled
+
+    notes = []
+    for row in (survivor, *duplicates):
+        if row.notes and row.notes not in notes:
+            notes.append(row.notes)
+    if len(notes) > 1 or (notes and not survivor.notes):
+        values["notes"] = "\n".join(notes)
+
+    created = [row.created_at for row in (survivor, *duplicates) if row.created_at is not None]
+    if created and min(created) != survivor.created_at:
+        values["created_at"] = min(created)
+    return values
+
+
+async def merge_contacts(
+    db: AsyncSession,
+    owner_id: int,
+    survivor_id: int,
+    duplicate_ids: List[int]
+) -> Tuple[models.Contact, List[int]]:
+    """Fold the owner's duplicate contacts into survivor_id and delete them.
+
+    The rows are locked, the survivor updated and the duplicates deleted in
+    one transaction, so a concurrent edit or merge waits instead of being
+    lost. No table references contacts by id today; anything that starts to
+    must be repointed to survivor_id here, before the DELETE.
+    """
+    duplicate_ids = [id_ for id_ in dict.fromkeys(duplicate_ids) if id_ != survivor_id]
+    if not duplicate_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="duplicate_ids must name at least one contact other than survivor_id"
+        )
+    if len(duplicate_ids) > settings.DEDUP_MAX_MERGE_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"at most {settings.DEDUP_MAX_MERGE_IDS} duplicates per merge"
+        )
+
+    ids = [survivor_id, *duplicate_ids]
+    result = await db.execute(
+        select(Contact.id, Contact.notes, Contact.created_at,
+               *(getattr(Contact, column) for column in MERGE_FILL_COLUMNS))
+        .where(Contact.owner_id == owner_id, Contact.id.in_(ids))
+        .order_by(Contact.id)
+        .with_for_update()
+    )
+    found = {row.id: row for row in result.all()}
+    missing = [id_ for id_ in ids if id_ not in found]
+    if missing:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"contacts not found: {', '.join(map(str, missing))}"
+        )
+
+    duplicates = sorted((found[id_] for id_ in duplicate_ids),
+                        key=lambda row: (row.created_at is None, row.created_at, row.id))
+    values = _merged_values(found[survivor_id], duplicates)
+
+    await db.execute(
+        delete(Contact).where(Contact.owner_id == owner_id, Contact.id.in_(duplicate_ids)),
+        execution_options={"synchronize_session": False},
+    )
+    statement = update(Contact).where(Contact.id == survivor_id).returning(Contact)
+    if values:
+        statement = statement.values(**values)
+    else:
+        # Nothing to fill in: a no-op UPDATE still returns the row
+        statement = statement.values(id=Contact.id)
+    result = await db.execute(statement, execution_options={"synchronize_session": False})
+    contact = result.scalar_one()
+    await db.commit()
+    return contact, duplicate_ids
@@ -0,0 +1,71 @@
+import csv
+import io
+from typing import AsyncIterator, List
+
+import orjson
+from fastapi.responses import StreamingResponse
+from sqlalchemy.future import select
+
+from app import models
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.schemas.bulk import ExportFormat
+
+EXPORT_COLUMNS = {
+    "contacts": (models.Contact, ["id", "name", "email", "phone", "company", "source",
+                                  "status", "notes", "owner_id", "created_at"]),
+    "leads": (models.Lead, ["id", "name", "status", "source", "notes", "owner_id",
+                            "created_at"]),
+    "tasks": (models.Task, ["id", "head", "description", "status", "team_id", "assigned_to",
+                            "reporter", "owner_id", "created_at"]),
+}
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+
+def _ndjson_chunk(columns: List[str], rows) -> bytes:
+    return b"".join(orjson.dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+
+def _csv_chunk(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+async def _stream_rows(resource: str, clauses: list, fmt: ExportFormat,
+                       sessionmaker) -> AsyncIterator[bytes]:
+    model, columns = EXPORT_COLUMNS[resource]
+    chunk_rows = settings.EXPORT_CHUNK_ROWS
+    query = (
+        select(*(getattr(model, column) for column in columns))
+        .where(*clauses)
+        .order_by(model.id)
+        .execution_options(yield_per=chunk_rows)
+    )
+
+    if fmt == ExportFormat.csv:
+        yield _csv_chunk([columns])
+
+    # The request's get_db session is closed before the body is streamed, so
+    # the export holds its own session (and server-side cursor) until done.
+    async with sessionmaker() as db:
+        result = await db.stream(query)
+        async for rows in result.partitions(chunk_rows):
+            if fmt == ExportFormat.csv:
+                yield _csv_chunk(rows)
+            else:
+                yield _ndjson_chunk(columns, rows)
+
+
+def export_response(resource: str, clauses: list, fmt: ExportFormat,
+                    sessionmaker=AsyncSessionLocal) -> StreamingResponse:
+    """Stream every row matching `clauses` as NDJSON or CSV in fixed-size chunks."""
+    return StreamingResponse(
+        _stream_rows(resource, clauses, fmt, sessionmaker),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{resource}.{fmt.value}"'},
+    )
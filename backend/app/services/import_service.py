@@ -0,0 +1,192 @@
+import csv
+import logging
+from enum import Enum
+from itertools import islice
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+import orjson
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app import schemas
+from app.core.config import settings
+from app.schemas.bulk import ImportFormat
+
+logger = logging.getLogger(__name__)
+
+CONTACT_COLUMNS = ["name", "email", "phone", "company", "source", "status", "notes", "created_at"]
+LEAD_COLUMNS = ["name", "status", "source", "notes", "created_at"]
+
+
+def guess_format(filename: Optional[str]) -> ImportFormat:
+    if filename and filename.lower().endswith((".ndjson", ".jsonl")):
+        return ImportFormat.ndjson
+    return ImportFormat.csv
+
+
+def _malformed(line_no: int, problem: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Malformed file at line {line_no}: {problem}"
+    )
+
+
+def _decoded_lines(file: BinaryIO) -> Iterator[str]:
+    """The file's lines as text, decoded one by one so a bad byte has a line number."""
+    for line_no, line in enumerate(file, start=1):
+        try:
+            yield line.decode("utf-8-sig" if line_no == 1 else "utf-8")
+        except UnicodeDecodeError as exc:
+            raise _malformed(line_no, f"not UTF-8 ({exc.reason} at byte {exc.start + 1})")
+
+
+def _iter_rows(file: BinaryIO, fmt: ImportFormat) -> Iterator[Tuple[int, object]]:
+    """Yield (row number, dict or parse error) without reading the whole file.
+
+    Damage that stops the file from being read any further (bytes that are
+    not UTF-8, a CSV the csv module gives up on) raises a 400 instead; the
+    import has committed nothing at that point.
+    """
+    lines = _decoded_lines(file)
+    if fmt == ImportFormat.csv:
+        # reader.line_num lags by one when the line being parsed is the bad one
+        lines_read = 0
+
+        def counted() -> Iterator[str]:
+            nonlocal lines_read
+            for line in lines:
+                lines_read += 1
+                yield line
+
+        reader = csv.DictReader(counted())
+        try:
+            for row_no, row in enumerate(reader, start=1):
+                yield row_no, row
+        except csv.Error as exc:
+            raise _malformed(lines_read, str(exc))
+        return
+
+    for row_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = orjson.loads(line)
+        except orjson.JSONDecodeError as exc:
+            yield row_no, exc
+            continue
+        yield row_no, row if isinstance(row, dict) else ValueError("row is not an object")
+
+
+def _to_record(schema: type[BaseModel], columns: List[str], row: dict) -> tuple:
+    # CSV has no NULL, so empty cells mean "not provided"
+    values = {
+        key: value for key, value in row.items()
+        if key in schema.model_fields and value != ""
+    }
+    item = schema.model_validate(values)
+    record = []
+    for column in columns:
+        value = getattr(item, column)
+        if isinstance(value, str) and "\x00" in value:
+            # Postgres text cannot hold it; COPY would fail the whole import
+            raise ValueError(f"{column}: contains a NUL character")
+        record.append(value.value if isinstance(value, Enum) else value)
+    return tuple(record)
+
+
+def _format_errors(exc: Exception) -> List[str]:
+    if isinstance(exc, ValidationError):
+        return [
+            f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}"
+            for err in exc.errors()
+        ]
+    return [str(exc)]
+
+
+async def _import(
+    db: AsyncSession,
+    file: BinaryIO,
+    fmt: ImportFormat,
+    table: str,
+    schema: type[BaseModel],
+    columns: List[str],
+    owner_id: int
+) -> dict:
+    """Validate rows in batches, COPY them into a staging table, merge once.
+
+    Only one batch of rows and at most IMPORT_MAX_REPORTED_ERRORS errors are
+    held in memory at a time; the staging table lives until the commit.
+    """
+    if db.bind.dialect.driver != "asyncpg":
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Bulk import requires PostgreSQL with asyncpg"
+        )
+
+    staging = f"{table}_import_staging"
+    column_list = ", ".join(columns)
+    await db.execute(text(
+        f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {table} WITH NO DATA"
+    ))
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    copy_target = raw.driver_connection
+
+    rows = _iter_rows(file, fmt)
+    failed = 0
+    errors: List[dict] = []
+    max_errors = settings.IMPORT_MAX_REPORTED_ERRORS
+
+    while True:
+        # Reading and parsing touches the spooled upload file, keep it off the loop
+        batch = await run_in_threadpool(lambda: list(islice(rows, settings.IMPORT_BATCH_SIZE)))
+        if not batch:
+            break
+
+        records = []
+        for row_no, row in batch:
+            try:
+                if isinstance(row, Exception):
+                    raise row
+                records.append(_to_record(schema, columns, row))
+            except (ValidationError, ValueError, TypeError) as exc:
+                failed += 1
+                if len(errors) < max_errors:
+                    errors.append({"row": row_no, "errors": _format_errors(exc)})
+
+        if records:
+            await copy_target.copy_records_to_table(staging, records=records, columns=columns)
+
+    select_list = ", ".join(
+        "COALESCE(created_at, now())" if column == "created_at" else column
+        for column in columns
+    )
+    result = await db.execute(
+        text(
+            f"INSERT INTO {table} ({column_list}, owner_id) "
+            f"SELECT {select_list}, :owner_id FROM {staging}"
+        ),
+        {"owner_id": owner_id}
+    )
+    await db.commit()
+
+    inserted = result.rowcount
+    logger.info("Imported %s %s for owner %s (%s rejected)", inserted, table, owner_id, failed)
+    return {
+        "inserted": inserted,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors),
+    }
+
+
+async def import_contacts(db: AsyncSession, file: BinaryIO, fmt: ImportFormat, owner_id: int) -> dict:
+    return await _import(db, file, fmt, "contacts", schemas.ContactCreate, CONTACT_COLUMNS, owner_id)
+
+
+async def import_leads(db: AsyncSession, file: BinaryIO, fmt: ImportFormat, owner_id: int) -> dict:
+    return await _import(db, file, fmt, "leads", schemas.LeadCreate, LEAD_COLUMNS, owner_id)
@@ -0,0 +1,262 @@
+import random
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from sqlalchemy import Row, and_, delete, func, insert, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models
+from app.core.config import settings
+
+Job = models.Job
+
+# LISTEN/NOTIFY channel: enqueue notifies it (on commit) with the job type,
+# so idle workers wake at once instead of at their next poll
+NOTIFY_CHANNEL = "jobs"
+
+UNFINISHED = ("queued", "running")
+
+
+class JobType(NamedTuple):
+    name: str
+    handler: Callable[[dict], Awaitable[None]]
+    # Jobs of this type one worker process runs at once; None for no limit
+    concurrency: Optional[int]
+    timeout: float
+    max_attempts: int
+
+
+JOB_TYPES: Dict[str, JobType] = {}
+
+
+def job_type(
+    name: str,
+    concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    max_attempts: Optional[int] = None
+):
+    """Register `async def handler(payload: dict)` as the runner of `name` jobs.
+
+    Handlers must be safe to run twice for the same job: a worker that dies
+    after the work but before recording it leaves the job to be claimed again.
+    """
+    def register(handler):
+        JOB_TYPES[name] = JobType(
+            name, handler, concurrency,
+            settings.JOB_TIMEOUT_SECONDS if timeout is None else timeout,
+            settings.JOB_MAX_ATTEMPTS if max_attempts is None else max_attempts,
+        )
+        return handler
+    return register
+
+
+def _max_attempts(type_: str, max_attempts: Optional[int]) -> int:
+    if max_attempts is not None:
+        return max_attempts
+    registered = JOB_TYPES.get(type_)
+    return registered.max_attempts if registered else settings.JOB_MAX_ATTEMPTS
+
+
+async def enqueue(
+    db: AsyncSession,
+    type_: str,
+    payload: Optional[dict] = None,
+    priority: int = 0,
+    run_at: Optional[datetime] = None,
+    max_attempts: Optional[int] = None
+) -> int:
+    """Add a job in the caller's transaction and return its id.
+
+    Nothing is committed here: the job becomes visible to workers when the
+    caller commits, together with the rows it refers to, and disappears if
+    the caller rolls back. Higher `priority` runs first within a type.
+    """
+    values = {
+        "type": type_,
+        "payload": payload or {},
+        "priority": priority,
+        "max_attempts": _max_attempts(type_, max_attempts),
+    }
+    if run_at is not None:
+        values["run_at"] = run_at
+    result = await db.execute(insert(Job).values(**values).returning(Job.id))
+    await db.execute(select(func.pg_notify(NOTIFY_CHANNEL, type_)))
+    return result.scalar_one()
+
+
+async def enqueue_many(
+    db: AsyncSession,
+    type_: str,
+    payloads: Iterable[dict],
+    priority: int = 0,
+    max_attempts: Optional[int] = None
+) -> int:
+    """enqueue() for many payloads of one type in a single INSERT; returns the count."""
+    attempts = _max_attempts(type_, max_attempts)
+    rows = [{"type": type_, "payload": payload, "priority": priority, "max_attempts": attempts}
+            for payload in payloads]
+    if not rows:
+        return 0
+    await db.execute(insert(Job), rows)
+    await db.execute(select(func.pg_notify(NOTIFY_CHANNEL, type_)))
+    return len(rows)
+
+
+def _visible_until():
+    return func.now() + timedelta(seconds=settings.JOB_VISIBILITY_TIMEOUT_SECONDS)
+
+
+async def claim(db: AsyncSession, worker_id: str, type_: str, limit: int) -> List[Row]:
+    """Lock up to `limit` due jobs of one type for `worker_id` and return them.
+
+    Due means queued with run_at passed, or running with locked_until passed
+    (its worker is gone). SKIP LOCKED passes over rows another worker is
+    claiming right now, so concurrent claims neither wait nor overlap. The
+    claim counts as an attempt, so a job that keeps killing or hanging its
+    worker still runs out of attempts: expired jobs with none left are
+    marked failed here instead of being claimed again. Commit right after
+    to release the row locks.
+    """
+    now = func.now()
+    exhausted = (
+        select(Job.id)
+        .where(
+            Job.type == type_,
+            Job.status == "running",
+            Job.locked_until < now,
+            Job.attempts >= Job.max_attempts,
+        )
+        .with_for_update(skip_locked=True)
+        .cte("exhausted")
+    )
+    await db.execute(
+        update(Job)
+        .where(Job.id == exhausted.c.id)
+        .values(status="failed", finished_at=now, locked_by=None, locked_until=None,
+                last_error="lock expired: the worker died or hung on the last attempt"),
+        execution_options={"synchronize_session": False},
+    )
+
+    picked = (
+        select(Job.id)
+        .where(
+            Job.type == type_,
+            Job.status.in_(UNFINISHED),
+            or_(and_(Job.status == "queued", Job.run_at <= now),
+                and_(Job.status == "running", Job.locked_until < now,
+                     Job.attempts < Job.max_attempts)),
+        )
+        .order_by(Job.priority.desc(), Job.run_at, Job.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .cte("picked")
+    )
+    result = await db.execute(
+        update(Job)
+        .where(Job.id == picked.c.id)
+        .values(status="running", attempts=Job.attempts + 1,
+                locked_by=worker_id, locked_until=_visible_until())
+        .returning(Job.id, Job.type, Job.payload, Job.attempts, Job.max_attempts),
+        execution_options={"synchronize_session": False},
+    )
+    return result.all()
+
+
+def _held_by(worker_id: str, ids: List[int]):
+    # A job whose lock expired may have been claimed by another worker since;
+    # only the current holder may finish, extend or release it
+    return and_(Job.id.in_(ids), Job.status == "running", Job.locked_by == worker_id)
+
+
+async def complete(db: AsyncSession, worker_id: str, ids: List[int]) -> int:
+    result = await db.execute(
+        update(Job)
+        .where(_held_by(worker_id, ids))
+        .values(status="done", finished_at=func.now(), locked_by=None, locked_until=None,
+                last_error=None),
+        execution_options={"synchronize_session": False},
+    )
+    return result.rowcount
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with full jitter, capped at JOB_RETRY_BACKOFF_MAX_SECONDS."""
+    ceiling = min(settings.JOB_RETRY_BACKOFF_MAX_SECONDS,
+                  settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+async def fail(db: AsyncSession, worker_id: str, job: Row, error: str) -> str:
+    """Record a failed run: back to queued after a backoff, or failed for good.
+
+    Returns the job's new status.
+    """
+    if job.attempts >= job.max_attempts:
+        values = {"status": "failed", "finished_at": func.now()}
+    else:
+        values = {"status": "queued",
+                  "run_at": func.now() + timedelta(seconds=retry_delay(job.attempts))}
+    await db.execute(
+        update(Job)
+        .where(_held_by(worker_id, [job.id]))
+        .values(**values, locked_by=None, locked_until=None, last_error=error[:2000]),
+        execution_options={"synchronize_session": False},
+    )
+    return values["status"]
+
+
+async def extend(db: AsyncSession, worker_id: str, ids: List[int]) -> None:
+    """Heartbeat: push locked_until out for jobs still running on this worker."""
+    await db.execute(
+        update(Job).where(_held_by(worker_id, ids)).values(locked_until=_visible_until()),
+        execution_options={"synchronize_session": False},
+    )
+
+
+async def release(db: AsyncSession, worker_id: str, ids: List[int]) -> None:
+    """Hand unfinished jobs back on shutdown, without using up an attempt."""
+    await db.execute(
+        update(Job)
+        .where(_held_by(worker_id, ids))
+        .values(status="queued", run_at=func.now(), attempts=Job.attempts - 1,
+                locked_by=None, locked_until=None),
+        execution_options={"synchronize_session": False},
+    )
+
+
+async def purge_finished(db: AsyncSession, older_than_hours: float, batch: int = 1000) -> int:
+    """Delete up to `batch` jobs that finished successfully before the cutoff."""
+    cutoff = func.now() - timedelta(hours=older_than_hours)
+    old = (
+        select(Job.id)
+        .where(Job.status == "done", Job.finished_at < cutoff)
+        .limit(batch)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        delete(Job).where(Job.id.in_(old)),
+        execution_options={"synchronize_session": False},
+    )
+    return result.rowcount
+
+
+async def stats(db: AsyncSession) -> dict:
+    """Jobs per type and status, and how overdue the oldest due job of each type is."""
+    result = await db.execute(
+        select(Job.type, Job.status, func.count())
+        .group_by(Job.type, Job.status)
+        .order_by(Job.type, Job.status)
+    )
+    by_type: Dict[str, dict] = {}
+    for type_, status, count in result.all():
+        by_type.setdefault(type_, {})[status] = count
+
+    result = await db.execute(
+        select(Job.type, func.extract("epoch", func.now() - func.min(Job.run_at)))
+        .where(Job.status == "queued", Job.run_at <= func.now())
+        .group_by(Job.type)
+    )
+    for type_, lag in result.all():
+        by_type.setdefault(type_, {})["oldest_due_seconds"] = float(lag)
+    return by_type
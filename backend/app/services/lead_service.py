@@ -0,0 +1,85 @@
+from typing import List, Optional
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models, schemas
+from app.utils.sql import column_values
+
+
+# Writes use INSERT/UPDATE/DELETE ... RETURNING: one round trip instead of
+# SELECT + flush + refresh. The response cache needs no notice: triggers on
+# leads bump the owner's cache generation in the same transaction.
+
+async def create_lead(db: AsyncSession, owner_id: int, lead_in: schemas.LeadCreate) -> models.Lead:
+    result = await db.execute(
+        insert(models.Lead)
+        .values(**column_values(lead_in, exclude_none=True), owner_id=owner_id)
+        .returning(models.Lead)
+    )
+    lead = result.scalar_one()
+    await db.commit()
+    return lead
+
+
+async def get_lead(db: AsyncSession, owner_id: int, lead_id: int) -> Optional[models.Lead]:
+    result = await db.execute(select(models.Lead).where(
+        models.Lead.id == lead_id, models.Lead.owner_id == owner_id))
+    return result.scalar_one_or_none()
+
+
+async def update_lead(
+    db: AsyncSession,
+    owner_id: int,
+    lead_id: int,
+    lead_in: schemas.LeadUpdate
+) -> Optional[models.Lead]:
+    values = column_values(lead_in, exclude_unset=True)
+    if not values:
+        return await get_lead(db, owner_id, lead_id)
+    result = await db.execute(
+        update(models.Lead)
+        .where(models.Lead.id == lead_id, models.Lead.owner_id == owner_id)
+        .values(**values)
+        .returning(models.Lead),
+        execution_options={"synchronize_session": False},
+    )
+    lead = result.scalar_one_or_none()
+    if lead is None:
+        return None
+    await db.commit()
+    return lead
+
+
+async def delete_lead(db: AsyncSession, owner_id: int, lead_id: int) -> bool:
+    result = await db.execute(
+        delete(models.Lead)
+        .where(models.Lead.id == lead_id, models.Lead.owner_id == owner_id)
+        .returning(models.Lead.id),
+        execution_options={"synchronize_session": False},
+    )
+    if result.scalar_one_or_none() is None:
+        return False
+    await db.commit()
+    return True
+
+
+async def search_leads_by_name(
+    db: AsyncSession,
+    owner_id: int,
+    name: Optional[str] = None,
+    status: Optional[str] = None,
+    source: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 10
+) -> List[models.Lead]:
+    query = select(models.Lead).where(models.Lead.owner_id == owner_id)
+    if name:
+        query = query.where(models.Lead.name.ilike(f"%{name}"))
+    if status:
+        query = query.where(models.Lead.status == status)
+    if source:
+        query = query.where(models.Lead.source.ilike(f"%{source}"))
+    result = await db.execute(query.order_by(models.Lead.id).offset(skip).limit(limit))
+    return result.scalars().all()
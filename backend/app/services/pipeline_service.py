@@ -0,0 +1,139 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, or_, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models
+
+PipelineCounter = models.PipelineCounter
+
+# Dashboard key for each counter kind other than lead_day
+GROUPED_KINDS = {
+    "lead_status": "leads_by_status",
+    "lead_source": "leads_by_source",
+    "contact_status": "contacts_by_status",
+}
+
+# What the triggers from the pipeline_counters migration maintain, computed
+# from scratch. Bucket expressions must match the migration's COUNTERS.
+ACTUAL_COUNTS = """
+    SELECT owner_id, 'lead_status' AS kind, coalesce(status, 'none') AS bucket, count(*) AS n
+    FROM leads WHERE owner_id IS NOT NULL {owner} GROUP BY 1, 2, 3
+    UNION ALL
+    SELECT owner_id, 'lead_source', coalesce(source, 'none'), count(*)
+    FROM leads WHERE owner_id IS NOT NULL {owner} GROUP BY 1, 2, 3
+    UNION ALL
+    SELECT owner_id, 'lead_day', to_char(created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD'), count(*)
+    FROM leads WHERE owner_id IS NOT NULL AND created_at IS NOT NULL {owner} GROUP BY 1, 2, 3
+    UNION ALL
+    SELECT owner_id, 'contact_status', coalesce(status, 'none'), count(*)
+    FROM contacts WHERE owner_id IS NOT NULL {owner} GROUP BY 1, 2, 3
+"""
+
+DRIFT = """
+    WITH actual AS ({actual}),
+    stored AS (SELECT owner_id, kind, bucket, n FROM pipeline_counters WHERE n <> 0 {owner})
+    SELECT owner_id, kind, bucket,
+           coalesce(stored.n, 0) AS stored, coalesce(actual.n, 0) AS actual,
+           count(*) OVER () AS drift_rows
+    FROM actual FULL JOIN stored USING (owner_id, kind, bucket)
+    WHERE coalesce(stored.n, 0) <> coalesce(actual.n, 0)
+    ORDER BY owner_id, kind, bucket
+    LIMIT :max_reported
+"""
+
+REBUILD = """
+    INSERT INTO pipeline_counters (owner_id, kind, bucket, n)
+    SELECT owner_id, kind, bucket, n FROM ({actual}) actual
+"""
+
+
+def dashboard_query(owner_id: int, first_day: date):
+    """The owner's status/source buckets and lead_day buckets from first_day on."""
+    return (
+        select(PipelineCounter.kind, PipelineCounter.bucket, PipelineCounter.n)
+        .where(
+            PipelineCounter.owner_id == owner_id,
+            PipelineCounter.n != 0,
+            or_(
+                PipelineCounter.kind.in_(GROUPED_KINDS),
+                (PipelineCounter.kind == "lead_day")
+                & (PipelineCounter.bucket >= first_day.isoformat()),
+            ),
+        )
+    )
+
+
+async def get_dashboard(db: AsyncSession, owner_id: int, days: int = 90) -> dict:
+    """Pipeline counts for one owner, read from pipeline_counters.
+
+    Touches one row per bucket (statuses, sources and the last `days` days),
+    however many leads and contacts the owner has.
+    """
+    today = datetime.now(timezone.utc).date()
+    first_day = today - timedelta(days=days - 1)
+    result = await db.execute(dashboard_query(owner_id, first_day))
+
+    dashboard = {key: {} for key in GROUPED_KINDS.values()}
+    per_day = {}
+    for kind, bucket, n in result.all():
+        if kind == "lead_day":
+            per_day[bucket] = n
+        else:
+            dashboard[GROUPED_KINDS[kind]][bucket] = n
+
+    dashboard["new_leads_per_day"] = [
+        {"day": day, "count": per_day.get(day.isoformat(), 0)}
+        for day in (first_day + timedelta(days=offset) for offset in range(days))
+    ]
+    return dashboard
+
+
+async def reconcile(
+    db: AsyncSession,
+    owner_id: Optional[int] = None,
+    apply: bool = True,
+    max_reported: int = 1000
+) -> dict:
+    """Compare pipeline_counters with a full GROUP BY and optionally rebuild it.
+
+    Checking runs in a single statement, so it sees the counters and the rows
+    at the same snapshot and needs no lock. Rebuilding takes a SHARE lock on
+    leads and contacts (writers wait, readers do not) for the recount; pass
+    owner_id to keep that short.
+    """
+    owner = "AND owner_id = :owner_id" if owner_id is not None else ""
+    params = {"owner_id": owner_id} if owner_id is not None else {}
+    actual = ACTUAL_COUNTS.format(owner=owner)
+
+    if apply:
+        await db.execute(text("LOCK TABLE leads, contacts IN SHARE MODE"))
+
+    result = await db.execute(
+        text(DRIFT.format(actual=actual, owner=owner)),
+        {**params, "max_reported": max_reported},
+    )
+    rows = result.mappings().all()
+    drift_rows = rows[0]["drift_rows"] if rows else 0
+
+    applied = False
+    if apply and drift_rows:
+        clear = delete(PipelineCounter)
+        if owner_id is not None:
+            clear = clear.where(PipelineCounter.owner_id == owner_id)
+        await db.execute(clear)
+        await db.execute(text(REBUILD.format(actual=actual)), params)
+        applied = True
+    await db.commit()
+
+    return {
+        "drift_rows": drift_rows,
+        "drift": [
+            {key: row[key] for key in ("owner_id", "kind", "bucket", "stored", "actual")}
+            for row in rows
+        ],
+        "drift_truncated": drift_rows > len(rows),
+        "applied": applied,
+    }
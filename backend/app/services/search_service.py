@@ -0,0 +1,256 @@
+from datetime import datetime, time, timedelta
+from enum import Enum
+from typing import List, Optional, Tuple
+
+from sqlalchemy import Row, cast, func, or_, text
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models
+from app.services.count_service import CountMode, count_cache_key, count_rows
+from app.utils.serialization import CONTACT_ROWS, LEAD_ROWS, TASK_ROWS
+
+# pg_trgm's own default for the %> (word similarity) operator
+DEFAULT_MIN_SIMILARITY = 0.6
+
+# Text search configuration the generated search_vector columns are built with
+FTS_CONFIG = "english"
+
+# ts_headline: up to two short fragments around the matched terms
+HEADLINE_OPTIONS = 'MaxFragments=2, MaxWords=18, MinWords=6, FragmentDelimiter=" ... "'
+
+
+class SearchMode(str, Enum):
+    trigram = "trigram"
+    fulltext = "fulltext"
+
+
+def contact_filters(
+    owner_id: int,
+    status: Optional[str] = None,
+    source: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> list:
+    """WHERE clauses shared by contact listing and contact search."""
+    clauses = [models.Contact.owner_id == owner_id]
+    if status:
+        clauses.append(models.Contact.status == status)
+    if source:
+        clauses.append(models.Contact.source == source)
+    if start_date:
+        clauses.append(models.Contact.created_at >= start_date)
+    if end_date:
+        clauses.append(models.Contact.created_at <= end_date)
+    return clauses
+
+
+def lead_filters(
+    owner_id: int,
+    status: Optional[str] = None,
+    source: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None
+) -> list:
+    """WHERE clauses shared by lead listing and lead search."""
+    clauses = [models.Lead.owner_id == owner_id]
+    if status:
+        clauses.append(models.Lead.status == status)
+    if source:
+        clauses.append(models.Lead.source == source)
+    if created_after:
+        clauses.append(models.Lead.created_at >= created_after)
+    if created_before:
+        # Whole days up to and including created_before, kept sargable
+        next_day = datetime.combine(
+            created_before.date() + timedelta(days=1), time.min,
+            tzinfo=created_before.tzinfo)
+        clauses.append(models.Lead.created_at < next_day)
+    return clauses
+
+
+def task_filters(
+    owner_id: int,
+    status: Optional[str] = None,
+    assigned_to: Optional[int] = None,
+    team_id: Optional[int] = None
+) -> list:
+    """WHERE clauses for task listing and export."""
+    clauses = [models.Task.owner_id == owner_id]
+    if status:
+        clauses.append(models.Task.status == status)
+    if assigned_to is not None:
+        clauses.append(models.Task.assigned_to == assigned_to)
+    if team_id is not None:
+        clauses.append(models.Task.team_id == team_id)
+    return clauses
+
+
+def trigram_match(columns: list, q: str):
+    """Word-similarity match (column %> q) on any column.
+
+    word_similarity scores q against the best-matching stretch of the column,
+    so a substring hit on whole words scores 1 and a typo a little less; one
+    threshold (set_similarity_threshold) governs both. The operator is served
+    by the gin_trgm_ops indexes on these columns, combined with a BitmapOr.
+    """
+    return or_(*(column.op("%>")(q) for column in columns))
+
+
+def trigram_rank(columns: list, q: str):
+    return func.greatest(*(func.word_similarity(q, column) for column in columns))
+
+
+async def set_similarity_threshold(db: AsyncSession, min_similarity: Optional[float]) -> None:
+    """Set the %> operator threshold for the current transaction only."""
+    threshold = DEFAULT_MIN_SIMILARITY if min_similarity is None else min_similarity
+    await db.execute(
+        text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+        {"threshold": str(threshold)}
+    )
+
+
+def contact_search_query(owner_id: int, q: str, **filters):
+    columns = [models.Contact.name, models.Contact.email]
+    return select(*CONTACT_ROWS.columns).where(
+        *contact_filters(owner_id, **filters), trigram_match(columns, q))
+
+
+def lead_search_query(owner_id: int, q: str, **filters):
+    columns = [models.Lead.name, models.Lead.notes]
+    return select(*LEAD_ROWS.columns).where(
+        *lead_filters(owner_id, **filters), trigram_match(columns, q))
+
+
+def task_search_query(owner_id: int, q: str, **filters):
+    return select(*TASK_ROWS.columns).where(
+        *task_filters(owner_id, **filters), trigram_match([models.Task.head], q))
+
+
+async def _run_search(db, resource, owner_id, q, query, rank, id_column,
+                      skip, limit, min_similarity, count_mode, filters):
+    await set_similarity_threshold(db, min_similarity)
+
+    cache_key = count_cache_key(resource, owner_id, q=q,
+                                min_similarity=min_similarity, **filters)
+    counted = await count_rows(db, query, count_mode, cache_key)
+
+    page_query = query.order_by(rank.desc(), id_column).offset(skip).limit(limit)
+    result = await db.execute(page_query)
+    return result.all(), counted
+
+
+async def search_contacts(
+    db: AsyncSession,
+    owner_id: int,
+    q: str,
+    skip: int = 0,
+    limit: int = 10,
+    min_similarity: Optional[float] = None,
+    count_mode: CountMode = CountMode.exact,
+    **filters
+) -> Tuple[List[Row], dict]:
+    """Owner-scoped contact search on name/email; returns (ContactOut rows, count fields)."""
+    query = contact_search_query(owner_id, q, **filters)
+    rank = trigram_rank([models.Contact.name, models.Contact.email], q)
+    return await _run_search(db, "contacts", owner_id, q, query, rank, models.Contact.id,
+                             skip, limit, min_similarity, count_mode, filters)
+
+
+async def search_leads(
+    db: AsyncSession,
+    owner_id: int,
+    q: str,
+    skip: int = 0,
+    limit: int = 10,
+    min_similarity: Optional[float] = None,
+    count_mode: CountMode = CountMode.exact,
+    **filters
+) -> Tuple[List[Row], dict]:
+    """Owner-scoped lead search on name/notes; returns (LeadOut rows, count fields)."""
+    query = lead_search_query(owner_id, q, **filters)
+    rank = trigram_rank([models.Lead.name, models.Lead.notes], q)
+    return await _run_search(db, "leads", owner_id, q, query, rank, models.Lead.id,
+                             skip, limit, min_similarity, count_mode, filters)
+
+
+async def search_tasks(
+    db: AsyncSession,
+    owner_id: int,
+    q: str,
+    skip: int = 0,
+    limit: int = 10,
+    min_similarity: Optional[float] = None,
+    count_mode: CountMode = CountMode.exact,
+    **filters
+) -> Tuple[List[Row], dict]:
+    """Owner-scoped task search on head; returns (TaskOut rows, count fields)."""
+    query = task_search_query(owner_id, q, **filters)
+    rank = trigram_rank([models.Task.head], q)
+    return await _run_search(db, "tasks", owner_id, q, query, rank, models.Task.id,
+                             skip, limit, min_similarity, count_mode, filters)
+
+
+# resource -> (model, row serializer, filter builder, columns in search_vector)
+FULLTEXT_TARGETS = {
+    "contacts": (models.Contact, CONTACT_ROWS, contact_filters, ("name", "company", "notes")),
+    "leads": (models.Lead, LEAD_ROWS, lead_filters, ("name", "notes")),
+    "tasks": (models.Task, TASK_ROWS, task_filters, ("head", "description")),
+}
+
+
+def websearch_query(q: str):
+    """`q` in web search syntax: words, "quoted phrases", OR and -excluded terms."""
+    return func.websearch_to_tsquery(cast(FTS_CONFIG, REGCONFIG), q)
+
+
+def fulltext_query(resource: str, owner_id: int, q: str, **filters):
+    model, rows, build_filters, _ = FULLTEXT_TARGETS[resource]
+    return select(*rows.columns).where(
+        *build_filters(owner_id, **filters),
+        model.search_vector.op("@@")(websearch_query(q)))
+
+
+async def search_fulltext(
+    db: AsyncSession,
+    resource: str,
+    owner_id: int,
+    q: str,
+    skip: int = 0,
+    limit: int = 10,
+    count_mode: CountMode = CountMode.exact,
+    **filters
+) -> Tuple[List[Row], dict, dict]:
+    """Ranked full-text search over the generated search_vector column.
+
+    Matches use the GIN index on search_vector and are ordered by
+    ts_rank_cd (name/head weighted above company, above notes/description).
+    ts_headline re-parses the source text, so it runs in an outer query over
+    the returned page only. Returns (*Out rows, count fields, snippets by id).
+    """
+    model, rows, _, text_columns = FULLTEXT_TARGETS[resource]
+    tsquery = websearch_query(q)
+    query = fulltext_query(resource, owner_id, q, **filters)
+
+    cache_key = count_cache_key(resource, owner_id, q=q, search=SearchMode.fulltext, **filters)
+    counted = await count_rows(db, query, count_mode, cache_key)
+
+    rank = func.ts_rank_cd(model.search_vector, tsquery).label("rank")
+    page = (
+        query.add_columns(rank)
+        .order_by(rank.desc(), model.id)
+        .offset(skip)
+        .limit(limit)
+        .subquery("page")
+    )
+    document = func.concat_ws(" ", *(page.c[column] for column in text_columns))
+    headline = func.ts_headline(cast(FTS_CONFIG, REGCONFIG), document, tsquery, HEADLINE_OPTIONS)
+    result = await db.execute(
+        select(*(page.c[field] for field in rows.fields), headline)
+        .order_by(page.c.rank.desc(), page.c.id)
+    )
+    items = result.all()
+    id_index = rows.fields.index("id")
+    highlights = {str(row[id_index]): row[-1] for row in items}
+    return items, counted, highlights
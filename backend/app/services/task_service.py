@@ -0,0 +1,196 @@
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, String, column, delete, func, insert, literal, true, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app import models, schemas
+from app.core.config import settings
+from app.services.count_service import CountMode, count_cache_key, count_rows
+from app.services.search_service import task_filters
+from app.utils.pagination import apply_keyset, apply_sort, decode_cursor, next_cursor
+from app.utils.serialization import TASK_ROWS
+from app.utils.sql import column_values
+
+TASK_SORT_FIELDS = {"id", "head", "status", "team_id", "assigned_to", "created_at"}
+
+# Nullable in the schema but NOT NULL in the table
+REQUIRED_COLUMNS = ("team_id", "assigned_to")
+
+
+def _check_required(values: dict, creating: bool) -> None:
+    missing = [
+        column for column in REQUIRED_COLUMNS
+        if (creating or column in values) and values.get(column) is None
+    ]
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{', '.join(missing)} required"
+        )
+
+
+# Writes use INSERT/UPDATE/DELETE ... RETURNING like lead_service.
+
+async def create_task(db: AsyncSession, owner_id: int, task_in: schemas.TaskCreate) -> models.Task:
+    values = column_values(task_in, exclude_none=True)
+    _check_required(values, creating=True)
+    result = await db.execute(
+        insert(models.Task).values(**values, owner_id=owner_id).returning(models.Task)
+    )
+    task = result.scalar_one()
+    await db.commit()
+    return task
+
+
+async def get_task(db: AsyncSession, owner_id: int, task_id: int) -> Optional[models.Task]:
+    result = await db.execute(select(models.Task).where(
+        models.Task.id == task_id, models.Task.owner_id == owner_id))
+    return result.scalar_one_or_none()
+
+
+async def update_task(
+    db: AsyncSession,
+    owner_id: int,
+    task_id: int,
+    task_in: schemas.TaskUpdate
+) -> Optional[models.Task]:
+    values = column_values(task_in, exclude_unset=True)
+    _check_required(values, creating=False)
+    if not values:
+        return await get_task(db, owner_id, task_id)
+    result = await db.execute(
+        update(models.Task)
+        .where(models.Task.id == task_id, models.Task.owner_id == owner_id)
+        .values(**values)
+        .returning(models.Task),
+        execution_options={"synchronize_session": False},
+    )
+    task = result.scalar_one_or_none()
+    if task is None:
+        return None
+    await db.commit()
+    return task
+
+
+async def delete_task(db: AsyncSession, owner_id: int, task_id: int) -> bool:
+    result = await db.execute(
+        delete(models.Task)
+        .where(models.Task.id == task_id, models.Task.owner_id == owner_id)
+        .returning(models.Task.id),
+        execution_options={"synchronize_session": False},
+    )
+    if result.scalar_one_or_none() is None:
+        return False
+    await db.commit()
+    return True
+
+
+async def list_tasks(
+    db: AsyncSession,
+    owner_id: int,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    sort_by: Optional[str] = "id",
+    sort_order: Optional[str] = "asc",
+    count_mode: CountMode = CountMode.exact,
+    **filters
+) -> dict:
+    """One page of TaskOut rows with count fields and next_cursor.
+
+    Filters are those of task_filters (status, assigned_to, team_id).
+    """
+    query = select(*TASK_ROWS.columns).where(*task_filters(owner_id, **filters))
+
+    if sort_by not in TASK_SORT_FIELDS:
+        sort_by = "id"
+    sort_order = "desc" if sort_order == "desc" else "asc"
+    sort_column = getattr(models.Task, sort_by)
+
+    counted = await count_rows(
+        db, query, count_mode, count_cache_key("tasks", owner_id, **filters))
+
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_by, sort_order)
+        query = apply_keyset(query, sort_column, models.Task.id, sort_order, value, last_id)
+    else:
+        query = query.offset(skip)
+    query = apply_sort(query, sort_column, models.Task.id, sort_order)
+
+    result = await db.execute(query.limit(limit + 1))
+    tasks = result.all()
+    return {
+        **counted,
+        "items": tasks[:limit],
+        "next_cursor": next_cursor(tasks, limit, sort_by, sort_order),
+    }
+
+
+def board_query(owner_id: int, per_column: int, capped: bool = False, **filters):
+    """Newest `per_column` tasks and a total for every TaskStatus as one SELECT.
+
+    A VALUES list of statuses drives two LATERAL subqueries per status: the
+    count and the top-N by created_at, both range scans of
+    idx_tasks_owner_status_created. Rows are (status, total, *TASK_ROWS
+    columns), with NULL task columns for an empty status. A capped count
+    stops at COUNT_CAP + 1 rows.
+    """
+    statuses = values(
+        column("position", Integer), column("status", String), name="board_status"
+    ).data([(position, status.value) for position, status in enumerate(schemas.TaskStatus)])
+    in_column = [*task_filters(owner_id, **filters), models.Task.status == statuses.c.status]
+
+    counted = select(literal(1)).where(*in_column).correlate(statuses)
+    if capped:
+        counted = counted.limit(settings.COUNT_CAP + 1)
+    totals = select(func.count().label("total")).select_from(counted.subquery()).lateral("totals")
+
+    top = (
+        select(*TASK_ROWS.columns)
+        .where(*in_column)
+        .order_by(models.Task.created_at.desc(), models.Task.id.desc())
+        .limit(per_column)
+        .lateral("top")
+    )
+
+    return (
+        select(statuses.c.status, totals.c.total, *top.c)
+        .select_from(statuses.join(totals, true()).outerjoin(top, true()))
+        .order_by(statuses.c.position, top.c.created_at.desc(), top.c.id.desc())
+    )
+
+
+async def get_board(
+    db: AsyncSession,
+    owner_id: int,
+    per_column: int = 20,
+    count_mode: CountMode = CountMode.exact,
+    **filters
+) -> dict:
+    """Board columns in TaskStatus order from a single board_query round trip.
+
+    Filters are task_filters' assigned_to and team_id. count_mode capped
+    stops each column's count at COUNT_CAP; the other modes count exactly.
+    """
+    capped = CountMode(count_mode) == CountMode.capped
+    result = await db.execute(board_query(owner_id, per_column, capped, **filters))
+
+    columns = {}
+    for row in result.all():
+        status_value, total, task = row[0], row[1], row[2:]
+        board_column = columns.get(status_value)
+        if board_column is None:
+            board_column = columns[status_value] = {
+                "status": status_value,
+                "total": min(total, settings.COUNT_CAP) if capped else total,
+                "total_capped": capped and total > settings.COUNT_CAP,
+                "items": [],
+            }
+        if task[0] is not None:
+            board_column["items"].append(task)
+    return {
+        "total_mode": (CountMode.capped if capped else CountMode.exact).value,
+        "columns": list(columns.values()),
+    }
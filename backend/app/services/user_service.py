@@ -3,20 +3,24 @@ from sqlalchemy import text
 from sqlalchemy.future import select
 from sqlalchemy import desc, asc, or_, func
 from app import models, schemas
-from app.core.security import get_password_hashed, verify_password
+from app.core.security import invalidate_user
+from app.core.hashing import password_hasher
 from typing import List, Optional
 from app.models.user import User
+from app.services.count_service import CountMode, count_cache_key, count_rows
+from app.utils.pagination import apply_keyset, apply_sort, decode_cursor
 
 
 async def create_user(db: AsyncSession, user_in: schemas.UserCreate) -> models.User:
-    hashed_password = get_password_hashed(user_in.password)
+    """Add the user and flush; the caller commits, together with anything queued for it."""
+    hashed_password = await password_hasher.hash(user_in.password)
     db_user = models.user.User(
         name=user_in.name,
         email=user_in.email,
         hashed_password=hashed_password
     )
     db.add(db_user)
-    await db.commit()
+    await db.flush()
     await db.refresh(db_user)
     return db_user
 
@@ -28,19 +32,21 @@ async def authenticate_user(db: AsyncSession, email: str, password: str) -> mode
     user = result.scalars().first()
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await password_hasher.verify(password, user.hashed_password):
         return None
     return user
 
 
 async def update_user(db: AsyncSession, user: models.User, update: schemas.UserUpdate) -> models.User:
+    previous_email = user.email
     if update.name:
         user.name = update.name
     if update.email:
         user.email = update.email
     if update.password:
-        user.hashed_password = get_password_hashed(update.password)
+        user.hashed_password = await password_hasher.hash(update.password)
     await db.commit()
+    invalidate_user(previous_email, user.email)
     await db.refresh(user)
     return user
 
@@ -48,6 +54,7 @@ async def update_user(db: AsyncSession, user: models.User, update: schemas.UserU
 async def delete_user(db: AsyncSession, user: models.User):
     await db.delete(user)
     await db.commit()
+    invalidate_user(user.email)
 
 
 async def search_users_fuzzy(
@@ -92,32 +99,6 @@ async def search_users_fuzzy(
     result = await db.execute(sql, params)
     return result.fetchall()
 
-# Add helper function for getting total count
-
-
-async def get_total_count(
-        db: AsyncSession,
-        query: str,
-        role: Optional[str] = None
-) -> int:
-
-    where_conditions = ["(name ILIKE :q OR email ILIKE :q)"]
-    params = {
-        "q": f"%{query}%"
-    }
-
-    if role:
-        where_conditions.append("role = :role")
-        params["role"] = role
-
-    sql = text(f"""
-        SELECT COUNT(*) FROM users
-        WHERE {' AND '.join(where_conditions)}
-    """)
-
-    result = await db.execute(sql, params)
-    return result.scalar()
-
 # services/user_service.py
 
 
@@ -128,9 +109,15 @@ async def get_users_paginated(
     role: Optional[str] = None,
     sort_by: str = "id",
     sort_order: str = "asc",
-    search_query: Optional[str] = None
+    search_query: Optional[str] = None,
+    cursor: Optional[str] = None
 ) -> List[User]:
-    """Unified method for getting paginated users with optional search and filters."""
+    """Unified method for getting paginated users with optional search and filters.
+
+    With a cursor the page is fetched by keyset instead of OFFSET. Outside of
+    search the result holds up to limit + 1 rows so the caller can tell whether
+    another page exists (see app.utils.pagination.next_cursor).
+    """
 
     if search_query:
         # Use your existing fuzzy search logic
@@ -154,10 +141,17 @@ async def get_users_paginated(
     }
 
     sort_column = sort_mapping.get(sort_by, models.User.id)
-    query = query.order_by(
-        desc(sort_column) if sort_order == "desc" else asc(sort_column))
+    sort_order = "desc" if sort_order == "desc" else "asc"
+
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_by, sort_order)
+        query = apply_keyset(query, sort_column, models.User.id,
+                             sort_order, value, last_id)
+    else:
+        query = query.offset(skip)
+    query = apply_sort(query, sort_column, models.User.id, sort_order)
+    query = query.limit(limit + 1)
 
-    query = query.offset(skip).limit(limit)
     result = await db.execute(query)
     return result.scalars().all()
 
@@ -165,60 +159,22 @@ async def get_users_paginated(
 async def get_total_count_filtered(
     db: AsyncSession,
     role: Optional[str] = None,
-    search_query: Optional[str] = None
-) -> int:
-    """Get total count with consistent filtering logic."""
+    search_query: Optional[str] = None,
+    count_mode: CountMode = CountMode.exact
+) -> dict:
+    """Get total count with consistent filtering logic.
 
-    if search_query:
-        # Use your existing search count logic
-        return await get_total_count(db, search_query, role)
+    Returns the total/total_mode/total_capped fields of paginated responses.
+    """
 
-    query = select(func.count(models.User.id))
+    query = select(models.User.id)
 
+    if search_query:
+        pattern = f"%{search_query}%"
+        query = query.where(or_(models.User.name.ilike(pattern),
+                                models.User.email.ilike(pattern)))
     if role:
         query = query.where(models.User.role == role)
 
-    result = await db.execute(query)
-    return result.scalar()
-
-
-async def search_contacts_fuzzy(db: AsyncSession, query: str, skip: int = 0, limit: int = 10):
-    sql = text("""
-        SELECT * FROM contacts
-        WHERE name ILIKE :q OR email ILIKE :q
-        ORDER BY similarity(name, :plain) DESC, similarity(email, :plain) DESC
-        LIMIT :limit OFFSET :skip
-    """)
-
-    # Bind parameters
-    params = {
-        "q": f"%{query}%",
-        "plain": query,
-        "limit": limit,
-        "skip": skip
-    }
-
-    # Execute with await
-    result = await db.execute(sql, params)
-    return result.fetchall()
-
-
-async def search_leads_fuzzy(db: AsyncSession, query: str, skip: int = 0, limit: int = 10):
-    sql = text("""
-        SELECT * FROM leads
-        WHERE name ILIKE :q OR notes ILIKE :q
-        ORDER BY similarity(name, :plain) DESC, similarity(notes, :plain) DESC
-        LIMIT :limit OFFSET :skip
-    """)
-
-    # Bind parameters
-    params = {
-        "q": f"%{query}%",
-        "plain": query,
-        "limit": limit,
-        "skip": skip
-    }
-
-    # Execute with await
-    result = await db.execute(sql, params)
-    return result.fetchall()
+    cache_key = count_cache_key("users", None, role=role, q=search_query)
+    return await count_rows(db, query, count_mode, cache_key)
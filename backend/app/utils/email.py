@@ -1,14 +1,27 @@
 from email.message import EmailMessage
-import aiosmtplib
+from app.core.config import settings
+from app.services.job_service import job_type
+from app.utils.email_dispatcher import EmailDispatcher
 import os
 
 SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
-SMTP_PORT = 587
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
 SMTP_USER = os.getenv("SMTP_USER")
 SMTP_PASS = os.getenv("SMTP_PASS")
+SMTP_START_TLS = os.getenv("SMTP_START_TLS", "true").lower() != "false"
 
+dispatcher = EmailDispatcher(
+    hostname=SMTP_HOST,
+    port=SMTP_PORT,
+    username=SMTP_USER,
+    password=SMTP_PASS,
+    start_tls=SMTP_START_TLS,
+    pool_size=settings.EMAIL_POOL_SIZE,
+    timeout=settings.EMAIL_SEND_TIMEOUT,
+)
 
-async def send_verification_email(to_email: str, token: str):
+
+def build_verification_email(to_email: str, token: str) -> EmailMessage:
     msg = EmailMessage()
     msg["From"] = SMTP_USER
     msg["To"] = to_email
@@ -16,11 +29,10 @@ async def send_verification_email(to_email: str, token: str):
 
     verify_url = f"http://localhost:5173/verify-email?token={token}"
     msg.set_content(f"Click to verify: {verify_url}")
-
-    await aiosmtplib.send(msg, hostname=SMTP_HOST, port=SMTP_PORT, username=SMTP_USER, password=SMTP_PASS, start_tls=True)
+    return msg
 
 
-async def send_reset_email(to_email: str, token: str):
+def build_reset_email(to_email: str, token: str) -> EmailMessage:
     msg = EmailMessage()
     msg["From"] = SMTP_USER
     msg["To"] = to_email
@@ -28,5 +40,22 @@ async def send_reset_email(to_email: str, token: str):
 
     reset_url = f"http://localhost:8000/api/v1/auth/reset-password?token={token}"
     msg.set_content(f"Click here to reset your password: {reset_url}")
+    return msg
+
+
+# Job types; enqueue with {"to": ..., "token": ...} and run by python -m app.worker.
+# One SMTP connection per concurrent send, so concurrency is the pool size.
+VERIFICATION_EMAIL_JOB = "email.verification"
+RESET_EMAIL_JOB = "email.password_reset"
+
+
+@job_type(VERIFICATION_EMAIL_JOB, concurrency=settings.EMAIL_POOL_SIZE,
+          timeout=settings.EMAIL_SEND_TIMEOUT * 2)
+async def send_verification_email(payload: dict) -> None:
+    await dispatcher.send(build_verification_email(payload["to"], payload["token"]))
+
 
-    await aiosmtplib.send(msg, hostname=SMTP_HOST, port=SMTP_PORT, username=SMTP_USER, password=SMTP_PASS, start_tls=True)
+@job_type(RESET_EMAIL_JOB, concurrency=settings.EMAIL_POOL_SIZE,
+          timeout=settings.EMAIL_SEND_TIMEOUT * 2)
+async def send_reset_email(payload: dict) -> None:
+    await dispatcher.send(build_reset_email(payload["to"], payload["token"]))
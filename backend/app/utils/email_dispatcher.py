@@ -0,0 +1,117 @@
+import asyncio
+import logging
+from email.message import EmailMessage
+from typing import List, Optional
+
+import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+
+class EmailDispatcher:
+    """Sends mail over a few long-lived SMTP connections.
+
+    Up to `pool_size` connections are kept open between messages, so TCP,
+    STARTTLS and AUTH are paid once per connection instead of once per
+    message. send() raises when delivery fails; retries belong to the
+    caller (the job worker, with its backoff and attempt limit).
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        start_tls: bool = True,
+        pool_size: int = 2,
+        timeout: float = 30.0,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._idle: List[aiosmtplib.SMTP] = []
+        self.sent = 0
+        self.failed = 0
+        self.reconnected = 0
+
+    async def send(self, message: EmailMessage) -> None:
+        """Send one message now; raises aiosmtplib/OS errors when delivery fails.
+
+        A pooled connection the server has since dropped is replaced by a
+        new one straight away, once; a new connection failing raises.
+        """
+        client = self._idle.pop() if self._idle else None
+        if client is not None and not client.is_connected:
+            client.close()
+            self.reconnected += 1
+        reused = client is not None and client.is_connected
+        try:
+            try:
+                if not reused:
+                    client = await self._connect()
+                await client.send_message(message)
+            except ConnectionError:
+                if not reused:
+                    raise
+                # Stale pooled connection (idle timeout on the server)
+                client.close()
+                reused = False
+                self.reconnected += 1
+                client = await self._connect()
+                await client.send_message(message)
+        except asyncio.CancelledError:
+            # Mid-conversation: the connection cannot be reused
+            if client is not None:
+                client.close()
+            raise
+        except Exception:
+            if client is not None:
+                client.close()
+            self.failed += 1
+            raise
+        self.sent += 1
+        if len(self._idle) < self.pool_size:
+            self._idle.append(client)
+        else:
+            await self._quit(client)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Close pooled connections, waiting up to `timeout` seconds for QUIT."""
+        idle, self._idle = self._idle, []
+        if idle:
+            await asyncio.wait([asyncio.ensure_future(self._quit(client)) for client in idle],
+                               timeout=timeout)
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        return client
+
+    @staticmethod
+    async def _quit(client: aiosmtplib.SMTP) -> None:
+        if not client.is_connected:
+            return
+        try:
+            await client.quit()
+        except (aiosmtplib.SMTPException, OSError, asyncio.CancelledError):
+            client.close()
+
+    def stats(self) -> dict:
+        return {
+            "idle_connections": len(self._idle),
+            "sent": self.sent,
+            "failed": self.failed,
+            "reconnected": self.reconnected,
+        }
@@ -0,0 +1,133 @@
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import BigInteger, Enum as EnumType, and_, asc, desc, literal, or_, tuple_
+
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, row_id: int) -> str:
+    """Build an opaque cursor from the sort column value and id of the last row."""
+    kind = None
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, datetime):
+        value = value.isoformat()
+        kind = "dt"
+    payload = {"s": sort_by, "o": sort_order, "v": value, "t": kind, "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> tuple[Any, int]:
+    """Return (value, id) from a cursor, rejecting cursors issued for another sort."""
+    invalid = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value, row_id = payload["v"], int(payload["id"])
+        if payload.get("t") == "dt":
+            value = datetime.fromisoformat(value)
+    except (ValueError, KeyError, TypeError):
+        raise invalid
+
+    if payload.get("s") != sort_by or payload.get("o") != sort_order:
+        raise invalid
+    return value, row_id
+
+
+def apply_sort(query, sort_column, id_column, sort_order: str):
+    """Order by the sort column with id as a tiebreaker.
+
+    NULL placement is pinned to PostgreSQL's defaults (last for ASC, first for
+    DESC) so the keyset predicates below stay valid on every backend.
+    """
+    if sort_order == "desc":
+        return query.order_by(desc(sort_column).nulls_first(), desc(id_column))
+    return query.order_by(asc(sort_column).nulls_last(), asc(id_column))
+
+
+def _cursor_value(sort_column, value: Any) -> Any:
+    """The cursor's sort value as the column's Python type; 400 when it cannot be.
+
+    Cursors are opaque but not signed, so a tampered one must fail here
+    rather than as a type error in the database.
+    """
+    invalid = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+    if value is None:
+        return None
+    column_type = sort_column.type
+    if isinstance(column_type, EnumType) and column_type.enum_class is not None:
+        try:
+            return column_type.enum_class(value)
+        except ValueError:
+            raise invalid
+    try:
+        expected = column_type.python_type
+    except NotImplementedError:
+        return value
+    if expected is int:
+        bound = 2 ** 63 if isinstance(column_type, BigInteger) else 2 ** 31
+        if isinstance(value, bool) or not isinstance(value, int) or not -bound <= value < bound:
+            raise invalid
+    elif expected is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise invalid
+    elif expected is str:
+        if not isinstance(value, str) or "\x00" in value:
+            raise invalid
+    elif not isinstance(value, expected):
+        raise invalid
+    return value
+
+
+def apply_keyset(query, sort_column, id_column, sort_order: str, value: Any, row_id: int):
+    """Restrict the query to rows strictly after the (value, id) position.
+
+    The value is bound with the sort column's type (an enum column compares
+    against its enum type, not VARCHAR); a cursor whose value does not fit
+    the column is a 400.
+    """
+    if not -2 ** 31 <= row_id < 2 ** 31 and not isinstance(id_column.type, BigInteger):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    if sort_column is id_column:
+        if sort_order == "desc":
+            return query.where(id_column < row_id)
+        return query.where(id_column > row_id)
+
+    value = _cursor_value(sort_column, value)
+    bound = None if value is None else literal(value, sort_column.type)
+    if sort_order == "desc":
+        if value is None:
+            return query.where(or_(
+                and_(sort_column.is_(None), id_column < row_id),
+                sort_column.is_not(None),
+            ))
+        return query.where(tuple_(sort_column, id_column) < tuple_(bound, row_id))
+
+    if value is None:
+        return query.where(and_(sort_column.is_(None), id_column > row_id))
+    return query.where(or_(
+        tuple_(sort_column, id_column) > tuple_(bound, row_id),
+        sort_column.is_(None),
+    ))
+
+
+def next_cursor(items: list, limit: int, sort_by: str, sort_order: str) -> Optional[str]:
+    """Cursor for the page after `items`, or None when this is the last page.
+
+    `items` is expected to hold up to limit + 1 rows; the extra row only
+    signals that another page exists and is dropped by the caller.
+    """
+    if len(items) <= limit:
+        return None
+    last = items[limit - 1]
+    return encode_cursor(sort_by, sort_order, getattr(last, sort_by), last.id)
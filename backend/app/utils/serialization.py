@@ -0,0 +1,87 @@
+from decimal import Decimal
+from typing import Callable, Sequence
+
+import orjson
+from pydantic import BaseModel
+
+from app import models, schemas
+
+# Column types orjson cannot encode the way the response schemas do
+_CONVERTERS = {Decimal: str}
+
+# Matches pydantic's output for UTC datetimes ("...Z")
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _python_type(column) -> type:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return object
+
+
+class RowSerializer:
+    """Encode Core result rows for one `*Out` schema straight to JSON bytes.
+
+    Selecting `columns` instead of the ORM entity skips identity-map
+    hydration, and the mapper built here turns each row into a dict in the
+    schema's field order without running pydantic validation. Routes keep
+    their `response_model`, so the OpenAPI schema does not change.
+    """
+
+    def __init__(self, schema: type[BaseModel], model):
+        self.schema = schema
+        self.fields = tuple(schema.model_fields)
+        self.columns = tuple(getattr(model, name) for name in self.fields)
+        self.to_dict = self._compile()
+
+    def _compile(self) -> Callable[[Sequence], dict]:
+        fields = self.fields
+        converters = [
+            (index, _CONVERTERS[_python_type(column)])
+            for index, column in enumerate(self.columns)
+            if _python_type(column) in _CONVERTERS
+        ]
+        if not converters:
+            return lambda row: dict(zip(fields, row))
+
+        def to_dict(row: Sequence) -> dict:
+            values = list(row)
+            for index, convert in converters:
+                if values[index] is not None:
+                    values[index] = convert(values[index])
+            return dict(zip(fields, values))
+        return to_dict
+
+    def dumps_page(self, page: dict) -> bytes:
+        """Encode a `{total, total_mode, total_capped, items, next_cursor}` page.
+
+        Full-text search pages also carry `highlights` (snippets by item id).
+        """
+        to_dict = self.to_dict
+        body = {
+            "total": page["total"],
+            "total_mode": page.get("total_mode", "exact"),
+            "total_capped": page.get("total_capped", False),
+            "items": [to_dict(row) for row in page["items"]],
+            "next_cursor": page.get("next_cursor"),
+        }
+        if "highlights" in page:
+            body["highlights"] = page["highlights"]
+        return orjson.dumps(body, option=ORJSON_OPTIONS)
+
+    def dumps_grouped(self, payload: dict, groups_key: str) -> bytes:
+        """Encode `payload` whose `groups_key` list holds dicts with row `items`."""
+        to_dict = self.to_dict
+        return orjson.dumps({
+            **payload,
+            groups_key: [
+                {**group, "items": [to_dict(row) for row in group["items"]]}
+                for group in payload[groups_key]
+            ],
+        }, option=ORJSON_OPTIONS)
+
+
+CONTACT_ROWS = RowSerializer(schemas.ContactOut, models.Contact)
+LEAD_ROWS = RowSerializer(schemas.LeadOut, models.Lead)
+TASK_ROWS = RowSerializer(schemas.TaskOut, models.Task)
@@ -0,0 +1,55 @@
+import json
+from enum import Enum
+from typing import Iterator
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def column_values(data: BaseModel, exclude_unset: bool = False,
+                  exclude_none: bool = False) -> dict:
+    """Schema fields as column values for Core INSERT/UPDATE; enums are stored by value.
+
+    Inserts pass exclude_none so omitted columns (created_at) get their defaults.
+    """
+    dumped = data.model_dump(exclude_unset=exclude_unset, exclude_none=exclude_none)
+    return {
+        key: value.value if isinstance(value, Enum) else value
+        for key, value in dumped.items()
+    }
+
+
+async def explain(db: AsyncSession, stmt, analyze: bool = False, buffers: bool = False) -> dict:
+    """Return the JSON plan PostgreSQL chooses for a SQLAlchemy statement.
+
+    The statement is compiled for the session's dialect and sent through the
+    driver with its bound parameters, so the plan matches what the app runs.
+    With analyze=True the statement is actually executed.
+    """
+    conn = await db.connection()
+    # Expanding IN parameters are only rendered at execution time otherwise
+    compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+
+    options = ["FORMAT JSON"]
+    if analyze:
+        options.append("ANALYZE")
+    if buffers:
+        options.append("BUFFERS")
+
+    result = await conn.exec_driver_sql(f"EXPLAIN ({', '.join(options)}) {compiled}", params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+def walk_plan(node: dict) -> Iterator[dict]:
+    """Yield every node of an EXPLAIN (FORMAT JSON) plan tree."""
+    if "Plan" in node:
+        node = node["Plan"]
+    yield node
+    for child in node.get("Plans", []):
+        yield from walk_plan(child)
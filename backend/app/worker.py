@@ -0,0 +1,270 @@
+# app/worker.py
+"""Background job worker: claims jobs from the jobs table and runs their handlers.
+
+    python -m app.worker                                  # every registered job type
+    python -m app.worker --types email.verification --concurrency 8
+    python -m app.worker --import bench.bench_jobs        # also load handlers from a module
+
+Run as many processes as the load needs, on any host. Claims use SELECT ...
+FOR UPDATE SKIP LOCKED, so workers never wait on or run each other's jobs.
+Running jobs are heartbeated; if a worker dies, its jobs become claimable
+again once their visibility timeout (JOB_VISIBILITY_TIMEOUT_SECONDS) passes.
+SIGTERM/SIGINT stop claiming, give running jobs JOB_DRAIN_TIMEOUT_SECONDS to
+finish and hand the rest back.
+"""
+import argparse
+import asyncio
+import importlib
+import logging
+import os
+import signal
+import socket
+from collections import Counter
+from typing import Dict, List
+
+from sqlalchemy import Row
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.services import job_service
+from app.services.job_service import JOB_TYPES, JobType
+from app.utils.email import dispatcher as email_dispatcher
+
+logger = logging.getLogger(__name__)
+
+# Between retention sweeps of finished jobs
+PURGE_INTERVAL_SECONDS = 600
+
+
+class Worker:
+    def __init__(self, types: List[JobType], concurrency: int, poll_interval: float):
+        self.types: Dict[str, JobType] = {job_type.name: job_type for job_type in types}
+        self.concurrency = concurrency
+        # Claim again once this many slots are busy or fewer, so claims and
+        # completions go in batches rather than one round trip per job
+        self.low_water = concurrency // 2
+        self.poll_interval = poll_interval
+        self.id = f"{socket.gethostname()}:{os.getpid()}"
+        self.running: Dict[int, asyncio.Task] = {}
+        self.running_by_type: Counter = Counter()
+        self.finished: List[int] = []
+        self.wake = asyncio.Event()
+        self.stopping = asyncio.Event()
+        self.processed = self.retried = self.failed = 0
+        self._next_type = 0
+
+    def stop(self) -> None:
+        if not self.stopping.is_set():
+            logger.info("Stopping: no new claims, draining running jobs")
+            self.stopping.set()
+            self.wake.set()
+
+    async def run(self) -> None:
+        logger.info(f"Worker {self.id}: {', '.join(self.types)}, concurrency {self.concurrency}")
+        helpers = [asyncio.create_task(coro) for coro in
+                   (self._listen(), self._heartbeat(), self._purge())]
+        try:
+            while not self.stopping.is_set():
+                self.wake.clear()
+                try:
+                    claimed = await self._claim()
+                except Exception as e:
+                    # Database away: running jobs carry on, claims resume on
+                    # the next poll; unrecorded completions may run again
+                    logger.warning(f"Claiming jobs failed: {e}")
+                    claimed = 0
+                # Claim again straight away while there is work and room for it
+                if claimed and len(self.running) < self.concurrency:
+                    continue
+                try:
+                    await asyncio.wait_for(self.wake.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self._drain()
+        finally:
+            for helper in helpers:
+                helper.cancel()
+            await asyncio.gather(*helpers, return_exceptions=True)
+        logger.info(f"Worker {self.id} stopped: {self.processed} done, "
+                    f"{self.retried} retried, {self.failed} failed")
+
+    async def _claim(self) -> int:
+        """Record finished jobs, then fill free slots, one claim per type.
+
+        Completions share the first claim's transaction. Which type claims
+        first rotates, so a busy type cannot take every slot each time.
+        """
+        free = self.concurrency - len(self.running)
+        if free <= 0:
+            await self._flush()
+            return 0
+        names = list(self.types)
+        start = self._next_type % len(names)
+        self._next_type += 1
+        claimed = 0
+        finished, self.finished = self.finished, []
+        try:
+            async with AsyncSessionLocal() as db:
+                if finished:
+                    await job_service.complete(db, self.id, finished)
+                for name in names[start:] + names[:start]:
+                    job_type = self.types[name]
+                    room = free - claimed
+                    if job_type.concurrency is not None:
+                        room = min(room, job_type.concurrency - self.running_by_type[name])
+                    if room <= 0:
+                        continue
+                    jobs = await job_service.claim(db, self.id, name, room)
+                    await db.commit()
+                    finished = []
+                    for job in jobs:
+                        self._start(job)
+                    claimed += len(jobs)
+                    if claimed >= free:
+                        break
+                await db.commit()
+                finished = []
+        except Exception:
+            # Completions not committed yet go with the next claim
+            self.finished.extend(finished)
+            raise
+        return claimed
+
+    def _start(self, job: Row) -> None:
+        self.running_by_type[job.type] += 1
+        self.running[job.id] = asyncio.create_task(self._execute(job), name=f"job-{job.id}")
+
+    async def _execute(self, job: Row) -> None:
+        job_type = self.types[job.type]
+        try:
+            await asyncio.wait_for(job_type.handler(job.payload), job_type.timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            async with AsyncSessionLocal() as db:
+                status = await job_service.fail(db, self.id, job, error)
+                await db.commit()
+            if status == "failed":
+                self.failed += 1
+                logger.error(f"Job {job.id} ({job.type}) failed after "
+                             f"{job.attempts} attempts: {error}")
+            else:
+                self.retried += 1
+                logger.warning(f"Job {job.id} ({job.type}) attempt {job.attempts} failed, "
+                               f"will retry: {error}")
+        else:
+            # Recorded in batches by the main loop
+            self.finished.append(job.id)
+            self.processed += 1
+        finally:
+            del self.running[job.id]
+            at_limit = self.running_by_type[job.type] == job_type.concurrency
+            self.running_by_type[job.type] -= 1
+            if at_limit or len(self.running) <= self.low_water:
+                self.wake.set()
+
+    async def _flush(self) -> None:
+        if not self.finished:
+            return
+        ids, self.finished = self.finished, []
+        try:
+            async with AsyncSessionLocal() as db:
+                await job_service.complete(db, self.id, ids)
+                await db.commit()
+        except Exception:
+            self.finished.extend(ids)
+            raise
+
+    async def _drain(self) -> None:
+        if self.running:
+            done, pending = await asyncio.wait(
+                list(self.running.values()), timeout=settings.JOB_DRAIN_TIMEOUT_SECONDS)
+            if pending:
+                ids = list(self.running)
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                async with AsyncSessionLocal() as db:
+                    await job_service.release(db, self.id, ids)
+                    await db.commit()
+                logger.warning(f"Handed back {len(ids)} unfinished jobs")
+        await self._flush()
+
+    async def _heartbeat(self) -> None:
+        interval = settings.JOB_VISIBILITY_TIMEOUT_SECONDS / 3
+        while True:
+            await asyncio.sleep(interval)
+            # Finished jobs stay locked too until their completion is recorded
+            held = list(self.running) + self.finished
+            if not held:
+                continue
+            try:
+                async with AsyncSessionLocal() as db:
+                    await job_service.extend(db, self.id, held)
+                    await db.commit()
+            except Exception as e:
+                logger.warning(f"Heartbeat failed: {e}")
+
+    async def _purge(self) -> None:
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    deleted = await job_service.purge_finished(db, settings.JOB_RETENTION_HOURS)
+                    await db.commit()
+                if deleted:
+                    logger.info(f"Purged {deleted} finished jobs")
+            except Exception as e:
+                logger.warning(f"Purging finished jobs failed: {e}")
+            await asyncio.sleep(PURGE_INTERVAL_SECONDS)
+
+    async def _listen(self) -> None:
+        """Wake on NOTIFY from enqueue; polling covers any notification missed."""
+        def notified(connection, pid, channel, payload):
+            if payload in self.types:
+                self.wake.set()
+        try:
+            async with engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                await raw.driver_connection.add_listener(job_service.NOTIFY_CHANNEL, notified)
+                await self.stopping.wait()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"LISTEN unavailable, polling every {self.poll_interval}s: {e}")
+
+
+async def run(types: List[JobType], concurrency: int, poll_interval: float) -> None:
+    worker = Worker(types, concurrency, poll_interval)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        await email_dispatcher.stop(settings.EMAIL_DRAIN_TIMEOUT)
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--types", default=None,
+                        help="comma-separated job types; all registered types by default")
+    parser.add_argument("--concurrency", type=int, default=settings.JOB_WORKER_CONCURRENCY)
+    parser.add_argument("--poll-interval", type=float, default=settings.JOB_POLL_INTERVAL_SECONDS)
+    parser.add_argument("--import", dest="modules", action="append", default=[],
+                        help="module registering more job types; repeatable")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    for module in args.modules:
+        importlib.import_module(module)
+    names = args.types.split(",") if args.types else list(JOB_TYPES)
+    unknown = [name for name in names if name not in JOB_TYPES]
+    if unknown:
+        parser.error(f"unknown job types: {', '.join(unknown)}")
+    asyncio.run(run([JOB_TYPES[name] for name in names], args.concurrency, args.poll_interval))
+
+
+if __name__ == "__main__":
+    main()
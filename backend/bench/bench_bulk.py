@@ -0,0 +1,83 @@
+"""Bulk lead changes: one PUT-style update per row vs bulk_service.
+
+Run from backend/ against a database holding both users:
+
+    python -m bench.bench_bulk --owner-id 1 --to-owner 2 --rows 5000
+
+Inserts --rows leads for --owner-id, dated on a fixed day no real lead uses,
+then: sets their status with lead_service.update_lead one id at a time (what
+5,000 PUT calls do, minus HTTP), sets it again with one bulk_update by ids,
+reassigns them to --to-owner with bulk_update by filter (that day), and
+deletes them with bulk_delete by ids. Queries come from the query_stats hooks.
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy import insert
+
+from app import models, schemas, services
+from app.core.database import AsyncSessionLocal, engine
+from app.core.query_stats import RequestQueryStats, current_stats
+
+BENCH_DAY = datetime(1990, 1, 1, 12, tzinfo=timezone.utc)
+
+
+async def timed(label: str, rows: int, work):
+    stats = RequestQueryStats()
+    current_stats.set(stats)
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        report = await work(db)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24}{elapsed * 1000:>10.0f}{rows / elapsed:>12.0f}{stats.count:>10}")
+    return report
+
+
+async def run(owner_id: int, to_owner: int, rows: int):
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            insert(models.Lead).returning(models.Lead.id),
+            [{"name": f"Bulk lead {n}", "status": "new", "created_at": BENCH_DAY,
+              "owner_id": owner_id} for n in range(rows)])
+        ids = result.scalars().all()
+        await db.commit()
+
+    print(f"{rows} leads")
+    print(f"{'path':<24}{'ms':>10}{'rows/s':>12}{'queries':>10}")
+
+    async def per_row(db):
+        for lead_id in ids:
+            await services.lead_service.update_lead(
+                db, owner_id, lead_id, schemas.LeadUpdate(name="Bulk lead", status="contacted"))
+    await timed("update_lead per row", rows, per_row)
+
+    selection = schemas.bulk.LeadBulkUpdate(ids=ids, changes={"status": "qualified"})
+    await timed("bulk_update ids", rows, lambda db: services.bulk_service.bulk_update(
+        db, "leads", owner_id, selection))
+
+    selection = schemas.bulk.LeadBulkUpdate(
+        filter={"created_after": BENCH_DAY.date(), "created_before": BENCH_DAY.date()},
+        changes={"owner_id": to_owner})
+    await timed("bulk_update filter", rows, lambda db: services.bulk_service.bulk_update(
+        db, "leads", owner_id, selection))
+
+    selection = schemas.bulk.LeadBulkDelete(ids=ids)
+    report = await timed("bulk_delete ids", rows, lambda db: services.bulk_service.bulk_delete(
+        db, "leads", to_owner, selection))
+    print(f"deleted {report['affected']} in {report['chunks']} chunks")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--owner-id", type=int, required=True)
+    parser.add_argument("--to-owner", type=int, required=True)
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(run(args.owner_id, args.to_owner, args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Pipeline dashboard: GROUP BY over leads/contacts vs the pipeline_counters table.
+
+Run from backend/ against a seeded database (python -m app.core.seed):
+
+    python -m bench.bench_dashboard --owner-id 1 --repeat 20
+
+"group by" computes the dashboard the way a page load would without the
+summary table; "counters" is pipeline_service.get_dashboard. Both return
+the same numbers while the triggers are in place (see app/core/reconcile.py).
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func
+from sqlalchemy.future import select
+
+from app import models, services
+from app.core.database import AsyncSessionLocal, engine
+
+Lead, Contact = models.Lead, models.Contact
+
+
+async def group_by_dashboard(db, owner_id: int, days: int) -> dict:
+    since = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+    day = func.date(func.timezone("UTC", Lead.created_at))
+    queries = {
+        "leads_by_status": select(Lead.status, func.count()).where(
+            Lead.owner_id == owner_id).group_by(Lead.status),
+        "leads_by_source": select(Lead.source, func.count()).where(
+            Lead.owner_id == owner_id).group_by(Lead.source),
+        "contacts_by_status": select(Contact.status, func.count()).where(
+            Contact.owner_id == owner_id).group_by(Contact.status),
+        "new_leads_per_day": select(day, func.count()).where(
+            Lead.owner_id == owner_id, day >= since).group_by(day),
+    }
+    return {key: (await db.execute(query)).all() for key, query in queries.items()}
+
+
+async def timed(label: str, repeat: int, work):
+    async with AsyncSessionLocal() as db:
+        await work(db)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await work(db)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<12}{elapsed * 1000:>10.2f}")
+
+
+async def run(owner_id: int, repeat: int, days: int):
+    async with AsyncSessionLocal() as db:
+        leads = (await db.execute(select(func.count()).where(Lead.owner_id == owner_id))).scalar()
+    print(f"owner {owner_id}: {leads} leads")
+    print(f"{'path':<12}{'ms/load':>10}")
+    await timed("group by", repeat, lambda db: group_by_dashboard(db, owner_id, days))
+    await timed("counters", repeat,
+                lambda db: services.pipeline_service.get_dashboard(db, owner_id, days))
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--owner-id", type=int, required=True)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--days", type=int, default=90)
+    args = parser.parse_args()
+    asyncio.run(run(args.owner_id, args.repeat, args.days))
+
+
+if __name__ == "__main__":
+    main()
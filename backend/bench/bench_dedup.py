@@ -0,0 +1,132 @@
+"""Contact deduplication: clustering time against the number of contacts.
+
+Run from backend/ against a seeded database (python -m app.core.seed):
+
+    python -m bench.bench_dedup --rows 1000000 --dup-rate 0.02 --owner-id 1
+
+Reads --rows contacts (the table's rows are reused under new owner and
+contact ids when it holds fewer), adds --dup-rate near duplicates of random
+rows (email in another case, phone in national format, a one-letter typo
+in the name with the company suffixed "Inc."), then runs
+dedup_service.cluster_rows per owner on 1/8, 1/4, 1/2 and all of the rows.
+Near-linear scaling shows as a steady rows/s. Recall is the share of
+planted duplicates that ended up in their original's cluster. Finally
+times find_duplicates, one scan plus clustering, for --owner-id.
+"""
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+
+from sqlalchemy.future import select
+
+from app import models, services
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.services.dedup_service import DEDUP_COLUMNS, DedupRow, cluster_rows
+
+
+async def load_rows(rows: int) -> list:
+    """(owner_id, DedupRow) pairs, the table repeated under fresh ids up to `rows`."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(models.Contact.owner_id, *DEDUP_COLUMNS).order_by(models.Contact.id).limit(rows))
+        base = [(row[0], DedupRow(*row[1:])) for row in result.all()]
+    if not base:
+        raise SystemExit("no contacts: seed the database first")
+    max_owner = max(owner for owner, _ in base)
+    max_id = max(row.id for _, row in base)
+    loaded = list(base)
+    copy = 1
+    while len(loaded) < rows:
+        loaded.extend(
+            (owner + copy * max_owner, row._replace(id=row.id + copy * max_id))
+            for owner, row in base[:rows - len(loaded)])
+        copy += 1
+    return loaded
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    position = rng.randrange(1, len(name) - 1) if len(name) > 3 else 0
+    return name[:position] + name[position + 1:]
+
+
+def plant_duplicates(rows: list, rate: float, rng: random.Random) -> list:
+    """Append near duplicates; returns the (original id, duplicate id) pairs."""
+    next_id = max(row.id for _, row in rows) + 1
+    planted = []
+    for owner, row in rng.sample(rows, int(len(rows) * rate)):
+        digits = "".join(ch for ch in row.phone or "" if ch.isdigit())
+        duplicate = DedupRow(
+            id=next_id,
+            name=_typo(row.name, rng) if row.company else row.name,
+            email=f" {row.email.upper()}" if row.email and rng.random() < 0.5 else None,
+            phone=(f"({digits[-10:-7]}) {digits[-7:-4]}-{digits[-4:]}"
+                   if len(digits) >= 10 and rng.random() < 0.5 else None),
+            company=f"{row.company} Inc." if row.company else None,
+        )
+        rows.append((owner, duplicate))
+        planted.append((row.id, next_id))
+        next_id += 1
+    return planted
+
+
+def run_clustering(rows: list) -> tuple:
+    by_owner = defaultdict(list)
+    for owner, row in rows:
+        by_owner[owner].append(row)
+    cluster_of = {}
+    totals = defaultdict(int)
+    start = time.perf_counter()
+    for owner_rows in by_owner.values():
+        clusters, stats = cluster_rows(
+            owner_rows, settings.DEDUP_NAME_SIMILARITY, settings.DEDUP_MAX_BLOCK_SIZE)
+        for key, value in stats.items():
+            totals[key] += value
+        totals["clusters"] += len(clusters)
+        for number, cluster in enumerate(clusters):
+            for contact_id in cluster["ids"]:
+                cluster_of[contact_id] = (id(owner_rows), number)
+    return time.perf_counter() - start, totals, cluster_of
+
+
+async def run(rows: int, dup_rate: float, owner_id: int, seed: int):
+    loaded = await load_rows(rows)
+    rng = random.Random(seed)
+    planted = plant_duplicates(loaded, dup_rate, rng)
+    rng.shuffle(loaded)
+    print(f"{len(loaded)} contacts, {len(planted)} planted duplicates")
+    print(f"{'rows':>9}{'s':>8}{'rows/s':>10}{'pairs':>11}{'skipped':>9}{'clusters':>10}{'recall':>8}")
+    for fraction in (8, 4, 2, 1):
+        subset = loaded[:len(loaded) // fraction]
+        present = {row.id for _, row in subset}
+        elapsed, totals, cluster_of = run_clustering(subset)
+        pairs = [(a, b) for a, b in planted if a in present and b in present]
+        found = sum(1 for a, b in pairs if a in cluster_of and cluster_of[a] == cluster_of.get(b))
+        recall = found / len(pairs) if pairs else 0
+        print(f"{len(subset):>9}{elapsed:>8.2f}{len(subset) / elapsed:>10.0f}"
+              f"{totals['candidate_pairs']:>11}{totals['skipped_blocks']:>9}"
+              f"{totals['clusters']:>10}{recall:>8.3f}")
+
+    async with AsyncSessionLocal() as db:
+        start = time.perf_counter()
+        report = await services.dedup_service.find_duplicates(db, owner_id)
+        elapsed = time.perf_counter() - start
+    print(f"find_duplicates owner {owner_id}: {report['contacts_scanned']} contacts, "
+          f"{report['total_clusters']} clusters in {elapsed * 1000:.0f} ms")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--dup-rate", type=float, default=0.02)
+    parser.add_argument("--owner-id", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.dup_rate, args.owner_id, args.seed))
+
+
+if __name__ == "__main__":
+    main()
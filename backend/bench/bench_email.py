@@ -0,0 +1,91 @@
+"""Push messages through EmailDispatcher into a local aiosmtpd stand-in.
+
+Needs `pip install aiosmtpd`. Run from backend/:
+
+    python -m bench.bench_email --messages 2000 --pool-size 2
+
+Messages go through send() from --pool-size concurrent senders, as the
+job worker runs email jobs (EMAIL_POOL_SIZE at a time). Optionally fails a
+share of deliveries; a failed message is sent again, up to --attempts
+times, standing in for the job's retries.
+"""
+import argparse
+import asyncio
+import random
+import time
+
+import aiosmtplib
+
+from aiosmtpd.controller import Controller
+
+from app.utils.email import build_verification_email
+from app.utils.email_dispatcher import EmailDispatcher
+
+
+class CountingHandler:
+    def __init__(self, failure_rate: float):
+        self.failure_rate = failure_rate
+        self.received = 0
+        self.sessions = set()
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sessions.add(id(session))
+        if random.random() < self.failure_rate:
+            return "451 Try again later"
+        self.received += 1
+        return "250 OK"
+
+
+async def sender(dispatcher: EmailDispatcher, numbers, attempts: int, given_up: list):
+    for n in numbers:
+        message = build_verification_email(f"user{n}@example.com", str(n))
+        for attempt in range(attempts):
+            try:
+                await dispatcher.send(message)
+                break
+            except aiosmtplib.SMTPException:
+                if attempt == attempts - 1:
+                    given_up.append(n)
+
+
+async def run(messages: int, pool_size: int, failure_rate: float, attempts: int, port: int):
+    handler = CountingHandler(failure_rate)
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        dispatcher = EmailDispatcher(
+            hostname="127.0.0.1",
+            port=port,
+            start_tls=False,
+            pool_size=pool_size,
+        )
+        numbers = iter(range(messages))
+        given_up: list = []
+        start = time.perf_counter()
+        await asyncio.gather(*(sender(dispatcher, numbers, attempts, given_up)
+                               for _ in range(pool_size)))
+        elapsed = time.perf_counter() - start
+        await dispatcher.stop()
+    finally:
+        controller.stop()
+
+    print(f"{messages} messages over {pool_size} connections in {elapsed:.2f}s "
+          f"({messages / elapsed:,.0f} msg/s)")
+    print(f"server received {handler.received} on {len(handler.sessions)} SMTP sessions")
+    print(f"dispatcher {dispatcher.stats()}, given up on {len(given_up)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--attempts", type=int, default=4, help="sends per message at most")
+    parser.add_argument("--smtp-port", type=int, default=8025)
+    args = parser.parse_args()
+    asyncio.run(run(args.messages, args.pool_size, args.failure_rate, args.attempts,
+                    args.smtp_port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Throughput and peak memory of the streaming export endpoints.
+
+Run from backend/ against a seeded database:
+
+    python -m bench.bench_export --email a@b.c --password secret --resource contacts
+
+Reports rows/s, MB/s and the process peak RSS. Peak RSS should stay flat as
+the exported table grows; compare a small and a large owner to check.
+"""
+import argparse
+import asyncio
+import resource
+import sys
+import time
+
+import httpx
+
+from app.main import create_app
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def run(email: str, password: str, resource_name: str, fmt: str):
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://localhost",
+                                 timeout=None) as client:
+        response = await client.post(
+            "/api/v1/general/login", json={"email": email, "password": password})
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        rss_before = peak_rss_mb()
+        rows = size = 0
+        start = time.perf_counter()
+        async with client.stream("GET", f"/api/v1/{resource_name}/export",
+                                 params={"format": fmt}, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                rows += chunk.count(b"\n")
+        elapsed = time.perf_counter() - start
+
+    if fmt == "csv":
+        rows -= 1  # header
+    print(f"{resource_name} {fmt}: {rows} rows, {size / 1e6:.1f} MB in {elapsed:.2f}s")
+    print(f"  {rows / elapsed:,.0f} rows/s, {size / 1e6 / elapsed:.1f} MB/s")
+    print(f"  peak RSS {peak_rss_mb():.1f} MB (before export {rss_before:.1f} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--resource", default="contacts", choices=["contacts", "leads", "tasks"])
+    parser.add_argument("--format", default="ndjson", choices=["ndjson", "csv"])
+    args = parser.parse_args()
+    asyncio.run(run(args.email, args.password, args.resource, args.format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Lead and task search: trigram (search=trigram) vs full text (search=fulltext).
+
+Run from backend/ against a seeded database (python -m app.core.seed):
+
+    python -m bench.bench_fulltext --owner-id 1 --limit 20 --repeat 20
+
+Each term is searched both ways through search_service, as the list
+endpoints do: one COUNT and one page. "matches" is the total each path
+reports; trigram also counts rows where the term is only similar or only a
+substring, full text counts stemmed word matches over the search_vector
+document. The full-text plan of every term is printed with the indexes it
+used. Pass --mode fulltext on a database without pg_trgm.
+"""
+import argparse
+import asyncio
+import time
+
+from app import services
+from app.core.database import AsyncSessionLocal, engine
+from app.services.search_service import SearchMode, fulltext_query
+from app.utils.sql import explain, walk_plan
+
+# Words and phrases from the seeder's notes vocabulary, plus web search syntax
+TERMS = (
+    "pricing",
+    "demo requested",
+    "security questionnaire",
+    '"churn risk"',
+    "renewal -discount",
+    "integration or onboarding",
+    "review",
+)
+
+
+def trigram_search(resource: str):
+    search = {"leads": services.search_service.search_leads,
+              "tasks": services.search_service.search_tasks}[resource]
+
+    async def run(db, owner_id, q, limit):
+        _, counted = await search(db, owner_id, q, limit=limit)
+        return counted["total"]
+    return run
+
+
+def fulltext_search(resource: str):
+    async def run(db, owner_id, q, limit):
+        _, counted, _ = await services.search_service.search_fulltext(
+            db, resource, owner_id, q, limit=limit)
+        return counted["total"]
+    return run
+
+
+async def timed(work, owner_id: int, q: str, limit: int, repeat: int):
+    async with AsyncSessionLocal() as db:
+        total = await work(db, owner_id, q, limit)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await work(db, owner_id, q, limit)
+        elapsed = (time.perf_counter() - start) / repeat
+        await db.rollback()
+    return elapsed, total
+
+
+async def show_plan(resource: str, owner_id: int, q: str):
+    async with AsyncSessionLocal() as db:
+        plan = await explain(db, fulltext_query(resource, owner_id, q), analyze=True)
+    indexes = sorted({node["Index Name"] for node in walk_plan(plan) if "Index Name" in node})
+    return f"{plan['Execution Time']:.2f} ms, {', '.join(indexes) or 'no index'}"
+
+
+async def run(owner_id: int, limit: int, repeat: int, modes: list):
+    paths = {SearchMode.trigram: trigram_search, SearchMode.fulltext: fulltext_search}
+    print(f"{'resource':<10}{'q':<28}{'mode':<10}{'ms':>9}{'matches':>9}")
+    for resource in ("leads", "tasks"):
+        for q in TERMS:
+            for mode in modes:
+                elapsed, total = await timed(paths[mode](resource), owner_id, q, limit, repeat)
+                print(f"{resource:<10}{q:<28}{mode.value:<10}{elapsed * 1000:>9.2f}{total:>9}")
+            print(f"{'':<38}plan: {await show_plan(resource, owner_id, q)}")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--owner-id", type=int, required=True)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--mode", type=SearchMode, action="append",
+                        help="repeatable; both by default")
+    args = parser.parse_args()
+    asyncio.run(run(args.owner_id, args.limit, args.repeat, args.mode or list(SearchMode)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Job queue: throughput of SKIP LOCKED workers against the number of processes.
+
+Run from backend/ against a migrated database:
+
+    python -m bench.bench_jobs --jobs 20000 --processes 1 --processes 2 --processes 4
+
+For each process count, enqueues --jobs "bench.noop" jobs in one INSERT,
+starts that many `python -m app.worker --import bench.bench_jobs` processes
+and times until every job is done. A handler that sleeps --work-ms stands in
+for I/O-bound work such as sending an email. "claims" is the total number of
+attempts recorded: equal to the job count when no job ran twice.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+
+from sqlalchemy import delete, func
+from sqlalchemy.future import select
+
+from app import models
+from app.core.database import AsyncSessionLocal, engine
+from app.services import job_service
+from app.services.job_service import job_type
+
+NOOP_JOB = "bench.noop"
+Job = models.Job
+
+
+@job_type(NOOP_JOB)
+async def noop(payload: dict) -> None:
+    if payload.get("work_ms"):
+        await asyncio.sleep(payload["work_ms"] / 1000)
+
+
+async def progress() -> tuple:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(func.count().filter(Job.status == "done"), func.coalesce(func.sum(Job.attempts), 0))
+            .where(Job.type == NOOP_JOB))
+        return tuple(result.one())
+
+
+async def run_round(jobs: int, processes: int, concurrency: int, work_ms: int) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Job).where(Job.type == NOOP_JOB))
+        await job_service.enqueue_many(db, NOOP_JOB, ({"work_ms": work_ms} for _ in range(jobs)))
+        await db.commit()
+
+    command = [sys.executable, "-m", "app.worker", "--import", "bench.bench_jobs",
+               "--types", NOOP_JOB, "--concurrency", str(concurrency)]
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    workers = [subprocess.Popen(command, env=env, stderr=subprocess.DEVNULL)
+               for _ in range(processes)]
+    start = time.perf_counter()
+    try:
+        done = claims = 0
+        while done < jobs:
+            await asyncio.sleep(0.2)
+            done, claims = await progress()
+        elapsed = time.perf_counter() - start
+    finally:
+        for worker in workers:
+            worker.send_signal(signal.SIGTERM)
+        for worker in workers:
+            worker.wait()
+    # Includes process start-up, which weighs on small --jobs
+    print(f"{processes:>9}{concurrency:>12}{jobs:>8}{elapsed:>8.2f}{jobs / elapsed:>10.0f}{claims:>8}")
+
+
+async def run(jobs: int, process_counts: list, concurrency: int, work_ms: int):
+    print(f"{'processes':>9}{'concurrency':>12}{'jobs':>8}{'s':>8}{'jobs/s':>10}{'claims':>8}")
+    for processes in process_counts:
+        await run_round(jobs, processes, concurrency, work_ms)
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Job).where(Job.type == NOOP_JOB))
+        await db.commit()
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20_000)
+    parser.add_argument("--processes", type=int, action="append",
+                        help="repeatable; 1, 2 and 4 by default")
+    parser.add_argument("--concurrency", type=int, default=16, help="per process")
+    parser.add_argument("--work-ms", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(run(args.jobs, args.processes or [1, 2, 4], args.concurrency, args.work_ms))
+
+
+if __name__ == "__main__":
+    main()
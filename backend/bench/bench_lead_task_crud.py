@@ -0,0 +1,126 @@
+"""Throughput of lead/task create-update-delete: ORM round trips vs lead/task services.
+
+Run from backend/ against a database holding the owner user:
+
+    python -m bench.bench_lead_task_crud --owner-id 1 --ops 2000 --concurrency 16
+
+The old `def` handlers called `db.query()` on an AsyncSession and could not
+run at all, so "orm" is their logic written the way the other async
+handlers do it: add/commit/refresh, SELECT + setattr + commit + refresh, and
+SELECT + delete + commit. "service" is lead_service/task_service, which use
+single INSERT/UPDATE/DELETE ... RETURNING statements. Every worker uses its
+own session; queries per cycle come from the query_stats hooks.
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy.future import select
+
+from app import models, schemas, services
+from app.core.database import AsyncSessionLocal, engine
+from app.core.query_stats import RequestQueryStats, current_stats
+
+
+async def orm_lead_cycle(db, owner_id: int, n: int):
+    lead = models.Lead(name=f"Bench lead {n}", status="new", owner_id=owner_id)
+    db.add(lead)
+    await db.commit()
+    await db.refresh(lead)
+
+    result = await db.execute(select(models.Lead).where(
+        models.Lead.id == lead.id, models.Lead.owner_id == owner_id))
+    lead = result.scalar()
+    lead.status = "contacted"
+    lead.notes = "called"
+    await db.commit()
+    await db.refresh(lead)
+
+    result = await db.execute(select(models.Lead).where(
+        models.Lead.id == lead.id, models.Lead.owner_id == owner_id))
+    await db.delete(result.scalar())
+    await db.commit()
+
+
+async def service_lead_cycle(db, owner_id: int, n: int):
+    lead = await services.lead_service.create_lead(
+        db, owner_id, schemas.LeadCreate(name=f"Bench lead {n}"))
+    await services.lead_service.update_lead(
+        db, owner_id, lead.id, schemas.LeadUpdate(name=lead.name, status="contacted",
+                                                  notes="called"))
+    await services.lead_service.delete_lead(db, owner_id, lead.id)
+
+
+async def orm_task_cycle(db, owner_id: int, n: int):
+    task = models.Task(head=f"Bench task {n}", status="todo", team_id=1,
+                       assigned_to=owner_id, owner_id=owner_id)
+    db.add(task)
+    await db.commit()
+    await db.refresh(task)
+
+    result = await db.execute(select(models.Task).where(
+        models.Task.id == task.id, models.Task.owner_id == owner_id))
+    task = result.scalar()
+    task.status = "completed"
+    await db.commit()
+    await db.refresh(task)
+
+    result = await db.execute(select(models.Task).where(
+        models.Task.id == task.id, models.Task.owner_id == owner_id))
+    await db.delete(result.scalar())
+    await db.commit()
+
+
+async def service_task_cycle(db, owner_id: int, n: int):
+    task = await services.task_service.create_task(
+        db, owner_id, schemas.TaskCreate(head=f"Bench task {n}", team_id=1,
+                                         assigned_to=owner_id))
+    await services.task_service.update_task(
+        db, owner_id, task.id, schemas.TaskUpdate(head=task.head, status="completed"))
+    await services.task_service.delete_task(db, owner_id, task.id)
+
+
+CYCLES = {
+    "lead orm": orm_lead_cycle,
+    "lead service": service_lead_cycle,
+    "task orm": orm_task_cycle,
+    "task service": service_task_cycle,
+}
+
+
+async def measure(cycle, owner_id: int, ops: int, concurrency: int):
+    stats = RequestQueryStats()
+    current_stats.set(stats)
+    counter = iter(range(ops))
+
+    async def worker():
+        async with AsyncSessionLocal() as db:
+            for n in counter:
+                await cycle(db, owner_id, n)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, stats
+
+
+async def run(owner_id: int, ops: int, concurrency: int):
+    print(f"{ops} create/update/delete cycles, concurrency {concurrency}")
+    print(f"{'path':<14}{'cycles/s':>10}{'queries/cycle':>15}{'db ms/cycle':>13}")
+    for name, cycle in CYCLES.items():
+        elapsed, stats = await measure(cycle, owner_id, ops, concurrency)
+        print(f"{name:<14}{ops / elapsed:>10.1f}{stats.count / ops:>15.1f}"
+              f"{stats.seconds * 1000 / ops:>13.2f}")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--owner-id", type=int, required=True)
+    parser.add_argument("--ops", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(run(args.owner_id, args.ops, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""CRUD latency during a login flood, with and without auth admission control.
+
+Run from backend/ against a seeded database (python -m app.core.seed) and a
+verified user whose requests stand for normal traffic:
+
+    python -m bench.bench_login_flood --email a@b.c --password secret
+    python -m bench.bench_login_flood ... --attack-ips 1       # one noisy client
+    python -m bench.bench_login_flood ... --base-url http://127.0.0.1:8000
+
+Without --base-url a uvicorn server is started twice, with
+AUTH_RATE_LIMIT_ENABLED on and off, trusting X-Forwarded-For so attackers
+can spread over --attack-ips addresses. Each server gets a baseline phase
+(--crud-rate requests per second of /me, contact lists and contact
+create, an open loop timed from when each request was due) and a flood
+phase (the same plus --attackers loops posting wrong passwords for seeded
+users' emails, from a separate process at the lowest CPU priority, so the
+attackers' own work is not charged to the server; CRUD is measured once the
+flood has run for two seconds). Reported per phase: CRUD throughput and
+p50/p95/p99, login attempts per second and their statuses (400 = bcrypt
+ran, 429/503 = turned away before hashing). Driver and server share the
+machine, so use the same one for runs that are compared.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+from collections import Counter
+from typing import Optional
+
+import httpx
+from sqlalchemy import text
+
+from app.core.database import engine
+from bench.driver import BenchContext, percentile
+from bench.run import contact_create, contacts_filtered, contacts_list, me
+
+CRUD = ((me, 3), (contacts_list, 4), (contacts_filtered, 2), (contact_create, 1))
+
+
+async def crud_loop(ctx: BenchContext, interval: float, deadline: float,
+                    latencies: list, statuses: Counter):
+    """One request every `interval` seconds, timed from when it was due."""
+    scenarios, weights = zip(*CRUD)
+    due = time.perf_counter() + ctx.rng.random() * interval
+    while due < deadline:
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        scenario = ctx.rng.choices(scenarios, weights)[0]
+        response = await scenario(ctx)
+        statuses[response.status_code] += 1
+        if response.status_code < 400:
+            # From the due time, so a stalled server is not hidden by
+            # the loop falling behind schedule
+            latencies.append((time.perf_counter() - due) * 1000)
+        due += interval
+
+
+async def attack_loop(client, emails: list, ips: list, rng: random.Random,
+                      deadline: float, statuses: Counter):
+    while time.perf_counter() < deadline:
+        try:
+            response = await client.post(
+                "/api/v1/general/login",
+                json={"email": rng.choice(emails), "password": "not-the-password"},
+                headers={"X-Forwarded-For": rng.choice(ips)})
+            code = response.status_code
+        except httpx.HTTPError:
+            code = 0
+        statuses[code] += 1
+        if code in (0, 429, 503):
+            # Stuffing tools do not honour Retry-After; a short pause keeps
+            # the driver from spinning on instant rejections
+            await asyncio.sleep(0.01)
+
+
+async def attack(base_url: str, emails: list, ips: list, attackers: int, duration: float) -> Counter:
+    statuses = Counter()
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*(attack_loop(client, emails, ips, random.Random(n), deadline, statuses)
+                               for n in range(attackers)))
+    return statuses
+
+
+def attack_process(base_url: str, emails: list, ips: list, attackers: int, duration: float,
+                   results: multiprocessing.Queue):
+    # The attackers' own CPU is not what is being measured: on a shared
+    # machine they only get what the server and the CRUD driver leave
+    os.nice(19)
+    results.put(dict(asyncio.run(attack(base_url, emails, ips, attackers, duration))))
+
+
+async def phase(base_url: str, ctx_args: dict, args, emails: list, flood: bool) -> dict:
+    rng = random.Random(args.seed)
+    ips = [f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}"
+           for _ in range(args.attack_ips)]
+    if flood:
+        spawn = multiprocessing.get_context("spawn")
+        results = spawn.Queue()
+        attacker = spawn.Process(target=attack_process, args=(
+            base_url, emails, ips, args.attackers, args.duration, results))
+        attacker.start()
+        # Let the flood build up before measuring
+        await asyncio.sleep(2)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        ctx = BenchContext(client=client, rng=random.Random(args.seed), **ctx_args)
+        latencies, crud_statuses = [], Counter()
+        deadline = time.perf_counter() + args.duration - (2 if flood else 0)
+        interval = args.readers / args.crud_rate
+        await asyncio.gather(*(crud_loop(ctx, interval, deadline, latencies, crud_statuses)
+                               for _ in range(args.readers)))
+
+    login_statuses = Counter()
+    if flood:
+        login_statuses.update(await asyncio.to_thread(results.get, timeout=120))
+        attacker.join()
+    return {"latencies": latencies, "crud": crud_statuses, "logins": login_statuses}
+
+
+def report(config: str, name: str, result: dict, duration: float):
+    latencies = result["latencies"]
+    logins = result["logins"]
+    crud_duration = duration - 2 if name == "flood" else duration
+    print(f"{config:<8}{name:<10}{sum(result['crud'].values()) / crud_duration:>9.0f}"
+          f"{percentile(latencies, 50):>9.1f}{percentile(latencies, 95):>9.1f}"
+          f"{percentile(latencies, 99):>9.1f}{sum(logins.values()) / duration:>10.0f}"
+          f"{logins[400] + logins[200]:>8}{logins[429]:>8}{logins[503]:>8}")
+
+
+def start_server(port: int, limits_enabled: bool) -> subprocess.Popen:
+    env = {**os.environ, "AUTH_RATE_LIMIT_ENABLED": str(limits_enabled).lower()}
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--proxy-headers", "--forwarded-allow-ips", "*", "--log-level", "warning"],
+        env=env)
+
+
+async def wait_ready(base_url: str):
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(100):
+            try:
+                if (await client.get("/")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise SystemExit(f"server at {base_url} did not start")
+
+
+async def victim_emails(limit: int) -> list:
+    async with engine.connect() as conn:
+        result = await conn.execute(text("SELECT email FROM users ORDER BY id LIMIT :n"), {"n": limit})
+        emails = [row[0] for row in result]
+    await engine.dispose()
+    return emails
+
+
+async def run_config(config: str, base_url: str, args, emails: list):
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        response = await client.post(
+            "/api/v1/general/login", json={"email": args.email, "password": args.password})
+        response.raise_for_status()
+    ctx_args = {"headers": {"Authorization": f"Bearer {response.json()['access_token']}"},
+                "admin_headers": None, "email": args.email, "password": args.password}
+    for name, flood in (("baseline", False), ("flood", True)):
+        report(config, name, await phase(base_url, ctx_args, args, emails, flood), args.duration)
+
+
+async def run(args):
+    emails = await victim_emails(args.victims)
+    print(f"{'limits':<8}{'phase':<10}{'crud/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'login/s':>10}{'hashed':>8}{'429':>8}{'503':>8}")
+    if args.base_url:
+        await run_config("server", args.base_url, args, emails)
+        return
+    base_url = f"http://127.0.0.1:{args.port}"
+    for limits_enabled in (True, False):
+        server: Optional[subprocess.Popen] = start_server(args.port, limits_enabled)
+        try:
+            await wait_ready(base_url)
+            await run_config("on" if limits_enabled else "off", base_url, args, emails)
+        finally:
+            server.send_signal(signal.SIGINT)
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--base-url", default=None, help="a running server; else uvicorn is started")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--crud-rate", type=float, default=50,
+                        help="CRUD requests per second, kept below what the server sustains")
+    parser.add_argument("--readers", type=int, default=16, help="CRUD loops sharing --crud-rate")
+    parser.add_argument("--attackers", type=int, default=64, help="concurrent login loops")
+    parser.add_argument("--attack-ips", type=int, default=256)
+    parser.add_argument("--victims", type=int, default=500, help="seeded emails to target")
+    parser.add_argument("--duration", type=float, default=15.0, help="seconds per phase")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
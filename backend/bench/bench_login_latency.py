@@ -0,0 +1,87 @@
+"""Measure GET /me latency while a burst of logins hashes passwords.
+
+Run from backend/ against a database holding a verified user:
+
+    python -m bench.bench_login_latency --email a@b.c --password secret
+    PASSWORD_HASH_POOL=inline python -m bench.bench_login_latency ...
+
+The second form hashes on the event loop (the old behaviour) for comparison.
+Every login comes from one client and one email, so set
+AUTH_RATE_LIMIT_ENABLED=false to measure the hashing pool rather than the
+login admission limits (see bench/bench_login_flood.py for those).
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.core.hashing import password_hasher
+from app.main import create_app
+from bench.driver import percentile
+
+
+async def login_loop(client, email, password, deadline, results):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.post(
+            "/api/v1/general/login", json={"email": email, "password": password})
+        results.append((response.status_code, time.perf_counter() - start))
+
+
+async def me_loop(client, token, deadline, results):
+    headers = {"Authorization": f"Bearer {token}"}
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.get("/api/v1/general/me", headers=headers)
+        results.append((response.status_code, time.perf_counter() - start))
+
+
+def report(name: str, results: list, duration: float):
+    latencies = [elapsed * 1000 for code, elapsed in results if code < 500]
+    rejected = sum(1 for code, _ in results if code == 503)
+    print(f"{name:>6}: {len(results) / duration:8.1f} req/s  "
+          f"p50 {percentile(latencies, 50):7.2f} ms  "
+          f"p95 {percentile(latencies, 95):7.2f} ms  "
+          f"p99 {percentile(latencies, 99):7.2f} ms  "
+          f"503s {rejected}")
+
+
+async def run(email: str, password: str, logins: int, readers: int, duration: float):
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+        response = await client.post(
+            "/api/v1/general/login", json={"email": email, "password": password})
+        response.raise_for_status()
+        token = response.json()["access_token"]
+
+        login_results, me_results = [], []
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(
+            *(login_loop(client, email, password, deadline, login_results)
+              for _ in range(logins)),
+            *(me_loop(client, token, deadline, me_results) for _ in range(readers)),
+        )
+
+    print(f"hash pool: {password_hasher.stats()}")
+    report("login", login_results, duration)
+    report("me", me_results, duration)
+    if me_results:
+        print(f"me mean {statistics.mean(e for _, e in me_results) * 1000:.2f} ms")
+    password_hasher.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=32, help="concurrent login loops")
+    parser.add_argument("--readers", type=int, default=8, help="concurrent GET /me loops")
+    parser.add_argument("--duration", type=float, default=10.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.email, args.password, args.logins, args.readers, args.duration))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Measure the per-request cost of MetricsMiddleware.
+
+Run from backend/ (no database needed):
+
+    python -m bench.bench_metrics_overhead --requests 200000
+
+Calls a minimal ASGI app directly, with and without the middleware in
+front of it, and reports the difference per request. The route object is
+put in the scope the way FastAPI's router does, so label lookup is the
+same as in the real app.
+"""
+import argparse
+import asyncio
+import time
+
+from app.core.middleware import MetricsMiddleware
+
+
+class FakeRoute:
+    path = "/api/v1/contacts"
+
+
+async def endpoint(scope, receive, send):
+    scope["route"] = FakeRoute
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b'{"total":0,"items":[]}'})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def measure(app, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        scope = {"type": "http", "method": "GET", "path": "/api/v1/contacts"}
+        await app(scope, receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+async def run(requests: int, rounds: int):
+    wrapped = MetricsMiddleware(endpoint)
+    bare, instrumented = [], []
+    for _ in range(rounds):
+        bare.append(await measure(endpoint, requests))
+        instrumented.append(await measure(wrapped, requests))
+    base, with_metrics = min(bare), min(instrumented)
+    print(f"bare endpoint   {base * 1e6:6.2f} us/request")
+    print(f"with middleware {with_metrics * 1e6:6.2f} us/request")
+    print(f"overhead        {(with_metrics - base) * 1e6:6.2f} us/request")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
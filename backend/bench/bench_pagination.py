@@ -0,0 +1,91 @@
+"""Compare OFFSET and keyset (cursor) paging of contacts at increasing depth.
+
+Run from backend/ against a seeded database:
+
+    python -m bench.bench_pagination --owner-id 1 --limit 50
+
+For each page depth the script times fetching that page with OFFSET and with
+the keyset predicate used by GET /api/v1/contacts?cursor=...
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import func
+from sqlalchemy.future import select
+
+from app import models
+from app.core.database import AsyncSessionLocal, engine
+from app.utils.pagination import apply_keyset, apply_sort
+
+DEPTHS = (10, 1_000, 100_000)
+
+
+def base_query(owner_id: int):
+    return select(models.Contact).where(models.Contact.owner_id == owner_id)
+
+
+async def time_query(db, query, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await db.execute(query)
+        result.scalars().all()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+async def run(owner_id: int, limit: int, sort_by: str, sort_order: str, repeat: int):
+    sort_column = getattr(models.Contact, sort_by)
+    id_column = models.Contact.id
+
+    async with AsyncSessionLocal() as db:
+        total = (await db.execute(
+            select(func.count()).select_from(base_query(owner_id).subquery())
+        )).scalar()
+        print(f"owner {owner_id}: {total} contacts, limit {limit}, "
+              f"sort {sort_by} {sort_order}")
+        print(f"{'page':>8} {'offset ms':>12} {'keyset ms':>12}")
+
+        for depth in DEPTHS:
+            skip = depth * limit
+            if skip >= total:
+                print(f"{depth:>8} {'-':>12} {'-':>12}  (beyond last page)")
+                continue
+
+            offset_query = apply_sort(base_query(owner_id), sort_column,
+                                      id_column, sort_order)
+            offset_ms = await time_query(
+                db, offset_query.offset(skip).limit(limit), repeat)
+
+            # Position the cursor on the row just before the page (untimed)
+            boundary = (await db.execute(
+                offset_query.offset(skip - 1).limit(1)
+            )).scalars().first()
+            keyset_query = apply_keyset(
+                base_query(owner_id), sort_column, id_column, sort_order,
+                getattr(boundary, sort_by), boundary.id)
+            keyset_query = apply_sort(keyset_query, sort_column, id_column,
+                                      sort_order).limit(limit)
+            keyset_ms = await time_query(db, keyset_query, repeat)
+
+            print(f"{depth:>8} {offset_ms:>12.2f} {keyset_ms:>12.2f}")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--owner-id", type=int, required=True)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--sort-by", default="id")
+    parser.add_argument("--sort-order", default="asc", choices=["asc", "desc"])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.owner_id, args.limit, args.sort_by,
+                    args.sort_order, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
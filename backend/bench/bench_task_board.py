@@ -0,0 +1,75 @@
+"""Kanban board: four list_tasks calls vs task_service.get_board.
+
+Run from backend/ against a seeded database (python -m app.core.seed):
+
+    python -m bench.bench_task_board --owner-id 1 --per-column 20 --repeat 50
+
+"four lists" is what a client does with the list endpoint: one page of
+--per-column newest tasks per TaskStatus, each with its COUNT. "board" is
+the single LATERAL query behind GET /tasks/board. Queries per load come
+from the query_stats hooks; the plan of the board query is printed once.
+"""
+import argparse
+import asyncio
+import time
+
+from app import schemas, services
+from app.core.database import AsyncSessionLocal, engine
+from app.core.query_stats import RequestQueryStats, current_stats
+from app.services.count_service import CountMode
+from app.utils.sql import explain, walk_plan
+
+
+async def four_lists(db, owner_id: int, per_column: int, count_mode: CountMode):
+    for status in schemas.TaskStatus:
+        await services.task_service.list_tasks(
+            db, owner_id, limit=per_column, sort_by="created_at", sort_order="desc",
+            count_mode=count_mode, status=status.value)
+
+
+async def board(db, owner_id: int, per_column: int, count_mode: CountMode):
+    await services.task_service.get_board(db, owner_id, per_column, count_mode)
+
+
+async def timed(label: str, repeat: int, work):
+    stats = RequestQueryStats()
+    async with AsyncSessionLocal() as db:
+        await work(db)
+        current_stats.set(stats)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await work(db)
+        elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<22}{elapsed * 1000:>10.2f}{stats.count / repeat:>10.1f}")
+
+
+async def show_plan(owner_id: int, per_column: int):
+    async with AsyncSessionLocal() as db:
+        plan = await explain(db, services.task_service.board_query(owner_id, per_column),
+                             analyze=True)
+    indexes = sorted({node["Index Name"] for node in walk_plan(plan) if "Index Name" in node})
+    print(f"board plan: {plan['Execution Time']:.2f} ms, indexes {', '.join(indexes) or 'none'}")
+
+
+async def run(owner_id: int, per_column: int, repeat: int):
+    print(f"{'path':<22}{'ms/load':>10}{'queries':>10}")
+    for mode in (CountMode.exact, CountMode.capped):
+        await timed(f"four lists ({mode.value})", repeat,
+                    lambda db: four_lists(db, owner_id, per_column, mode))
+        await timed(f"board ({mode.value})", repeat,
+                    lambda db: board(db, owner_id, per_column, mode))
+    await show_plan(owner_id, per_column)
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--owner-id", type=int, required=True)
+    parser.add_argument("--per-column", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.owner_id, args.per_column, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
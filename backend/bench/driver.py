@@ -0,0 +1,131 @@
+"""Fixed-concurrency HTTP load driver shared by the bench scripts."""
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+@dataclass
+class BenchContext:
+    """State shared by the workers of one run (tokens, created ids, RNG)."""
+    client: httpx.AsyncClient
+    headers: Dict[str, str]
+    admin_headers: Optional[Dict[str, str]]
+    email: str
+    password: str
+    rng: random.Random
+    contact_ids: List[int] = field(default_factory=list)
+    search_terms: List[str] = field(default_factory=list)
+
+
+# A scenario issues one request and returns its response
+Scenario = Callable[[BenchContext], Awaitable[httpx.Response]]
+
+
+@dataclass
+class Samples:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+
+
+async def _worker(ctx: BenchContext, scenarios: List[Tuple[str, Scenario]],
+                  weights: List[float], deadline: float, record: bool,
+                  samples: Dict[str, Samples]):
+    while time.perf_counter() < deadline:
+        name, scenario = ctx.rng.choices(scenarios, weights)[0]
+        start = time.perf_counter()
+        try:
+            response = await scenario(ctx)
+            code = response.status_code
+        except httpx.HTTPError:
+            code = 0
+        elapsed = time.perf_counter() - start
+        if not record:
+            continue
+        bucket = samples.setdefault(name, Samples())
+        bucket.statuses[code] = bucket.statuses.get(code, 0) + 1
+        if code == 0 or code >= 400:
+            bucket.errors += 1
+        else:
+            bucket.latencies.append(elapsed)
+
+
+async def drive(ctx: BenchContext, mix: Dict[str, Tuple[Scenario, float]],
+                concurrency: int, duration: float, warmup: float = 0.0) -> dict:
+    """Run `concurrency` closed-loop workers over a weighted mix.
+
+    Each worker picks a scenario by weight, waits for the response and picks
+    the next one. Requests made during `warmup` are not recorded.
+    """
+    scenarios = [(name, scenario) for name, (scenario, _) in mix.items()]
+    weights = [weight for _, weight in mix.values()]
+    samples: Dict[str, Samples] = {}
+
+    if warmup:
+        deadline = time.perf_counter() + warmup
+        await asyncio.gather(*(_worker(ctx, scenarios, weights, deadline, False, samples)
+                               for _ in range(concurrency)))
+
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(_worker(ctx, scenarios, weights, deadline, True, samples)
+                           for _ in range(concurrency)))
+    return summarize(samples, time.perf_counter() - started)
+
+
+def summarize(samples: Dict[str, Samples], elapsed: float) -> dict:
+    routes = {}
+    for name, bucket in sorted(samples.items()):
+        latencies = [value * 1000 for value in bucket.latencies]
+        requests = len(latencies) + bucket.errors
+        routes[name] = {
+            "requests": requests,
+            "errors": bucket.errors,
+            "error_rate": bucket.errors / requests if requests else 0.0,
+            "throughput": requests / elapsed,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": max(latencies, default=0.0),
+            "statuses": {str(code): count for code, count in sorted(bucket.statuses.items())},
+        }
+    return {"elapsed_s": elapsed, "routes": routes}
+
+
+def compare(baseline: dict, current: dict, max_latency_regression: float,
+            max_throughput_drop: float, max_error_increase: float) -> List[str]:
+    """Regressions of `current` against `baseline` for routes present in both."""
+    problems = []
+    for mix, result in current["mixes"].items():
+        base_mix = baseline.get("mixes", {}).get(mix)
+        if base_mix is None:
+            continue
+        for route, stats in result["routes"].items():
+            base = base_mix["routes"].get(route)
+            if base is None:
+                continue
+            label = f"{mix}/{route}"
+            for key in ("p95_ms", "p99_ms"):
+                if base[key] and stats[key] > base[key] * (1 + max_latency_regression):
+                    problems.append(
+                        f"{label}: {key} {base[key]:.2f} -> {stats[key]:.2f}")
+            if base["throughput"] and \
+                    stats["throughput"] < base["throughput"] * (1 - max_throughput_drop):
+                problems.append(f"{label}: throughput {base['throughput']:.1f} -> "
+                                f"{stats['throughput']:.1f} req/s")
+            if stats["error_rate"] > base["error_rate"] + max_error_increase:
+                problems.append(f"{label}: error rate {base['error_rate']:.2%} -> "
+                                f"{stats['error_rate']:.2%}")
+    return problems
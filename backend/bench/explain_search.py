@@ -0,0 +1,113 @@
+"""Check that contact/lead search plans use the trigram GIN indexes.
+
+Run from backend/ against a seeded database (exits non-zero on failure):
+
+    python -m bench.explain_search --owner-id 1 --q "jon"
+
+On a nearly empty database the planner rightly prefers a sequential scan;
+pass --no-seqscan there to check that the index is at least usable.
+
+Also counts the matches for contacts, leads and tasks at rising
+min_similarity values: a count that grows, or a match scoring below the
+threshold it was returned for, fails.
+"""
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import func, text
+from sqlalchemy.future import select
+
+from app import models
+from app.core.database import AsyncSessionLocal, engine
+from app.services import search_service
+from app.utils.sql import explain, walk_plan
+
+SHAPES = [
+    ("contacts", "idx_contacts_name_email_trgm",
+     search_service.contact_search_query, {}),
+    ("contacts", "idx_contacts_name_email_trgm",
+     search_service.contact_search_query, {"status": "new", "source": "ad"}),
+    ("leads", "idx_leads_name_notes_trgm",
+     search_service.lead_search_query, {}),
+    ("leads", "idx_leads_name_notes_trgm",
+     search_service.lead_search_query, {"status": "qualified"}),
+]
+
+# resource -> (query builder, searched columns)
+THRESHOLD_TARGETS = {
+    "contacts": (search_service.contact_search_query, [models.Contact.name, models.Contact.email]),
+    "leads": (search_service.lead_search_query, [models.Lead.name, models.Lead.notes]),
+    "tasks": (search_service.task_search_query, [models.Task.head]),
+}
+THRESHOLDS = (0.3, 0.6, 0.9)
+
+
+def check_plan(plan: dict, table: str, index: str) -> list[str]:
+    problems = []
+    nodes = list(walk_plan(plan))
+    if not any(node.get("Index Name") == index for node in nodes):
+        problems.append(f"{index} not used")
+    for node in nodes:
+        if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") == table:
+            problems.append(f"sequential scan on {table}")
+    return problems
+
+
+async def run(owner_id: int, q: str, no_seqscan: bool) -> int:
+    failures = 0
+    async with AsyncSessionLocal() as db:
+        await search_service.set_similarity_threshold(db, None)
+        if no_seqscan:
+            await db.execute(text("SET LOCAL enable_seqscan = off"))
+
+        for table, index, build, filters in SHAPES:
+            query = build(owner_id, q, **filters)
+            shapes = {
+                "count": select(func.count()).select_from(query.subquery()),
+                "page": query.limit(10),
+            }
+            for name, stmt in shapes.items():
+                plan = await explain(db, stmt)
+                problems = check_plan(plan, table, index)
+                status = "ok" if not problems else "FAIL: " + ", ".join(problems)
+                print(f"{table:<9} {name:<6} {filters!s:<40} {status}")
+                failures += bool(problems)
+        await db.rollback()
+
+        for resource, (build, columns) in THRESHOLD_TARGETS.items():
+            rank = search_service.trigram_rank(columns, q).label("rank")
+            counts = []
+            for threshold in THRESHOLDS:
+                await search_service.set_similarity_threshold(db, threshold)
+                matches = build(owner_id, q).add_columns(rank).subquery()
+                result = await db.execute(
+                    select(func.count(), func.min(matches.c.rank)).select_from(matches))
+                count, lowest = result.one()
+                problems = []
+                if counts and count > counts[-1]:
+                    problems.append(f"more rows than at {THRESHOLDS[len(counts) - 1]}")
+                if lowest is not None and lowest < threshold:
+                    problems.append(f"a match scores {lowest:.2f}")
+                counts.append(count)
+                status = "ok" if not problems else "FAIL: " + ", ".join(problems)
+                print(f"{resource:<9} min_similarity={threshold:<4} {count:>8} rows  {status}")
+                failures += bool(problems)
+            await db.rollback()
+
+    await engine.dispose()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--owner-id", type=int, required=True)
+    parser.add_argument("--q", default="smith")
+    parser.add_argument("--no-seqscan", action="store_true")
+    args = parser.parse_args()
+    failures = asyncio.run(run(args.owner_id, args.q, args.no_seqscan))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
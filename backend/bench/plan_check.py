@@ -0,0 +1,169 @@
+"""Plan regression check for the owner-scoped queries the routes generate.
+
+Run from backend/ against a seeded database (exits non-zero on failure):
+
+    python -m app.core.seed --profile 1m && python -m bench.plan_check --owner-id 7
+
+Each list shape (every filter alone, every sort field, a keyset page), its
+COUNT, the export and bulk-filter scans, a full-text match, the task board
+and the dashboard read is run under EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON).
+A shape fails when its plan has a sequential scan on contacts, leads, tasks
+or pipeline_counters, or a sort that spilled to disk. Filter values come from
+the owner's newest rows so every filter matches something.
+
+Pick an ordinary owner: for a whale owning most of a table a sequential
+scan is the right plan for an unfiltered COUNT, and on a nearly empty
+database the planner rightly prefers sequential scans everywhere.
+"""
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.future import select
+
+from app import models, services
+from app.api.v1.contact_routes import CONTACT_SORT_FIELDS
+from app.api.v1.lead_routes import LEAD_SORT_FIELDS
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, engine
+from app.services.search_service import (
+    contact_filters, fulltext_query, lead_filters, task_filters)
+from app.services.task_service import TASK_SORT_FIELDS
+from app.utils.pagination import apply_keyset, apply_sort
+from app.utils.serialization import CONTACT_ROWS, LEAD_ROWS, TASK_ROWS
+from app.utils.sql import explain, walk_plan
+
+WATCHED_TABLES = {"contacts", "leads", "tasks", "pipeline_counters"}
+
+# resource -> (model, row serializer, filter builder, sort fields, filter columns)
+RESOURCES = {
+    "contacts": (models.Contact, CONTACT_ROWS, contact_filters, CONTACT_SORT_FIELDS,
+                 ("status", "source")),
+    "leads": (models.Lead, LEAD_ROWS, lead_filters, LEAD_SORT_FIELDS,
+              ("status", "source")),
+    "tasks": (models.Task, TASK_ROWS, task_filters, TASK_SORT_FIELDS,
+              ("status", "assigned_to", "team_id")),
+}
+
+
+def check_plan(plan: dict) -> list[str]:
+    problems = []
+    for node in walk_plan(plan):
+        if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in WATCHED_TABLES:
+            problems.append(f"sequential scan on {node['Relation Name']}")
+        if node.get("Sort Space Type") == "Disk" or "external" in node.get("Sort Method", ""):
+            problems.append(f"external sort ({node.get('Sort Method')})")
+    return problems
+
+
+async def sample_filters(db, resource: str, owner_id: int) -> dict:
+    """Filter values taken from the owner's newest row, as a client would send them."""
+    model, _, _, _, columns = RESOURCES[resource]
+    result = await db.execute(
+        select(*(getattr(model, column) for column in columns), model.created_at)
+        .where(model.owner_id == owner_id)
+        .order_by(model.id.desc())
+        .limit(1)
+    )
+    row = result.first()
+    if row is None:
+        return {}
+    filters = {column: value for column, value in zip(columns, row) if value is not None}
+    newest = row[-1]
+    if newest is not None and resource == "contacts":
+        filters["start_date"] = newest - timedelta(days=30)
+    elif newest is not None and resource == "leads":
+        filters["created_after"] = newest - timedelta(days=30)
+    return filters
+
+
+def list_shapes(resource: str, owner_id: int, samples: dict):
+    """(name, statement) for the list endpoint's page and count queries."""
+    model, rows, build_filters, sort_fields, _ = RESOURCES[resource]
+
+    filter_sets = [{}] + [{name: value} for name, value in samples.items()]
+    for filters in filter_sets:
+        label = ",".join(filters) or "-"
+        query = select(*rows.columns).where(*build_filters(owner_id, **filters))
+        yield f"{resource} count [{label}]", select(func.count()).select_from(query.subquery())
+        yield (f"{resource} count capped [{label}]",
+               select(func.count()).select_from(query.limit(settings.COUNT_CAP + 1).subquery()))
+        yield f"{resource} page [{label}]", apply_sort(query, model.id, model.id, "asc").limit(11)
+
+    base = select(*rows.columns).where(*build_filters(owner_id))
+    for sort_by in sorted(sort_fields):
+        sort_column = getattr(model, sort_by)
+        for sort_order in ("asc", "desc"):
+            yield (f"{resource} sort {sort_by} {sort_order}",
+                   apply_sort(base, sort_column, model.id, sort_order).limit(11))
+
+
+async def cursor_shape(db, resource: str, owner_id: int):
+    """A keyset page after the owner's newest row, sorted by created_at desc."""
+    model, rows, build_filters, _, _ = RESOURCES[resource]
+    result = await db.execute(
+        select(model.created_at, model.id)
+        .where(*build_filters(owner_id)).order_by(model.id.desc()).limit(1))
+    row = result.first()
+    if row is None:
+        return None
+    query = select(*rows.columns).where(*build_filters(owner_id))
+    query = apply_keyset(query, model.created_at, model.id, "desc", row[0], row[1])
+    return apply_sort(query, model.created_at, model.id, "desc").limit(11)
+
+
+def other_shapes(resource: str, owner_id: int):
+    model, _, build_filters, _, _ = RESOURCES[resource]
+    clauses = build_filters(owner_id)
+    yield f"{resource} export", select(model.id).where(*clauses).order_by(model.id)
+    yield (f"{resource} bulk filter chunk",
+           select(model.id).where(*clauses, model.id > 0)
+           .order_by(model.id).limit(settings.BULK_CHUNK_SIZE))
+    yield f"{resource} get by id", select(model).where(model.id == 1, model.owner_id == owner_id)
+    yield f"{resource} fulltext", fulltext_query(resource, owner_id, "follow up")
+
+
+async def run(owner_id: int) -> int:
+    failures = 0
+    print(f"{'shape':<46}{'ms':>9}  result")
+    async with AsyncSessionLocal() as db:
+        shapes = []
+        for resource in RESOURCES:
+            samples = await sample_filters(db, resource, owner_id)
+            shapes.extend(list_shapes(resource, owner_id, samples))
+            cursor = await cursor_shape(db, resource, owner_id)
+            if cursor is not None:
+                shapes.append((f"{resource} cursor created_at desc", cursor))
+            shapes.extend(other_shapes(resource, owner_id))
+
+        shapes.append(("tasks board", services.task_service.board_query(owner_id, 20)))
+        shapes.append(("tasks board capped",
+                       services.task_service.board_query(owner_id, 20, capped=True)))
+        shapes.append(("dashboard counters", services.pipeline_service.dashboard_query(
+            owner_id, date.today() - timedelta(days=89))))
+
+        for name, stmt in shapes:
+            plan = await explain(db, stmt, analyze=True, buffers=True)
+            problems = check_plan(plan)
+            status = "ok" if not problems else "FAIL: " + ", ".join(sorted(set(problems)))
+            print(f"{name:<46}{plan['Execution Time']:>9.2f}  {status}")
+            failures += bool(problems)
+        await db.rollback()
+
+    await engine.dispose()
+    print(f"{len(shapes)} shapes, {failures} failed")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--owner-id", type=int, required=True)
+    args = parser.parse_args()
+    failures = asyncio.run(run(args.owner_id))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
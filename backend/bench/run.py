@@ -0,0 +1,273 @@
+"""End-to-end load benchmark: weighted request mixes at fixed concurrency.
+
+Run from backend/ against a local, seeded Postgres with a verified user
+(optionally an admin for the admin mix):
+
+    python -m bench.run --email a@b.c --password secret --mix read --mix write
+    python -m bench.run ... --base-url http://127.0.0.1:8000   # running uvicorn
+    python -m bench.run ... --baseline bench/results/<commit>.json
+
+Without --base-url the app is served in-process through httpx's ASGI
+transport (startup/shutdown hooks included), which is handy for profiling
+but shares one event loop with the driver; use uvicorn for numbers that
+are compared across commits. Results are written as JSON (per mix and
+route: requests, errors, throughput, p50/p95/p99) and, with --baseline,
+compared against an earlier run; any regression beyond the thresholds
+exits with status 1. The login and mixed mixes log one user in over and
+over: run them (or the server) with AUTH_RATE_LIMIT_ENABLED=false, or
+most logins are answered 429 by the per-email limit.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from bench.driver import BenchContext, compare, drive
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+CONTACT_STATUSES = ["new", "contacted", "won", "lost"]
+CONTACT_SOURCES = ["referral", "ad", "webform"]
+CONTACT_SORTS = ["name", "company", "created_at", "status"]
+FALLBACK_TERMS = ["smith", "acme", "john", "gmail", "global"]
+
+
+async def login(ctx: BenchContext):
+    return await ctx.client.post(
+        "/api/v1/general/login", json={"email": ctx.email, "password": ctx.password})
+
+
+async def me(ctx: BenchContext):
+    return await ctx.client.get("/api/v1/general/me", headers=ctx.headers)
+
+
+async def contacts_list(ctx: BenchContext):
+    params = {"skip": ctx.rng.randrange(0, 200, 20), "limit": 20}
+    return await ctx.client.get("/api/v1/contacts", params=params, headers=ctx.headers)
+
+
+async def contacts_sorted(ctx: BenchContext):
+    params = {"limit": 50, "sort_by": ctx.rng.choice(CONTACT_SORTS),
+              "sort_order": ctx.rng.choice(["asc", "desc"])}
+    return await ctx.client.get("/api/v1/contacts", params=params, headers=ctx.headers)
+
+
+async def contacts_filtered(ctx: BenchContext):
+    params = {"limit": 20, "status": ctx.rng.choice(CONTACT_STATUSES),
+              "source": ctx.rng.choice(CONTACT_SOURCES), "sort_by": "created_at",
+              "sort_order": "desc"}
+    return await ctx.client.get("/api/v1/contacts", params=params, headers=ctx.headers)
+
+
+async def contacts_search(ctx: BenchContext):
+    params = {"q": ctx.rng.choice(ctx.search_terms), "limit": 20}
+    return await ctx.client.get("/api/v1/contacts", params=params, headers=ctx.headers)
+
+
+def _contact_body(ctx: BenchContext) -> dict:
+    n = ctx.rng.randrange(1_000_000)
+    return {
+        "name": f"Bench Contact {n}",
+        "email": f"bench{n}@example.com",
+        "company": f"Bench Co {n % 100}",
+        "status": ctx.rng.choice(CONTACT_STATUSES),
+        "source": ctx.rng.choice(CONTACT_SOURCES),
+    }
+
+
+async def contact_create(ctx: BenchContext):
+    response = await ctx.client.post(
+        "/api/v1/contacts", json=_contact_body(ctx), headers=ctx.headers)
+    if response.status_code == 200:
+        ctx.contact_ids.append(response.json()["id"])
+    return response
+
+
+async def contact_update(ctx: BenchContext):
+    if not ctx.contact_ids:
+        return await contact_create(ctx)
+    contact_id = ctx.rng.choice(ctx.contact_ids)
+    return await ctx.client.put(
+        f"/api/v1/contacts/{contact_id}", json=_contact_body(ctx), headers=ctx.headers)
+
+
+async def admin_users(ctx: BenchContext):
+    params = {"skip": ctx.rng.randrange(0, 100, 20), "limit": 20}
+    return await ctx.client.get("/api/v1/admin/users", params=params,
+                                headers=ctx.admin_headers)
+
+
+# name -> {route label: (scenario, weight)}
+MIXES = {
+    "login": {"login": (login, 1)},
+    "read": {
+        "me": (me, 3),
+        "contacts_list": (contacts_list, 4),
+        "contacts_sorted": (contacts_sorted, 2),
+        "contacts_filtered": (contacts_filtered, 2),
+        "contacts_search": (contacts_search, 2),
+    },
+    "write": {
+        "contact_create": (contact_create, 1),
+        "contact_update": (contact_update, 2),
+    },
+    "admin": {"admin_users": (admin_users, 1)},
+    "mixed": {
+        "login": (login, 1),
+        "me": (me, 4),
+        "contacts_list": (contacts_list, 6),
+        "contacts_sorted": (contacts_sorted, 3),
+        "contacts_filtered": (contacts_filtered, 3),
+        "contacts_search": (contacts_search, 3),
+        "contact_create": (contact_create, 1),
+        "contact_update": (contact_update, 1),
+        "admin_users": (admin_users, 1),
+    },
+}
+
+
+async def _token(client: httpx.AsyncClient, email: str, password: str) -> dict:
+    response = await client.post(
+        "/api/v1/general/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _prepare(client, args) -> BenchContext:
+    headers = await _token(client, args.email, args.password)
+    admin_headers = None
+    if args.admin_email:
+        admin_headers = await _token(client, args.admin_email, args.admin_password)
+
+    ctx = BenchContext(client=client, headers=headers, admin_headers=admin_headers,
+                       email=args.email, password=args.password,
+                       rng=random.Random(args.seed))
+
+    # Search for words that exist in this user's data, and update real rows
+    response = await client.get("/api/v1/contacts", params={"limit": 100}, headers=headers)
+    response.raise_for_status()
+    items = response.json()["items"]
+    ctx.contact_ids = [item["id"] for item in items]
+    terms = {word.lower() for item in items for word in item["name"].split() if len(word) > 3}
+    ctx.search_terms = sorted(terms) or FALLBACK_TERMS
+    return ctx
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True,
+            stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print(mix: str, result: dict):
+    print(f"\n[{mix}] {result['elapsed_s']:.1f}s")
+    print(f"{'route':<20}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}")
+    for route, stats in result["routes"].items():
+        print(f"{route:<20}{stats['throughput']:>9.1f}{stats['p50_ms']:>9.2f}"
+              f"{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}{stats['errors']:>8}")
+
+
+@contextlib.asynccontextmanager
+async def _client(base_url: Optional[str]):
+    if base_url:
+        async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+            yield client
+        return
+
+    from app.main import app
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench",
+                                     timeout=30) as client:
+            yield client
+
+
+async def run(args) -> dict:
+    mixes = args.mix or ["read", "write"]
+    if "admin" in mixes and not args.admin_email:
+        raise SystemExit("--admin-email/--admin-password are required for the admin mix")
+
+    results = {}
+    async with _client(args.base_url) as client:
+        ctx = await _prepare(client, args)
+        for mix in mixes:
+            scenarios = dict(MIXES[mix])
+            if ctx.admin_headers is None:
+                scenarios.pop("admin_users", None)
+            results[mix] = await drive(ctx, scenarios, args.concurrency,
+                                       args.duration, args.warmup)
+            _print(mix, results[mix])
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "target": args.base_url or "in-process",
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "seed": args.seed,
+            "python": platform.python_version(),
+        },
+        "mixes": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--admin-email")
+    parser.add_argument("--admin-password")
+    parser.add_argument("--mix", action="append", choices=sorted(MIXES),
+                        help="repeatable; default read and write")
+    parser.add_argument("--base-url", help="benchmark a running server instead of in-process")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path,
+                        help="results file; default bench/results/<commit>-<time>.json")
+    parser.add_argument("--baseline", type=Path, help="earlier results file to compare with")
+    parser.add_argument("--max-latency-regression", type=float, default=0.20,
+                        help="allowed relative p95/p99 increase")
+    parser.add_argument("--max-throughput-drop", type=float, default=0.15)
+    parser.add_argument("--max-error-increase", type=float, default=0.01,
+                        help="allowed absolute error-rate increase")
+    args = parser.parse_args()
+
+    current = asyncio.run(run(args))
+
+    output = args.output or RESULTS_DIR / (
+        f"{current['meta']['commit'] or 'unknown'}-{int(time.time())}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(current, indent=2))
+    print(f"\nresults written to {output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        problems = compare(baseline, current, args.max_latency_regression,
+                           args.max_throughput_drop, args.max_error_increase)
+        print(f"compared with {args.baseline} ({baseline['meta'].get('commit')})")
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        if problems:
+            sys.exit(1)
+        print("no regressions")
+
+
+if __name__ == "__main__":
+    main()